@@ -1,9 +1,11 @@
+from django.http import HttpResponse
 from drf_spectacular.utils import extend_schema
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from djresttoolkit.cache.mixins import IdempotencyMixin
 from djresttoolkit.pagination import PaginatedDataBuilder
 from djresttoolkit.views.mixins import RetrieveObjectMixin
 
@@ -11,7 +13,7 @@ from .models import Todo
 from .serializers import TodoSerializer
 
 
-class TodoListView(APIView):
+class TodoListView(IdempotencyMixin, APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request: Request) -> Response:
@@ -48,7 +50,11 @@ class TodoDetailView(RetrieveObjectMixin[Todo], APIView):
     @extend_schema(
         responses=TodoSerializer,
     )
-    def get(self, request: Request, id: int) -> Response:
+    def get(self, request: Request, id: int) -> Response | HttpResponse:
+        not_modified = self.get_not_modified_response(request, id=id)
+        if not_modified is not None:
+            return not_modified
+
         todo = self.get_object(id=id)
         serializer = TodoSerializer(instance=todo, many=False)
-        return Response(data=serializer.data)
+        return self.set_validator_headers(Response(data=serializer.data), todo)
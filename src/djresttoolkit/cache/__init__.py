@@ -0,0 +1,80 @@
+from ._cache_entry import CacheEntry
+from ._cache_lock import CacheLock
+from ._cdn import CdnPurger, RecordingCdnPurger
+from ._circuit_breaker import (
+    CacheCircuitBreaker,
+    GuardedCache,
+    cache_circuit_breaker,
+)
+from ._compression import Compressor, register_compressor
+from ._executors import get_default_executor
+from ._invalidation import (
+    batch_cache_invalidation,
+    invalidate_keys,
+    new_cache_generation,
+)
+from ._invalidation_registry import (
+    CacheDependency,
+    CacheInvalidationRegistry,
+    cache_invalidation_registry,
+)
+from ._local_cache import LocalCache
+from ._metrics import CacheMetrics, cache_metrics
+from ._not_found import (
+    CachedNotFound,
+    cache_not_found,
+    connect_not_found_signals,
+    is_cached_not_found,
+)
+from ._prefetch import (
+    clone_request_with_query,
+    get_next_page_query,
+    submit_prefetch,
+)
+from ._purge import (
+    PURGE_FAMILIES,
+    can_scan_cache,
+    get_purge_patterns,
+    purge_cache,
+)
+from ._redis import get_redis_client
+from ._router import CacheRouter, HashRing
+from ._tag_index import CacheTagIndex, cache_tag_index
+
+__all__ = [
+    "PURGE_FAMILIES",
+    "CacheCircuitBreaker",
+    "CacheDependency",
+    "CacheEntry",
+    "CacheInvalidationRegistry",
+    "CacheLock",
+    "CachedNotFound",
+    "CdnPurger",
+    "CacheMetrics",
+    "CacheRouter",
+    "CacheTagIndex",
+    "Compressor",
+    "GuardedCache",
+    "HashRing",
+    "LocalCache",
+    "RecordingCdnPurger",
+    "batch_cache_invalidation",
+    "cache_circuit_breaker",
+    "cache_invalidation_registry",
+    "cache_metrics",
+    "cache_not_found",
+    "cache_tag_index",
+    "can_scan_cache",
+    "clone_request_with_query",
+    "connect_not_found_signals",
+    "get_default_executor",
+    "get_next_page_query",
+    "get_purge_patterns",
+    "get_redis_client",
+    "invalidate_keys",
+    "is_cached_not_found",
+    "new_cache_generation",
+    "purge_cache",
+    "register_compressor",
+    "submit_prefetch",
+]
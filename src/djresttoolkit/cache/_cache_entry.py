@@ -0,0 +1,25 @@
+import time
+from typing import Any, NamedTuple
+
+
+class CacheEntry(NamedTuple):
+    """
+    Envelope stored by the cache mixins around every cached value.
+
+    `stale_at` is the soft expiry: once it has passed the value is still
+    served, but a background refresh is scheduled. The hard expiry is the
+    timeout the entry was stored with in the cache backend. `etag` and
+    `last_modified` are the validators used to answer conditional GETs.
+    `tags` are the tag versions the value was stored with, see
+    `CacheTagIndex.stamp()`.
+    """
+
+    value: Any
+    stale_at: float | None = None
+    etag: str | None = None
+    last_modified: int | None = None
+    tags: dict[str, int] | None = None
+
+    def is_stale(self) -> bool:
+        """Return True once the soft expiry has passed."""
+        return self.stale_at is not None and time.time() >= self.stale_at
@@ -0,0 +1,76 @@
+import logging
+import threading
+from typing import Sequence
+
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+
+class CdnPurger:
+    """
+    Purges CDN edge caches by surrogate key.
+
+    The base class does nothing. Subclass it and implement `purge()` with
+    the CDN's API (e.g. Fastly "purge by surrogate key").
+
+    Example:
+    ```
+        class FastlyPurger(CdnPurger):
+            def purge(self, keys):
+                requests.post(
+                    f"https://api.fastly.com/service/{SERVICE_ID}/purge",
+                    headers={"Fastly-Key": TOKEN, "Surrogate-Key": " ".join(keys)},
+                    timeout=5,
+                )
+
+        class TodoViewSet(CacheInvalidateMixin, ModelViewSet):
+            cache_cdn_purger = FastlyPurger()
+    ```
+    """
+
+    def purge(self, keys: Sequence[str]) -> None:
+        """Invalidate every edge object tagged with one of `keys`."""
+        return None
+
+    def purge_on_commit(
+        self,
+        keys: Sequence[str],
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        """Call `purge()` once the current transaction commits."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+
+        def purge() -> None:
+            try:
+                self.purge(keys)
+            except Exception:
+                # The write is committed already, edges expire on their own.
+                logger.exception(f"CDN purge of {keys} failed.")
+
+        transaction.on_commit(purge, using=using)
+
+
+class RecordingCdnPurger(CdnPurger):
+    """Records purged keys instead of calling a CDN, for tests."""
+
+    def __init__(self) -> None:
+        self.purged: list[list[str]] = []
+        self._lock = threading.Lock()
+
+    def purge(self, keys: Sequence[str]) -> None:
+        with self._lock:
+            self.purged.append(list(keys))
+
+    @property
+    def keys(self) -> set[str]:
+        """Every key purged so far."""
+        with self._lock:
+            return {key for keys in self.purged for key in keys}
+
+    def reset(self) -> None:
+        with self._lock:
+            self.purged.clear()
@@ -0,0 +1,317 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Awaitable, Callable
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import BaseCache
+
+from ._metrics import _escape
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class _AliasState:
+    """Breaker bookkeeping of one cache alias."""
+
+    def __init__(self) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opens = 0
+        self.skipped = 0
+
+
+class CacheCircuitBreaker:
+    """
+    Circuit breaker around cache backends, one circuit per cache alias.
+
+    A call that raises or takes longer than `timeout` seconds is a failure.
+    After `failure_threshold` consecutive failures the circuit opens: calls
+    skip the backend for `reset_timeout` seconds and fall back to the
+    `fallback_alias` backend (e.g. a local locmem cache), or to a miss so
+    the caller computes the value directly. Then one trial call is let
+    through (half-open) and closes the circuit again on success.
+
+    Sync calls cannot be interrupted, so `timeout` only counts them as
+    failures; configure socket timeouts on the backend (`SOCKET_TIMEOUT`
+    for `django_redis`) to bound them. Async calls are cancelled after
+    `timeout`.
+
+    Example:
+    ```
+        class TodoViewSet(CacheInvalidateMixin, ModelViewSet):
+            cache_circuit_breaker = cache_circuit_breaker
+    ```
+    """
+
+    def __init__(
+        self,
+        timeout: float = 0.25,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        fallback_alias: str | None = None,
+    ) -> None:
+        self.timeout = timeout
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.fallback_alias = fallback_alias
+        self._states: dict[str, _AliasState] = {}
+        self._guards: dict[str, GuardedCache] = {}
+        self._lock = threading.Lock()
+
+    def guard(self, cache_alias: str = DEFAULT_CACHE_ALIAS) -> "GuardedCache":
+        """Return the backend of `cache_alias` wrapped by this breaker."""
+        guard = self._guards.get(cache_alias)
+        if guard is None:
+            guard = self._guards.setdefault(
+                cache_alias, GuardedCache(self, cache_alias)
+            )
+        return guard
+
+    def get_state(self, cache_alias: str = DEFAULT_CACHE_ALIAS) -> str:
+        return self._get_alias_state(cache_alias).state
+
+    def allow(self, cache_alias: str) -> bool:
+        """Return True when a call may go to the backend."""
+        state = self._get_alias_state(cache_alias)
+        with self._lock:
+            if state.state == CLOSED:
+                return True
+            if (
+                state.state == OPEN
+                and time.monotonic() - state.opened_at >= self.reset_timeout
+            ):
+                # Let exactly one trial call through.
+                state.state = HALF_OPEN
+                return True
+            state.skipped += 1
+            return False
+
+    def record_success(self, cache_alias: str, elapsed: float) -> None:
+        if elapsed > self.timeout:
+            self.record_failure(cache_alias)
+            return
+        state = self._get_alias_state(cache_alias)
+        with self._lock:
+            if state.state != CLOSED:
+                logger.info(f"Cache circuit of '{cache_alias}' closed.")
+            state.state = CLOSED
+            state.failures = 0
+
+    def record_failure(self, cache_alias: str) -> None:
+        state = self._get_alias_state(cache_alias)
+        with self._lock:
+            state.failures += 1
+            if state.state == HALF_OPEN or (
+                state.state == CLOSED and state.failures >= self.failure_threshold
+            ):
+                state.state = OPEN
+                state.opened_at = time.monotonic()
+                state.opens += 1
+                logger.warning(f"Cache circuit of '{cache_alias}' opened.")
+
+    def call(
+        self,
+        cache_alias: str,
+        method: str,
+        fallback: Callable[[], Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Call `method` of the backend, or `fallback` while the circuit is open."""
+        if not self.allow(cache_alias):
+            return self._call_fallback(method, fallback, *args, **kwargs)
+
+        start = time.perf_counter()
+        try:
+            result = getattr(caches[cache_alias], method)(*args, **kwargs)
+        except ValueError:
+            # `incr()` of a missing key: the backend answered.
+            self.record_success(cache_alias, time.perf_counter() - start)
+            raise
+        except Exception:
+            logger.warning(
+                f"Cache call '{method}' on '{cache_alias}' failed.", exc_info=True
+            )
+            self.record_failure(cache_alias)
+            return self._call_fallback(method, fallback, *args, **kwargs)
+        self.record_success(cache_alias, time.perf_counter() - start)
+        return result
+
+    async def acall(
+        self,
+        cache_alias: str,
+        method: str,
+        fallback: Callable[[], Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        """Async `call()`; the backend call is cancelled after `timeout`."""
+        if not self.allow(cache_alias):
+            return self._call_fallback(
+                method.removeprefix("a"), fallback, *args, **kwargs
+            )
+
+        start = time.perf_counter()
+        coroutine: Awaitable[Any] = getattr(caches[cache_alias], method)(
+            *args, **kwargs
+        )
+        try:
+            result = await asyncio.wait_for(coroutine, self.timeout)
+        except ValueError:
+            self.record_success(cache_alias, time.perf_counter() - start)
+            raise
+        except Exception:
+            logger.warning(
+                f"Cache call '{method}' on '{cache_alias}' failed.", exc_info=True
+            )
+            self.record_failure(cache_alias)
+            return self._call_fallback(
+                method.removeprefix("a"), fallback, *args, **kwargs
+            )
+        self.record_success(cache_alias, time.perf_counter() - start)
+        return result
+
+    def _call_fallback(
+        self,
+        method: str,
+        fallback: Callable[[], Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        if self.fallback_alias is None:
+            return fallback()
+        return getattr(caches[self.fallback_alias], method)(*args, **kwargs)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """State, consecutive failures, openings and skipped calls per alias."""
+        with self._lock:
+            return {
+                alias: {
+                    "state": state.state,
+                    "failures": state.failures,
+                    "opens": state.opens,
+                    "skipped": state.skipped,
+                }
+                for alias, state in self._states.items()
+            }
+
+    def to_prometheus(self, prefix: str = "djresttoolkit_cache") -> str:
+        """Render the breaker of every alias as Prometheus text."""
+        metrics = [
+            ("breaker_state", "gauge", "0 closed, 1 half-open, 2 open.", "state"),
+            ("breaker_opens_total", "counter", "Times the circuit opened.", "opens"),
+            ("breaker_skipped_total", "counter", "Calls not sent.", "skipped"),
+        ]
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for metric, kind, help_text, field in metrics:
+            metric = f"{prefix}_{metric}"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for alias, values in sorted(snapshot.items()):
+                value = values[field]
+                if field == "state":
+                    value = STATE_VALUES[value]
+                lines.append(f'{metric}{{alias="{_escape(alias)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+    def _get_alias_state(self, cache_alias: str) -> _AliasState:
+        state = self._states.get(cache_alias)
+        if state is None:
+            with self._lock:
+                state = self._states.setdefault(cache_alias, _AliasState())
+        return state
+
+
+class GuardedCache:
+    """
+    Cache backend proxy that sends the data calls through a
+    `CacheCircuitBreaker`. While the circuit is open reads miss, writes
+    are dropped and `add()` reports success, so locks do not block.
+    Other attributes are read from the backend directly.
+    """
+
+    def __init__(self, breaker: CacheCircuitBreaker, cache_alias: str) -> None:
+        self.breaker = breaker
+        self.cache_alias = cache_alias
+
+    @property
+    def backend(self) -> BaseCache:
+        return caches[self.cache_alias]
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.backend, name)
+
+    def _call(
+        self, method: str, fallback: Callable[[], Any], *args: Any, **kwargs: Any
+    ) -> Any:
+        return self.breaker.call(self.cache_alias, method, fallback, *args, **kwargs)
+
+    def _acall(
+        self, method: str, fallback: Callable[[], Any], *args: Any, **kwargs: Any
+    ) -> Awaitable[Any]:
+        return self.breaker.acall(self.cache_alias, method, fallback, *args, **kwargs)
+
+    def get(self, key: str, default: Any = None, version: int | None = None) -> Any:
+        return self._call("get", lambda: default, key, default, version)
+
+    def get_many(self, keys: list[str], version: int | None = None) -> dict[str, Any]:
+        return self._call("get_many", dict, keys, version)
+
+    def has_key(self, key: str, version: int | None = None) -> bool:
+        return self._call("has_key", lambda: False, key, version)
+
+    def set(self, key: str, value: Any, *args: Any, **kwargs: Any) -> None:
+        return self._call("set", lambda: None, key, value, *args, **kwargs)
+
+    def set_many(self, data: dict[str, Any], *args: Any, **kwargs: Any) -> list[str]:
+        return self._call("set_many", list, data, *args, **kwargs)
+
+    def add(self, key: str, value: Any, *args: Any, **kwargs: Any) -> bool:
+        return self._call("add", lambda: True, key, value, *args, **kwargs)
+
+    def delete(self, key: str, version: int | None = None) -> bool:
+        return self._call("delete", lambda: False, key, version)
+
+    def delete_many(self, keys: list[str], version: int | None = None) -> None:
+        return self._call("delete_many", lambda: None, keys, version)
+
+    async def aget(
+        self, key: str, default: Any = None, version: int | None = None
+    ) -> Any:
+        return await self._acall("aget", lambda: default, key, default, version)
+
+    async def aget_many(
+        self, keys: list[str], version: int | None = None
+    ) -> dict[str, Any]:
+        return await self._acall("aget_many", dict, keys, version)
+
+    async def ahas_key(self, key: str, version: int | None = None) -> bool:
+        return await self._acall("ahas_key", lambda: False, key, version)
+
+    async def aset(self, key: str, value: Any, *args: Any, **kwargs: Any) -> None:
+        return await self._acall("aset", lambda: None, key, value, *args, **kwargs)
+
+    async def aset_many(
+        self, data: dict[str, Any], *args: Any, **kwargs: Any
+    ) -> list[str]:
+        return await self._acall("aset_many", list, data, *args, **kwargs)
+
+    async def aadd(self, key: str, value: Any, *args: Any, **kwargs: Any) -> bool:
+        return await self._acall("aadd", lambda: True, key, value, *args, **kwargs)
+
+    async def adelete(self, key: str, version: int | None = None) -> bool:
+        return await self._acall("adelete", lambda: False, key, version)
+
+    async def adelete_many(self, keys: list[str], version: int | None = None) -> None:
+        return await self._acall("adelete_many", lambda: None, keys, version)
+
+
+cache_circuit_breaker = CacheCircuitBreaker()
@@ -0,0 +1,94 @@
+import pickle
+import zlib
+from typing import Any, Callable, NamedTuple
+
+from django.core.exceptions import ImproperlyConfigured
+
+# Header written in front of every encoded value: magic prefix + codec tag.
+MAGIC = b"\x00djrtk"
+RAW_TAG = b"r"
+
+
+class Compressor(NamedTuple):
+    """A named codec with the one-byte tag stored in the value header."""
+
+    name: str
+    tag: bytes
+    compress: Callable[[bytes], bytes]
+    decompress: Callable[[bytes], bytes]
+
+
+_by_name: dict[str, Compressor] = {}
+_by_tag: dict[bytes, Compressor] = {}
+
+
+def register_compressor(compressor: Compressor) -> None:
+    """Register a codec so it can be selected by name and decoded by tag."""
+    if len(compressor.tag) != 1 or compressor.tag == RAW_TAG:
+        raise ValueError(f"Invalid tag {compressor.tag!r} for '{compressor.name}'.")
+    _by_name[compressor.name] = compressor
+    _by_tag[compressor.tag] = compressor
+
+
+def get_compressor(name: str) -> Compressor:
+    try:
+        return _by_name[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Cache compressor '{name}' is not available. "
+            f"Installed compressors: {', '.join(sorted(_by_name))}."
+        )
+
+
+def encode_value(value: Any, compressor: Compressor, min_size: int) -> bytes:
+    """
+    Pickle `value` and compress it when the pickle is at least `min_size`
+    bytes long. Smaller values are stored raw behind the same header.
+    """
+    data = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+    if len(data) < min_size:
+        return MAGIC + RAW_TAG + data
+    return MAGIC + compressor.tag + compressor.compress(data)
+
+
+def decode_value(value: Any) -> Any:
+    """Decode a value written by `encode_value`; other values pass through."""
+    if not isinstance(value, bytes) or not value.startswith(MAGIC):
+        return value
+
+    offset = len(MAGIC) + 1
+    tag = value[len(MAGIC) : offset]
+    if tag == RAW_TAG:
+        return pickle.loads(value[offset:])
+
+    compressor = _by_tag.get(tag)
+    if compressor is None:
+        raise ImproperlyConfigured(f"No cache compressor registered for {tag!r}.")
+    return pickle.loads(compressor.decompress(value[offset:]))
+
+
+register_compressor(Compressor("zlib", b"z", zlib.compress, zlib.decompress))
+
+try:
+    import lz4.frame  # type: ignore
+except ImportError:
+    pass
+else:
+    register_compressor(
+        Compressor("lz4", b"4", lz4.frame.compress, lz4.frame.decompress)  # type: ignore
+    )
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    pass
+else:
+    register_compressor(
+        # zstandard (de)compressor objects are not thread-safe.
+        Compressor(
+            "zstd",
+            b"s",
+            lambda data: zstandard.ZstdCompressor().compress(data),  # type: ignore
+            lambda data: zstandard.ZstdDecompressor().decompress(data),  # type: ignore
+        )
+    )
@@ -0,0 +1,18 @@
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> Executor:
+    """Return the shared thread pool used for background cache work."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=4,
+                    thread_name_prefix="djresttoolkit-cache",
+                )
+    return _executor
@@ -0,0 +1,189 @@
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterable, Iterator
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+from ._local_cache import LocalCache
+
+_state = threading.local()
+
+
+def new_cache_generation() -> int:
+    """
+    Start value for a missing generation counter.
+
+    Millisecond timestamps keep a counter that was evicted from the cache
+    from restarting at a generation whose entries may still be alive.
+    """
+    return time.time_ns() // 1_000_000
+
+
+def bump_generation(key: str, cache_alias: str = DEFAULT_CACHE_ALIAS) -> int:
+    """Atomically increment a generation counter, restarting it if missing."""
+    cache = caches[cache_alias]
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # Counter was never set or has been evicted.
+        generation = new_cache_generation()
+        cache.set(key, generation, None)
+        return generation
+
+
+async def abump_generation(key: str, cache_alias: str = DEFAULT_CACHE_ALIAS) -> int:
+    """Async `bump_generation()`."""
+    cache = caches[cache_alias]
+    try:
+        return await cache.aincr(key)
+    except ValueError:
+        generation = new_cache_generation()
+        await cache.aset(key, generation, None)
+        return generation
+
+
+class InvalidationBatch:
+    """De-duplicated set of pending cache invalidations."""
+
+    def __init__(self) -> None:
+        # Pending keys per cache alias.
+        self.delete_keys: dict[str, set[str]] = {}
+        self.generation_keys: dict[str, set[str]] = {}
+        self.local_keys: dict[LocalCache, set[str]] = {}
+        # Stored once so it can be found again in `run_on_commit`.
+        self.callback = self.flush
+
+    def add(
+        self,
+        delete_keys: Iterable[str],
+        generation_keys: Iterable[str],
+        local_cache: LocalCache | None,
+        cache_alias: str = DEFAULT_CACHE_ALIAS,
+    ) -> None:
+        delete_keys, generation_keys = set(delete_keys), set(generation_keys)
+        if delete_keys:
+            self.delete_keys.setdefault(cache_alias, set()).update(delete_keys)
+        if generation_keys:
+            self.generation_keys.setdefault(cache_alias, set()).update(generation_keys)
+        if local_cache is not None:
+            local_keys = self.local_keys.setdefault(local_cache, set())
+            local_keys |= delete_keys | generation_keys
+
+    def flush(self) -> None:
+        """Apply every pending invalidation: one `delete_many` per cache
+        alias plus one `incr` per generation counter."""
+        for cache_alias, keys in self.delete_keys.items():
+            caches[cache_alias].delete_many(list(keys))
+        for cache_alias, keys in self.generation_keys.items():
+            for key in keys:
+                bump_generation(key, cache_alias)
+        self._flush_local()
+
+    async def aflush(self) -> None:
+        """Async `flush()`."""
+        for cache_alias, keys in self.delete_keys.items():
+            await caches[cache_alias].adelete_many(list(keys))
+        for cache_alias, keys in self.generation_keys.items():
+            for key in keys:
+                await abump_generation(key, cache_alias)
+        self._flush_local()
+
+    def _flush_local(self) -> None:
+        for local_cache, keys in self.local_keys.items():
+            for key in keys:
+                local_cache.delete(key)
+
+        self.delete_keys.clear()
+        self.generation_keys.clear()
+        self.local_keys.clear()
+
+
+def _get_transaction_batch(using: str) -> InvalidationBatch:
+    """Return the batch flushed when the current transaction commits."""
+    batches: dict[str, InvalidationBatch] = _state.__dict__.setdefault(
+        "transaction_batches", {}
+    )
+    batch = batches.get(using)
+
+    # on_commit callbacks are dropped on rollback, so a batch whose
+    # callback is no longer queued must not be reused.
+    pending = connections[using].run_on_commit
+    if batch is None or not any(item[1] is batch.callback for item in pending):
+        batch = batches[using] = InvalidationBatch()
+        transaction.on_commit(batch.callback, using=using)
+    return batch
+
+
+def invalidate_keys(
+    delete_keys: Iterable[str] = (),
+    generation_keys: Iterable[str] = (),
+    local_cache: LocalCache | None = None,
+    using: str = DEFAULT_DB_ALIAS,
+    cache_alias: str = DEFAULT_CACHE_ALIAS,
+) -> None:
+    """
+    Delete cache keys and bump generation counters in `cache_alias`.
+
+    Inside `batch_cache_invalidation()` or a transaction the work is
+    collected, de-duplicated and applied once: at the end of the block or
+    when the transaction commits. This keeps concurrent readers from
+    re-caching pre-commit data. Otherwise it is applied immediately.
+    """
+    explicit: InvalidationBatch | None = getattr(_state, "explicit_batch", None)
+    if explicit is not None:
+        explicit.add(delete_keys, generation_keys, local_cache, cache_alias)
+    elif connections[using].in_atomic_block:
+        _get_transaction_batch(using).add(
+            delete_keys, generation_keys, local_cache, cache_alias
+        )
+    else:
+        batch = InvalidationBatch()
+        batch.add(delete_keys, generation_keys, local_cache, cache_alias)
+        batch.flush()
+
+
+async def ainvalidate_keys(
+    delete_keys: Iterable[str] = (),
+    generation_keys: Iterable[str] = (),
+    local_cache: LocalCache | None = None,
+    cache_alias: str = DEFAULT_CACHE_ALIAS,
+) -> None:
+    """
+    Async `invalidate_keys()`. Applied immediately: async code cannot run
+    inside `transaction.atomic()`.
+    """
+    batch = InvalidationBatch()
+    batch.add(delete_keys, generation_keys, local_cache, cache_alias)
+    await batch.aflush()
+
+
+@contextmanager
+def batch_cache_invalidation(using: str = DEFAULT_DB_ALIAS) -> Iterator[None]:
+    """
+    Collect every cache invalidation made inside the block and apply them
+    once on exit, or on commit when the block runs inside a transaction.
+
+    Example:
+    ```
+        with batch_cache_invalidation():
+            for row in rows:
+                Todo.objects.create(**row)
+    ```
+    """
+    if getattr(_state, "explicit_batch", None) is not None:
+        # Nested blocks join the outermost batch.
+        yield
+        return
+
+    batch = _state.explicit_batch = InvalidationBatch()
+    try:
+        yield
+    finally:
+        # Also flush on errors: writes made before them may be committed.
+        _state.explicit_batch = None
+        if connections[using].in_atomic_block:
+            transaction.on_commit(batch.callback, using=using)
+        else:
+            batch.flush()
@@ -0,0 +1,275 @@
+import logging
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any, Callable, Iterable, NamedTuple
+
+from django.db.models import ForeignObjectRel, ManyToManyField, Model
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+
+if TYPE_CHECKING:
+    from .mixins import CacheOpsMixin
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+
+class CacheDependency(NamedTuple):
+    """
+    A cached basename that must be invalidated when `model` changes.
+
+    `lookup` is the ORM path from the basename's model to `model` (empty
+    for the model itself). `attname` is set when `model` holds a direct
+    foreign key to the basename's model, so the affected pk can be read
+    from the instance without a query.
+    """
+
+    view_class: type["CacheOpsMixin"]
+    basename: str
+    root_model: type[Model]
+    lookup: str
+    attname: str | None
+
+
+class CacheInvalidationRegistry:
+    """
+    Invalidate cached basenames from model signals.
+
+    Registering a view connects `post_save`, `post_delete` and
+    `m2m_changed` for its model and every model reachable through
+    FK / O2O / M2M relations up to `depth` hops. Writes from the admin,
+    background tasks or other views then invalidate the cache as well,
+    not only writes through `CacheInvalidateMixin`.
+
+    Example:
+    ```
+        cache_invalidation_registry.register(TodoViewSet, basename="todos")
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._dependencies: dict[type[Model], list[CacheDependency]] = defaultdict(list)
+        self._connected: set[type[Model]] = set()
+
+    def register(
+        self,
+        view_class: type["CacheOpsMixin"],
+        basename: str | None = None,
+        model: type[Model] | None = None,
+        depth: int = 2,
+    ) -> type["CacheOpsMixin"]:
+        """Track `view_class` and connect signals for its dependency graph."""
+        basename = basename or getattr(view_class, "basename", None)
+        if model is None:
+            queryset = getattr(view_class, "queryset", None)
+            model = queryset.model if queryset is not None else None
+        if not basename or model is None:
+            raise ValueError(
+                f"{view_class.__name__} needs a basename and a model "
+                "(or queryset) to register cache invalidation."
+            )
+
+        for related_model, lookup, attname in self._walk_relations(model, depth):
+            self._dependencies[related_model].append(
+                CacheDependency(view_class, basename, model, lookup, attname)
+            )
+            self._connect(related_model)
+        return view_class
+
+    def get_dependencies(self, model: type[Model]) -> list[CacheDependency]:
+        return self._dependencies.get(model._meta.concrete_model, [])  # type: ignore
+
+    def invalidate_instance(self, instance: Model) -> None:
+        """Invalidate every basename that depends on `instance`."""
+        self._invalidate(instance, lambda dependency: True)
+
+    def invalidate_model(
+        self,
+        model: type[Model],
+        pks: Iterable[Any] | None = None,
+    ) -> None:
+        """
+        Invalidate basenames depending on `model` after writes that send
+        no signals, such as `bulk_create()` or `QuerySet.update()`.
+        """
+        pks = list(pks or [])
+        for dependency in self.get_dependencies(model):
+            view = self._get_view(dependency)
+            root_pks = self._root_pks(dependency, pks) if pks else []
+            if root_pks:
+                view.delete_detail_cache(root_pks)
+            view.bump_cache_generation()
+            if hasattr(view, "purge_cdn_cache"):
+                view.purge_cdn_cache(root_pks)
+
+    def _get_view(self, dependency: CacheDependency) -> "CacheOpsMixin":
+        view = dependency.view_class()
+        view.basename = dependency.basename  # type: ignore[attr-defined]
+        return view
+
+    def _affected_pks(self, dependency: CacheDependency, instance: Model) -> list[Any]:
+        if not dependency.lookup:
+            return [instance.pk]
+        if dependency.attname is not None:
+            pk = getattr(instance, dependency.attname, None)
+            return [pk] if pk is not None else []
+        return list(
+            dependency.root_model._default_manager.filter(  # type: ignore
+                **{dependency.lookup: instance.pk}
+            )
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+
+    def _root_pks(self, dependency: CacheDependency, pks: list[Any]) -> list[Any]:
+        """Root pks whose cached rows include any of `pks`, in one query."""
+        if not dependency.lookup:
+            return pks
+        return list(
+            dependency.root_model._default_manager.filter(  # type: ignore
+                **{f"{dependency.lookup}__in": pks}
+            )
+            .values_list("pk", flat=True)
+            .distinct()
+        )
+
+    def _walk_relations(
+        self,
+        model: type[Model],
+        depth: int,
+    ) -> list[tuple[type[Model], str, str | None]]:
+        """
+        Breadth-first walk returning (model, lookup, attname) triples.
+
+        Reverse relations are not followed after a forward hop: models
+        that point at a related model (e.g. every model with a foreign key
+        to User for Todo -> User) are its siblings, not dependencies.
+        """
+        found: list[tuple[type[Model], str, str | None]] = [(model, "", None)]
+        seen: set[type[Model]] = {model}
+        # (model, lookup prefix, whether the path has a forward hop)
+        frontier: list[tuple[type[Model], str, bool]] = [(model, "", False)]
+
+        for _ in range(depth):
+            next_frontier: list[tuple[type[Model], str, bool]] = []
+            for current, prefix, forward in frontier:
+                for field in current._meta.get_fields():
+                    related = field.related_model
+                    if not field.is_relation or related is None:
+                        continue
+                    reverse = isinstance(field, ForeignObjectRel)
+                    if forward and reverse:
+                        continue
+                    related = related._meta.concrete_model  # type: ignore
+                    if related in seen:
+                        continue
+
+                    lookup = f"{prefix}{field.name}"
+                    # Reverse FK from the root model: the child row holds
+                    # the root pk in its own column.
+                    attname = None
+                    reverse_fk = field.one_to_many or field.one_to_one
+                    if not prefix and reverse_fk and reverse:
+                        attname = field.remote_field.attname  # type: ignore
+
+                    seen.add(related)  # type: ignore
+                    found.append((related, lookup, attname))  # type: ignore
+                    next_frontier.append(
+                        (
+                            related,  # type: ignore
+                            f"{lookup}__",
+                            forward or not reverse,
+                        )
+                    )
+            frontier = next_frontier
+        return found
+
+    def _connect(self, model: type[Model]) -> None:
+        if model in self._connected:
+            return
+        self._connected.add(model)
+
+        uid = f"djresttoolkit_cache_{model._meta.label_lower}"
+        post_save.connect(self._on_save, sender=model, weak=False, dispatch_uid=uid)
+        post_delete.connect(
+            self._on_post_delete, sender=model, weak=False, dispatch_uid=uid
+        )
+        pre_delete.connect(
+            self._on_pre_delete, sender=model, weak=False, dispatch_uid=uid
+        )
+
+        for field in model._meta.get_fields():
+            if not field.many_to_many:
+                continue
+            through = (
+                field.remote_field.through  # type: ignore
+                if isinstance(field, ManyToManyField)
+                else field.through  # type: ignore
+            )
+            m2m_changed.connect(
+                self._on_m2m_changed,
+                sender=through,
+                weak=False,
+                dispatch_uid=f"djresttoolkit_cache_{through._meta.label_lower}",
+            )
+
+    def _on_save(
+        self,
+        sender: type[Model],
+        instance: Model,
+        created: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        self._invalidate(instance, lambda dependency: True, rows_only=not created)
+
+    def _on_pre_delete(
+        self, sender: type[Model], instance: Model, **kwargs: Any
+    ) -> None:
+        # Rows reached through a query are gone after the delete cascades.
+        self._invalidate(instance, lambda dep: dep.lookup and dep.attname is None)
+
+    def _on_post_delete(
+        self, sender: type[Model], instance: Model, **kwargs: Any
+    ) -> None:
+        self._invalidate(
+            instance, lambda dep: not dep.lookup or dep.attname is not None
+        )
+
+    def _invalidate(
+        self,
+        instance: Model,
+        predicate: Callable[[CacheDependency], Any],
+        rows_only: bool = False,
+    ) -> None:
+        for dependency in self.get_dependencies(type(instance)):
+            if not predicate(dependency):
+                continue
+            logger.debug(
+                f"Invalidating '{dependency.basename}' cache for {instance!r}."
+            )
+            view = self._get_view(dependency)
+            pks = self._affected_pks(dependency, instance)
+            # Updates only drop the pages (or fragments) showing the rows.
+            if rows_only and hasattr(view, "invalidate_cache_rows"):
+                view.invalidate_cache_rows(pks)
+            else:
+                view.delete_detail_cache(pks)
+                view.bump_cache_generation()
+                if hasattr(view, "purge_cdn_cache"):
+                    view.purge_cdn_cache(pks)
+
+    def _on_m2m_changed(
+        self,
+        sender: type[Model],
+        instance: Model,
+        action: str,
+        model: type[Model],
+        pk_set: set[Any] | None,
+        **kwargs: Any,
+    ) -> None:
+        if action not in ("post_add", "post_remove", "post_clear"):
+            return
+        self.invalidate_instance(instance)
+        if pk_set:
+            self.invalidate_model(model, pk_set)
+
+
+cache_invalidation_registry = CacheInvalidationRegistry()
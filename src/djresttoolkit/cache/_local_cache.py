@@ -0,0 +1,96 @@
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class LocalCache:
+    """
+    Bounded, thread-safe in-process LRU cache with short per-entry TTLs.
+
+    Used as an L1 tier in front of the Django cache so hot keys are served
+    without a network round-trip or unpickling. Entries are evicted by
+    least-recent use once either `max_entries` or `max_bytes` (the `size`
+    passed to `set()`, or the pickled size of the value) is exceeded.
+
+    Values are returned as-is, not copied, so callers must not mutate them.
+
+    Example:
+    ```
+        class TodoViewSet(CacheInvalidateMixin, ModelViewSet):
+            local_cache = LocalCache(max_entries=512, timeout=5)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        timeout: float = 5.0,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.timeout = timeout
+        self.size = 0
+        self._data: OrderedDict[str, tuple[Any, float, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+
+            value, expires_at, _ = item
+            if time.monotonic() >= expires_at:
+                self._pop(key)
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        timeout: float | None = None,
+        size: int | None = None,
+    ) -> None:
+        if size is None:
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if size > self.max_bytes:
+            self.delete(key)
+            return
+
+        timeout = self.timeout if timeout is None else min(timeout, self.timeout)
+        expires_at = time.monotonic() + timeout
+
+        with self._lock:
+            self._pop(key)
+            self._data[key] = (value, expires_at, size)
+            self.size += size
+            while len(self._data) > self.max_entries or self.size > self.max_bytes:
+                self._pop(next(iter(self._data)))
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._data if key.startswith(prefix)]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _pop(self, key: str) -> None:
+        item = self._data.pop(key, None)
+        if item is not None:
+            self.size -= item[2]
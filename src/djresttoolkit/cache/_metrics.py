@@ -0,0 +1,155 @@
+import logging
+import os
+import socket
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any, Callable
+
+from django.core.cache import cache
+
+from ._cache_lock import CacheLock
+from ._executors import get_default_executor
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+# (basename, action) a metric is recorded for.
+type Family = tuple[str, str]
+type Snapshot = dict[Family, dict[str, float]]
+
+# name: (Prometheus metric, help, name counting the summary's samples)
+METRICS: dict[str, tuple[str, str, str | None]] = {
+    "hits": ("hits_total", "Cache hits, stale hits included.", None),
+    "stale_hits": ("stale_hits_total", "Hits served while stale.", None),
+    "misses": ("misses_total", "Cache misses.", None),
+    "fills": ("fills_total", "Values computed and stored.", None),
+    "invalidations": ("invalidations_total", "Keys invalidated.", None),
+    "fill_seconds": ("fill_seconds", "Time spent computing values.", "fills"),
+    "payload_bytes": ("payload_bytes", "Size of stored values.", "stores"),
+}
+
+
+class CacheMetrics:
+    """
+    Low-overhead, thread-safe aggregator of cache counters per
+    (basename, action).
+
+    Counters live in process memory. Every `publish_interval` seconds a
+    snapshot is also written to the Django cache from a background thread,
+    so `collect()` (and the `cachestats` command) can sum the counters of
+    every live process without a cache round trip inside the request.
+    """
+
+    index_key = "djresttoolkit_cache_metrics"
+
+    def __init__(self, publish_interval: float | None = 30.0) -> None:
+        self.publish_interval = publish_interval
+        self._families: defaultdict[Family, Counter[str]] = defaultdict(Counter)
+        self._lock = threading.Lock()
+        self._next_publish = time.monotonic() + (publish_interval or 0)
+
+    def record(self, family: Family, name: str, value: float = 1.0) -> None:
+        with self._lock:
+            self._families[family][name] += value
+            publish = (
+                self.publish_interval is not None
+                and time.monotonic() >= self._next_publish
+            )
+            if publish:
+                self._next_publish = time.monotonic() + self.publish_interval  # type: ignore
+        if publish:
+            get_default_executor().submit(self.publish)
+
+    def snapshot(self) -> Snapshot:
+        """Counters of this process."""
+        with self._lock:
+            return {family: dict(values) for family, values in self._families.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._families.clear()
+
+    def get_process_key(self) -> str:
+        return f"{self.index_key}_{socket.gethostname()}_{os.getpid()}"
+
+    def publish(self) -> None:
+        """Share this process's counters through the Django cache."""
+        timeout = int((self.publish_interval or 30.0) * 4)
+        key = self.get_process_key()
+        try:
+            cache.set(key, self.snapshot(), timeout)
+            if key not in (cache.get(self.index_key) or {}):
+                # Retried on the next publish when another process holds it.
+                self._update_index(lambda index: {**index, key: time.time()})
+        except Exception:
+            logger.warning("Publishing cache metrics failed.", exc_info=True)
+
+    def _update_index(
+        self, update: Callable[[dict[str, float]], dict[str, float]]
+    ) -> bool:
+        """Read-modify-write the index under a lock, False when it is taken."""
+        lock = CacheLock(f"{self.index_key}:lock", timeout=5)
+        if not lock.acquire():
+            return False
+        try:
+            cache.set(self.index_key, update(cache.get(self.index_key) or {}), None)
+        finally:
+            lock.release()
+        return True
+
+    def collect(self) -> Snapshot:
+        """Sum the published counters of every live process."""
+        index: dict[str, float] = cache.get(self.index_key) or {}
+        snapshots = cache.get_many(list(index))
+        if len(snapshots) != len(index):
+            # Processes that stopped publishing have expired.
+            expired = set(index) - set(snapshots)
+            self._update_index(
+                lambda current: {
+                    key: seen for key, seen in current.items() if key not in expired
+                }
+            )
+
+        totals: defaultdict[Family, Counter[str]] = defaultdict(Counter)
+        for snapshot in snapshots.values():
+            for family, values in snapshot.items():
+                totals[family].update(values)
+        return {family: dict(values) for family, values in totals.items()}
+
+    def to_prometheus(
+        self,
+        snapshot: Snapshot | None = None,
+        prefix: str = "djresttoolkit_cache",
+    ) -> str:
+        """Render `snapshot` (this process by default) as Prometheus text."""
+        if snapshot is None:
+            snapshot = self.snapshot()
+
+        lines: list[str] = []
+        for name, (metric, help_text, count_name) in METRICS.items():
+            metric = f"{prefix}_{metric}"
+            kind = "summary" if count_name else "counter"
+            lines.append(f"# HELP {metric} {help_text}")
+            lines.append(f"# TYPE {metric} {kind}")
+            for (basename, action), values in sorted(snapshot.items()):
+                labels = f'basename="{_escape(basename)}",action="{_escape(action)}"'
+                value = _number(values.get(name, 0))
+                if count_name is None:
+                    lines.append(f"{metric}{{{labels}}} {value}")
+                    continue
+                count = _number(values.get(count_name, 0))
+                lines.append(f"{metric}_sum{{{labels}}} {value}")
+                lines.append(f"{metric}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+cache_metrics = CacheMetrics()
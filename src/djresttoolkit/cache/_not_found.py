@@ -0,0 +1,87 @@
+import hashlib
+from typing import Any, NamedTuple
+
+from django.core.cache import cache
+from django.db.models import Model
+from django.db.models.signals import post_save
+
+from ._invalidation import invalidate_keys, new_cache_generation
+
+_connected: set[type[Model]] = set()
+
+
+class CachedNotFound(NamedTuple):
+    """
+    Negative-cache sentinel for a lookup that raised `Http404`.
+
+    It is only valid while the cache generation it was stored under is
+    current, so the create path, which bumps the generation, clears it.
+    `args` are re-raised with the `Http404`.
+    """
+
+    generation: int
+    args: tuple[Any, ...] = ()
+
+
+def get_not_found_generation_key(model: type[Model]) -> str:
+    return f"{model._meta.label_lower}_not_found_generation"
+
+
+def get_not_found_generation(model: type[Model]) -> int:
+    key = get_not_found_generation_key(model)
+    generation = cache.get(key)
+    if generation is None:
+        generation = new_cache_generation()
+        if not cache.add(key, generation, None):
+            generation = cache.get(key, generation)
+    return generation
+
+
+def get_not_found_key(model: type[Model], scope: str, **filters: Any) -> str:
+    lookup = "&".join(f"{name}={value!r}" for name, value in sorted(filters.items()))
+    digest = hashlib.blake2b(f"{scope}:{lookup}".encode(), digest_size=16).hexdigest()
+    return f"{model._meta.label_lower}_not_found_{digest}"
+
+
+def is_cached_not_found(model: type[Model], scope: str, **filters: Any) -> bool:
+    """
+    Return True when `filters` recently matched no `model` row.
+
+    A lookup that exists costs one cache read, a remembered miss two.
+    """
+    not_found = cache.get(get_not_found_key(model, scope, **filters))
+    return isinstance(
+        not_found, CachedNotFound
+    ) and not_found.generation == get_not_found_generation(model)
+
+
+def cache_not_found(
+    model: type[Model],
+    scope: str,
+    timeout: int,
+    **filters: Any,
+) -> None:
+    """Remember that `filters` matched no `model` row for `timeout` seconds."""
+    connect_not_found_signals(model)
+    cache.set(
+        get_not_found_key(model, scope, **filters),
+        CachedNotFound(get_not_found_generation(model)),
+        timeout,
+    )
+
+
+def connect_not_found_signals(model: type[Model]) -> None:
+    """Forget every remembered miss of `model` whenever one of its rows is saved."""
+    if model in _connected:
+        return
+    _connected.add(model)
+    post_save.connect(
+        _bump_not_found_generation,
+        sender=model,
+        dispatch_uid=f"djresttoolkit_not_found_{model._meta.label_lower}",
+    )
+
+
+def _bump_not_found_generation(sender: type[Model], **kwargs: Any) -> None:
+    # Any save can make a remembered lookup succeed: new rows, changed slugs.
+    invalidate_keys(generation_keys=[get_not_found_generation_key(sender)])
@@ -0,0 +1,89 @@
+import copy
+import logging
+import threading
+from concurrent.futures import Executor
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+from django.http import QueryDict
+from rest_framework.request import Request, clone_request
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+_in_flight = 0
+_in_flight_lock = threading.Lock()
+
+
+def get_next_page_query(
+    request: Request,
+    page_query_param: str,
+    data: Any = None,
+) -> str | None:
+    """
+    Return the query string of the page after the one `request` served.
+
+    The `next` link of paginated `data` (DRF or `PageNumberPagination`
+    layout) is used when present, so the last page has no next page.
+    Otherwise the page number of the request is incremented.
+    """
+    if isinstance(data, dict):
+        links = data.get("page") if isinstance(data.get("page"), dict) else data
+        if "next" in links:
+            next_link = links["next"]
+            return urlsplit(next_link).query if next_link else None
+
+    current = request.query_params.get(page_query_param, "1")
+    if not current.isdigit():
+        # e.g. `?page=last`
+        return None
+    query = request.query_params.copy()
+    query[page_query_param] = str(int(current) + 1)
+    return query.urlencode()
+
+
+def clone_request_with_query(request: Request, query: str) -> Request:
+    """Copy of `request` (user, auth, renderer) with another query string."""
+    django_request = copy.copy(request._request)
+    django_request.GET = QueryDict(query)
+    django_request.META = {**django_request.META, "QUERY_STRING": query}
+
+    clone = clone_request(request, request.method)
+    clone._request = django_request
+    return clone
+
+
+def submit_prefetch(
+    executor: Executor,
+    max_concurrency: int,
+    fn: Callable[..., Any],
+    *args: Any,
+) -> bool:
+    """
+    Run `fn(*args)` on `executor` unless `max_concurrency` prefetches are
+    already running in this process. Prefetches are dropped, not queued.
+    """
+    global _in_flight
+    with _in_flight_lock:
+        if _in_flight >= max_concurrency:
+            return False
+        _in_flight += 1
+
+    def run() -> None:
+        global _in_flight
+        try:
+            fn(*args)
+        except Exception:
+            logger.exception("Cache prefetch failed.")
+        finally:
+            with _in_flight_lock:
+                _in_flight -= 1
+
+    try:
+        executor.submit(run)
+    except RuntimeError:
+        # Executor is shutting down.
+        with _in_flight_lock:
+            _in_flight -= 1
+        return False
+    return True
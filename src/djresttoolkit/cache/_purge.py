@@ -0,0 +1,187 @@
+import logging
+import time
+from typing import Any, Callable, Iterable, Iterator
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+
+from ._invalidation import bump_generation
+from ._redis import get_redis_client
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+PURGE_FAMILIES = ("list", "detail", "custom")
+
+
+def get_purge_patterns(
+    basename: str,
+    families: Iterable[str] | None = None,
+    pks: Iterable[Any] | None = None,
+    custom_actions: Iterable[str] = (),
+) -> list[str]:
+    """
+    Glob patterns of the keys the cache mixins store for `basename`.
+
+    Every pattern starts with a family prefix (`_list_v`, `_detail_`,
+    `_row_`), so the generation counter, tag keys and basenames such as
+    `book_author` are left alone when purging `book`. Custom-action keys
+    are matched by name when `custom_actions` is given; otherwise the
+    action is a wildcard and may match a basename that starts with
+    `<basename>_`.
+    """
+    families = set(families or PURGE_FAMILIES)
+    actions = list(custom_actions) or ["*"]
+    patterns: list[str] = []
+    if pks is not None:
+        for pk in pks:
+            if "detail" in families:
+                patterns += [f"{basename}_detail_{pk}", f"{basename}_detail_{pk}_v*"]
+                patterns += [f"{basename}_row_{pk}", f"{basename}_row_{pk}_v*"]
+            if "custom" in families:
+                for action in actions:
+                    patterns += [
+                        f"{basename}_{action}_detail_{pk}",
+                        f"{basename}_{action}_detail_{pk}_v*",
+                    ]
+        return patterns
+
+    if "list" in families:
+        patterns.append(f"{basename}_list_v*")
+    if "detail" in families:
+        patterns += [f"{basename}_detail_*", f"{basename}_row_*"]
+    if "custom" in families:
+        for action in actions:
+            patterns += [
+                f"{basename}_{action}_list_v*",
+                f"{basename}_{action}_detail_*",
+            ]
+    return patterns
+
+
+def can_scan_cache(cache_alias: str = DEFAULT_CACHE_ALIAS) -> bool:
+    """True when the keys of `cache_alias` can be enumerated with SCAN."""
+    return get_redis_client(caches[cache_alias]) is not None
+
+
+def purge_cache(
+    basename: str,
+    families: Iterable[str] | None = None,
+    pks: Iterable[Any] | None = None,
+    custom_actions: Iterable[str] = (),
+    cache_alias: str = DEFAULT_CACHE_ALIAS,
+    batch_size: int = 500,
+    pause: float = 0.0,
+    dry_run: bool = False,
+    progress: Callable[[int], None] | None = None,
+) -> int:
+    """
+    Delete the cached keys of `basename`, optionally limited to key
+    `families` (list, detail, custom) or to `pks`. Returns the number of
+    keys deleted, or found with `dry_run`.
+
+    On `django_redis` keys are found with cursor-based SCAN in batches of
+    `batch_size` and removed with pipelined UNLINK, sleeping `pause`
+    seconds between batches, so Redis keeps serving other clients. Other
+    backends cannot enumerate keys: the known keys of `pks` (custom-detail
+    ones need `custom_actions`) are deleted with `delete_many`, and list
+    and whole-family purges bump the basename's generation instead.
+    """
+    families = list(families or PURGE_FAMILIES)
+    pks = list(pks) if pks is not None else None
+    if can_scan_cache(cache_alias):
+        return _purge_scan(
+            get_purge_patterns(basename, families, pks, custom_actions),
+            cache_alias,
+            batch_size,
+            pause,
+            dry_run,
+            progress,
+        )
+    return _purge_known_keys(
+        basename,
+        families,
+        pks,
+        custom_actions,
+        cache_alias,
+        batch_size,
+        dry_run,
+        progress,
+    )
+
+
+def _purge_scan(
+    patterns: list[str],
+    cache_alias: str,
+    batch_size: int,
+    pause: float,
+    dry_run: bool,
+    progress: Callable[[int], None] | None,
+) -> int:
+    backend = caches[cache_alias]
+    client = get_redis_client(backend)
+    count = 0
+    for pattern in patterns:
+        for keys in _scan(client, backend.make_key(pattern), batch_size):
+            if not dry_run:
+                pipeline = client.pipeline(transaction=False)
+                for start in range(0, len(keys), 100):
+                    pipeline.unlink(*keys[start : start + 100])
+                pipeline.execute()
+            count += len(keys)
+            if progress is not None:
+                progress(count)
+            if pause:
+                time.sleep(pause)
+    return count
+
+
+def _scan(client: Any, match: str, batch_size: int) -> Iterator[list[bytes]]:
+    cursor = 0
+    while True:
+        cursor, keys = client.scan(cursor, match=match, count=batch_size)
+        if keys:
+            yield keys
+        if not cursor:
+            return
+
+
+def _purge_known_keys(
+    basename: str,
+    families: list[str],
+    pks: list[Any] | None,
+    custom_actions: Iterable[str],
+    cache_alias: str,
+    batch_size: int,
+    dry_run: bool,
+    progress: Callable[[int], None] | None,
+) -> int:
+    backend = caches[cache_alias]
+    if pks is None:
+        # Versioned keys (list pages, varied details) age out after a bump.
+        # The mixins read the generation from the default alias only,
+        # whichever alias the versioned keys are stored on.
+        logger.info(
+            f"'{cache_alias}' cannot enumerate keys: bumping the '{basename}' "
+            "generation, unversioned detail keys expire on their own."
+        )
+        if not dry_run:
+            bump_generation(f"{basename}_generation", DEFAULT_CACHE_ALIAS)
+        return 0
+
+    keys: list[str] = []
+    for pk in pks:
+        if "detail" in families:
+            keys += [f"{basename}_detail_{pk}", f"{basename}_row_{pk}"]
+        if "custom" in families:
+            keys += [f"{basename}_{action}_detail_{pk}" for action in custom_actions]
+
+    count = 0
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start : start + batch_size]
+        found = list(backend.get_many(batch))
+        if found and not dry_run:
+            backend.delete_many(found)
+        count += len(found)
+        if progress is not None:
+            progress(count)
+    return count
@@ -0,0 +1,26 @@
+from typing import Any
+
+from django.core.cache.backends.base import BaseCache
+from django.utils.connection import ConnectionProxy
+
+
+def get_redis_client(backend: BaseCache) -> Any | None:
+    """
+    Return the raw redis-py client behind a `django_redis` cache backend.
+
+    Returns `None` when `django_redis` is not installed or the backend
+    is not a `django_redis` cache, so callers can fall back to the
+    generic Django cache API.
+    """
+
+    try:
+        from django_redis.cache import RedisCache
+    except ImportError:
+        return None
+
+    if isinstance(backend, ConnectionProxy):
+        # `django.core.cache.cache` proxies the default backend.
+        backend = backend._connections[backend._alias]  # type: ignore
+    if not isinstance(backend, RedisCache):
+        return None
+    return backend.client.get_client(write=True)  # type: ignore
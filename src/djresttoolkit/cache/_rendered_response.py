@@ -0,0 +1,49 @@
+import hashlib
+from typing import Any, NamedTuple
+
+from rest_framework.response import Response
+
+
+class RenderedPayload(NamedTuple):
+    """Final response body cached together with its content type and ETag."""
+
+    content: bytes
+    content_type: str
+    etag: str
+
+    @classmethod
+    def from_content(cls, content: bytes, content_type: str) -> "RenderedPayload":
+        etag = f'"{hashlib.md5(content).hexdigest()}"'
+        return cls(content, content_type, etag)
+
+
+class RenderedResponse(Response):
+    """
+    DRF response that writes pre-rendered bytes straight to the body.
+
+    Skips the renderer entirely, but still lets renderers that add
+    per-request headers (such as `ThrottleInfoJSONRenderer`) attach them
+    through their `attach_response_headers` hook.
+    """
+
+    def __init__(
+        self,
+        payload: RenderedPayload,
+        status: int | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(data=None, status=status, headers=headers)
+        self.payload = payload
+        self["ETag"] = payload.etag
+
+    @property
+    def rendered_content(self) -> Any:
+        renderer = getattr(self, "accepted_renderer", None)
+        context = getattr(self, "renderer_context", None)
+        attach_headers = getattr(renderer, "attach_response_headers", None)
+        if context is not None and attach_headers is not None:
+            context["response"] = self
+            attach_headers(context)
+
+        self["Content-Type"] = self.payload.content_type
+        return self.payload.content
@@ -0,0 +1,103 @@
+import bisect
+import hashlib
+import random
+from fnmatch import fnmatchcase
+from typing import Iterable, Sequence
+
+from django.core.cache import DEFAULT_CACHE_ALIAS
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest())
+
+
+class HashRing:
+    """Consistent-hash ring over cache aliases."""
+
+    def __init__(self, aliases: Iterable[str], vnodes: int = 64) -> None:
+        self.aliases = list(dict.fromkeys(aliases))
+        if not self.aliases:
+            raise ValueError("A hash ring needs at least one cache alias.")
+
+        points = sorted(
+            (_hash(f"{alias}#{i}"), alias)
+            for alias in self.aliases
+            for i in range(vnodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._aliases = [alias for _, alias in points]
+
+    def get_aliases(self, key: str, count: int = 1) -> list[str]:
+        """The `count` distinct aliases following `key` on the ring."""
+        count = min(count, len(self.aliases))
+        index = bisect.bisect(self._hashes, _hash(key))
+        found: list[str] = []
+        while len(found) < count:
+            alias = self._aliases[index % len(self._aliases)]
+            if alias not in found:
+                found.append(alias)
+            index += 1
+        return found
+
+
+class CacheRouter:
+    """
+    Routes the keys of the cache mixins to cache aliases.
+
+    `routes` maps `"<basename>"` or the more specific
+    `"<basename>.<family>"` (family: `list`, `detail` or `custom`) to a
+    cache alias, or to several aliases that keys are spread over with a
+    consistent-hash ring. Unrouted keys use `default`.
+
+    Keys matching one of the `replicated` glob patterns are written to
+    `replicas` aliases of their ring and read from a random one of them,
+    so a hot key does not pin a single node.
+
+    Example:
+    ```
+        router = CacheRouter(
+            {"book": ["cache-a", "cache-b", "cache-c"], "book.list": "cache-hot"},
+            replicated=["book_detail_*"],
+        )
+    ```
+    """
+
+    families = ("list", "detail", "custom")
+
+    def __init__(
+        self,
+        routes: dict[str, str | Sequence[str]] | None = None,
+        default: str = DEFAULT_CACHE_ALIAS,
+        replicated: Iterable[str] = (),
+        replicas: int = 2,
+    ) -> None:
+        self.default = default
+        self.replicated = tuple(replicated)
+        self.replicas = replicas
+        self.rings: dict[str, HashRing] = {}
+        for route, aliases in (routes or {}).items():
+            _, _, family = route.partition(".")
+            if family and family not in self.families:
+                raise ValueError(f"Unknown cache key family '{family}' in '{route}'.")
+            self.rings[route] = HashRing(
+                [aliases] if isinstance(aliases, str) else aliases
+            )
+
+    def get_ring(self, basename: str, family: str) -> HashRing | None:
+        return self.rings.get(f"{basename}.{family}") or self.rings.get(basename)
+
+    def is_replicated(self, key: str) -> bool:
+        return any(fnmatchcase(key, pattern) for pattern in self.replicated)
+
+    def get_write_aliases(self, basename: str, family: str, key: str) -> list[str]:
+        """Every alias `key` is stored in (and deleted from)."""
+        ring = self.get_ring(basename, family)
+        if ring is None:
+            return [self.default]
+        count = self.replicas if self.is_replicated(key) else 1
+        return ring.get_aliases(key, count)
+
+    def get_read_alias(self, basename: str, family: str, key: str) -> str:
+        """The alias `key` is read from."""
+        aliases = self.get_write_aliases(basename, family, key)
+        return aliases[0] if len(aliases) == 1 else random.choice(aliases)
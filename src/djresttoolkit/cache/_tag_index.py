@@ -0,0 +1,125 @@
+import logging
+from functools import cached_property
+from typing import Any, Iterable
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache import cache as default_cache
+from django.core.cache.backends.base import BaseCache
+from django.db import DEFAULT_DB_ALIAS, transaction
+
+from ._invalidation import invalidate_keys, new_cache_generation
+from ._local_cache import LocalCache
+from ._redis import get_redis_client
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+
+class CacheTagIndex:
+    """
+    Index of which cached keys contain which tags (e.g. row pks), so
+    invalidating a tag only drops the keys that contain it.
+
+    On a `django_redis` backend every tag is a Redis set of the keys that
+    contain it: invalidation pops the set and deletes its members, reads
+    cost nothing extra. Other backends use versioned tags instead: a key
+    is stored with the versions of its tags (its "stamp"), invalidation
+    increments the versions and a read compares the stamp with one
+    `get_many`.
+    """
+
+    def __init__(self, backend: BaseCache | None = None) -> None:
+        self.backend = backend or default_cache
+
+    @cached_property
+    def client(self) -> Any | None:
+        return get_redis_client(self.backend)
+
+    def stamp(self, tags: Iterable[str]) -> dict[str, int]:
+        """Return the current versions of `tags`, to be stored with a key."""
+        tags = list(tags)
+        if self.client is not None or not tags:
+            return {}
+
+        versions = self.backend.get_many(tags)
+        for tag in tags:
+            if tag not in versions:
+                version = new_cache_generation()
+                if not self.backend.add(tag, version, None):
+                    version = self.backend.get(tag, version)
+                versions[tag] = version
+        return versions
+
+    def is_current(self, stamp: dict[str, int] | None) -> bool:
+        """Return False once one of the stamped tags was invalidated."""
+        if not stamp:
+            return True
+        return self.backend.get_many(list(stamp)) == stamp
+
+    async def ais_current(self, stamp: dict[str, int] | None) -> bool:
+        """Async `is_current()`."""
+        if not stamp:
+            return True
+        return await self.backend.aget_many(list(stamp)) == stamp
+
+    def add(
+        self,
+        cache_key: str,
+        tags: Iterable[str],
+        timeout: int | None,
+        cache_aliases: Iterable[str] = (DEFAULT_CACHE_ALIAS,),
+    ) -> None:
+        """Record that `cache_key`, stored in `cache_aliases`, contains `tags`."""
+        if self.client is None:
+            return
+
+        members = [f"{alias}\x1e{cache_key}" for alias in cache_aliases]
+        pipeline = self.client.pipeline(transaction=False)
+        for tag in tags:
+            tag_key = self.backend.make_key(tag)
+            pipeline.sadd(tag_key, *members)
+            if timeout is not None:
+                pipeline.expire(tag_key, timeout)
+        try:
+            pipeline.execute()
+        except Exception:
+            # Do not fail the request: the key still expires on its own.
+            logger.warning(f"Tagging '{cache_key}' failed.", exc_info=True)
+
+    def invalidate(
+        self,
+        tags: Iterable[str],
+        local_cache: LocalCache | None = None,
+        using: str = DEFAULT_DB_ALIAS,
+    ) -> None:
+        """Drop every key containing one of `tags` once the transaction commits."""
+        tags = list(tags)
+        if not tags:
+            return
+        if self.client is None:
+            invalidate_keys(generation_keys=tags, using=using)
+            return
+        transaction.on_commit(lambda: self._pop(tags, local_cache), using=using)
+
+    def _pop(self, tags: list[str], local_cache: LocalCache | None) -> None:
+        pipeline = self.client.pipeline(transaction=True)  # type: ignore[union-attr]
+        for tag in tags:
+            tag_key = self.backend.make_key(tag)
+            pipeline.smembers(tag_key)
+            pipeline.delete(tag_key)
+        results = pipeline.execute()
+
+        members: set[bytes] = set().union(*results[::2])
+        keys: dict[str, list[str]] = {}
+        for member in members:
+            alias, _, cache_key = member.decode().partition("\x1e")
+            keys.setdefault(alias, []).append(cache_key)
+
+        for alias, cache_keys in keys.items():
+            caches[alias].delete_many(cache_keys)
+            if local_cache is not None:
+                for cache_key in cache_keys:
+                    local_cache.delete(cache_key)
+
+
+cache_tag_index = CacheTagIndex()
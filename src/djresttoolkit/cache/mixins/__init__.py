@@ -1,13 +1,23 @@
+from ._async_cache_list_retrieve_mixin import AsyncCacheListRetrieveMixin
 from ._cache_action_mixin import CacheActionMixin
 from ._cache_invalidate_mixin import CacheInvalidateMixin
 from ._cache_key_mixin import CacheKeyMixin
 from ._cache_list_retrieve_mixin import CacheListRetrieveMixin
 from ._cache_ops_mixin import CacheOpsMixin
+from ._idempotency_mixin import (
+    IdempotencyConflict,
+    IdempotencyKeyReused,
+    IdempotencyMixin,
+)
 
 __all__ = [
+    "AsyncCacheListRetrieveMixin",
     "CacheActionMixin",
     "CacheInvalidateMixin",
     "CacheKeyMixin",
     "CacheListRetrieveMixin",
     "CacheOpsMixin",
+    "IdempotencyConflict",
+    "IdempotencyKeyReused",
+    "IdempotencyMixin",
 ]
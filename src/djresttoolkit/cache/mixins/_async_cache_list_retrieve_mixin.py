@@ -0,0 +1,31 @@
+from typing import Any
+
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from ._cache_list_retrieve_mixin import CacheListRetrieveMixin
+
+
+class AsyncCacheListRetrieveMixin(CacheListRetrieveMixin):
+    """
+    Caches list() and retrieve() of async viewsets (e.g. `adrf`) on ASGI.
+
+    Cache hits are served with Django's async cache API, misses compute
+    the response in a thread.
+    """
+
+    async def list(  # type: ignore[override]
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        return await self.alist(request, *args, **kwargs)
+
+    async def retrieve(  # type: ignore[override]
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        return await self.aretrieve(request, *args, **kwargs)
@@ -1,4 +1,6 @@
 from typing import Any
+from django.db import transaction
+from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from ._cache_list_retrieve_mixin import CacheListRetrieveMixin
@@ -7,6 +9,11 @@ from ._cache_list_retrieve_mixin import CacheListRetrieveMixin
 class CacheInvalidateMixin(CacheListRetrieveMixin):
     """Invalidate caches after create, update, destroy."""
 
+    # Store the update()/partial_update() response data under the detail
+    # key, so the next retrieve() is a hit. Only enable it when update and
+    # retrieve serialize the object the same way.
+    cache_write_through: bool = False
+
     def create(
         self,
         request: Request,
@@ -15,6 +22,7 @@ class CacheInvalidateMixin(CacheListRetrieveMixin):
     ) -> Response:
         response = super().create(request, *args, **kwargs)  # type: ignore
         self.invalidate_cache()
+        self.purge_cdn_cache()
         return response  # type: ignore
 
     def update(
@@ -24,9 +32,24 @@ class CacheInvalidateMixin(CacheListRetrieveMixin):
         **kwargs: Any,
     ) -> Response:
         response = super().update(request, *args, **kwargs)  # type: ignore
-        self.invalidate_cache(pk=self.kwargs.get("pk"))  # type: ignore
+        pk = self.kwargs.get("pk")  # type: ignore
+        self.invalidate_cache_rows([pk])
+
+        if self.cache_write_through and status.is_success(response.status_code):
+            self.write_through_cache(pk, response.data)
         return response  # type: ignore
 
+    def write_through_cache(self, pk: Any, data: Any) -> None:
+        """Store `data` under the detail key of `pk` once the write commits."""
+
+        def store() -> None:
+            # Built after the invalidation flush: varied keys are versioned.
+            cache_key = self.get_cache_key("retrieve", pk=pk)
+            if cache_key:
+                self.set_cache_entry(cache_key, data)
+
+        transaction.on_commit(store)
+
     def destroy(
         self,
         request: Request,
@@ -34,5 +57,7 @@ class CacheInvalidateMixin(CacheListRetrieveMixin):
         **kwargs: Any,
     ) -> Response:
         response = super().destroy(request, *args, **kwargs)  # type: ignore
-        self.invalidate_cache(pk=self.kwargs.get("pk"))  # type: ignore
+        pk = self.kwargs.get("pk")  # type: ignore
+        self.invalidate_cache(pk=pk)
+        self.purge_cdn_cache([pk])
         return response  # type: ignore
@@ -1,6 +1,19 @@
 import hashlib
-import json
-from typing import Any
+from typing import Any, Callable
+from urllib.parse import urlencode
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.base import BaseCache
+from rest_framework.request import Request
+
+from .._circuit_breaker import CacheCircuitBreaker
+from .._invalidation import new_cache_generation
+from .._router import CacheRouter
+
+
+def hash_key_parts(*parts: str) -> str:
+    """Fast, fixed-length hash of key components."""
+    return hashlib.blake2b("\x1e".join(parts).encode(), digest_size=16).hexdigest()
 
 
 class CacheKeyMixin:
@@ -8,26 +21,196 @@ class CacheKeyMixin:
 
     cache_timeout: int = 300
 
+    # Request attributes that change the cached response, e.g.
+    # ("user", "auth", "Accept-Language", lambda request: request.version).
+    # "user" is the user id, "auth" the authenticator and token scope,
+    # other strings are header names and callables receive the request.
+    cache_vary_on: tuple[str | Callable[[Request], Any], ...] = ()
+
+    # Spread keys over several cache aliases, see `CacheRouter`. Locks,
+    # tags, metrics and the generation counter stay on the default, so
+    # every reader sees one counter instead of diverging replicas.
+    cache_router: CacheRouter | None = None
+
+    # Skip the cache backend while it is failing or slow, e.g. the module
+    # `cache_circuit_breaker`. Opt-in. Invalidations and locks are not
+    # guarded.
+    cache_circuit_breaker: CacheCircuitBreaker | None = None
+
     def get_cache_timeout(self) -> int:
         return self.cache_timeout
 
+    def get_cache_key_family(self, cache_key: str) -> str:
+        """Router family of a key built by `get_cache_key()`."""
+        name = cache_key.removeprefix(f"{self.basename}_")  # type: ignore
+        if name.startswith("list_v"):
+            return "list"
+        if name.startswith(("detail_", "row_")):
+            return "detail"
+        return "custom"
+
+    def get_cache_aliases(self, cache_key: str) -> list[str]:
+        """Cache aliases `cache_key` is written to and deleted from."""
+        if self.cache_router is None or cache_key == self.get_cache_generation_key():
+            return [DEFAULT_CACHE_ALIAS]
+        return self.cache_router.get_write_aliases(
+            self.basename,  # type: ignore
+            self.get_cache_key_family(cache_key),
+            cache_key,
+        )
+
+    def get_invalidation_aliases(self, cache_key: str) -> list[str]:
+        """
+        `get_cache_aliases()` plus the fallback alias of the circuit
+        breaker, which serves reads and writes while a circuit is open.
+        """
+        aliases = self.get_cache_aliases(cache_key)
+        fallback_alias = getattr(self.cache_circuit_breaker, "fallback_alias", None)
+        if fallback_alias is not None and fallback_alias not in aliases:
+            aliases = [*aliases, fallback_alias]
+        return aliases
+
+    def get_cache_backend(self, cache_key: str) -> BaseCache:
+        """Cache backend `cache_key` is read from."""
+        if self.cache_router is None or cache_key == self.get_cache_generation_key():
+            return self.get_alias_backend(DEFAULT_CACHE_ALIAS)
+        alias = self.cache_router.get_read_alias(
+            self.basename,  # type: ignore
+            self.get_cache_key_family(cache_key),
+            cache_key,
+        )
+        return self.get_alias_backend(alias)
+
+    def get_alias_backend(self, cache_alias: str) -> BaseCache:
+        """Backend of `cache_alias`, guarded by `cache_circuit_breaker`."""
+        if self.cache_circuit_breaker is None:
+            return caches[cache_alias]
+        return self.cache_circuit_breaker.guard(cache_alias)  # type: ignore[return-value]
+
+    def is_cache_available(self, cache_key: str | None = None) -> bool:
+        """
+        False while the circuit of the default cache alias (locks), or of
+        an alias `cache_key` is routed to, is not closed.
+        """
+        if self.cache_circuit_breaker is None:
+            return True
+        aliases = {DEFAULT_CACHE_ALIAS}
+        if cache_key is not None:
+            aliases.update(self.get_cache_aliases(cache_key))
+        return all(
+            self.cache_circuit_breaker.get_state(alias) == "closed" for alias in aliases
+        )
+
+    def get_cache_generation_key(self) -> str:
+        return f"{self.basename}_generation"  # type: ignore
+
+    def get_cache_generation(self) -> int:
+        """
+        Return the current list-cache generation for this basename.
+
+        List keys embed the generation, so bumping it invalidates every
+        cached list page at once and old entries simply age out.
+        """
+        key = self.get_cache_generation_key()
+        backend = self.get_cache_backend(key)
+        generation = backend.get(key)
+        if generation is None:
+            generation = new_cache_generation()
+            if not backend.add(key, generation, None):
+                generation = backend.get(key, generation)
+        return generation
+
+    async def aget_cache_generation(self) -> int:
+        """Async `get_cache_generation()`."""
+        key = self.get_cache_generation_key()
+        backend = self.get_cache_backend(key)
+        generation = await backend.aget(key)
+        if generation is None:
+            generation = new_cache_generation()
+            if not await backend.aadd(key, generation, None):
+                generation = await backend.aget(key, generation)
+        return generation
+
+    def get_cache_query_string(self) -> str:
+        """Canonical query string: keys sorted, every value of a key kept."""
+        query_params = self.request.query_params  # type: ignore
+        return urlencode(sorted(query_params.lists()), doseq=True)
+
+    def get_cache_vary_values(self) -> list[str]:
+        """Resolve `cache_vary_on` against the current request."""
+        request: Request | None = getattr(self, "request", None)
+        values: list[str] = []
+        if request is None:
+            # Invalidating outside a request: varied keys are versioned.
+            return values
+        for vary in self.cache_vary_on:
+            if callable(vary):
+                value = vary(request)
+            elif vary == "user":
+                user = getattr(request, "user", None)
+                value = user.pk if user and user.is_authenticated else None
+            elif vary == "auth":
+                authenticator = getattr(request, "successful_authenticator", None)
+                value = (
+                    type(authenticator).__name__ if authenticator else None,
+                    getattr(request.auth, "scope", None),
+                )
+            else:
+                value = request.headers.get(vary)
+            values.append(f"{vary if isinstance(vary, str) else ''}={value!r}")
+        return values
+
+    def get_cache_vary_headers(self) -> list[str]:
+        """Header names from `cache_vary_on`, for the response `Vary` header."""
+        return [
+            vary
+            for vary in self.cache_vary_on
+            if isinstance(vary, str) and vary not in ("user", "auth")
+        ]
+
     def get_cache_key(
         self,
         action_type: str,
         pk: Any | str = None,
         action_name: str | None = None,
+        generation: int | None = None,
     ) -> str | None:
+        vary_values = self.get_cache_vary_values() if self.cache_vary_on else []
+
         if action_type in ("list", "custom-list"):
-            query_params = dict(sorted(self.request.query_params.items()))  # type: ignore
-            query_string = json.dumps(query_params, separators=(",", ":"))
-            query_hash = hashlib.md5(query_string.encode()).hexdigest()
+            query_hash = hash_key_parts(self.get_cache_query_string(), *vary_values)
+            if generation is None:
+                generation = self.get_cache_generation()
             if action_type == "list":
-                return f"{self.basename}_list_{query_hash}"  # type: ignore
-            return f"{self.basename}_{action_name}_list_{query_hash}"  # type: ignore
+                return f"{self.basename}_list_v{generation}_{query_hash}"  # type: ignore
+            return f"{self.basename}_{action_name}_list_v{generation}_{query_hash}"  # type: ignore
 
-        if action_type in ("retrieve", "custom-detail") and pk is not None:
+        if action_type in ("retrieve", "custom-detail", "row") and pk is not None:
             if action_type == "retrieve":
-                return f"{self.basename}_detail_{pk}"  # type: ignore
-            return f"{self.basename}_{action_name}_detail_{pk}"  # type: ignore
+                key = f"{self.basename}_detail_{pk}"  # type: ignore
+            elif action_type == "row":
+                key = f"{self.basename}_row_{pk}"  # type: ignore
+            else:
+                key = f"{self.basename}_{action_name}_detail_{pk}"  # type: ignore
+
+            # Varied detail keys cannot be deleted one by one, so they
+            # are versioned like list keys instead.
+            if vary_values:
+                if generation is None:
+                    generation = self.get_cache_generation()
+                key = f"{key}_v{generation}_{hash_key_parts(*vary_values)}"
+            return key
 
         return None
+
+    async def aget_cache_key(
+        self,
+        action_type: str,
+        pk: Any | str = None,
+        action_name: str | None = None,
+    ) -> str | None:
+        """Async `get_cache_key()`: the generation is read without blocking."""
+        generation = None
+        if action_type in ("list", "custom-list") or self.cache_vary_on:
+            generation = await self.aget_cache_generation()
+        return self.get_cache_key(action_type, pk, action_name, generation)
@@ -1,13 +1,72 @@
-from typing import Any
+import copy
+from typing import Any, Callable, Iterable, Sequence
 
+from asgiref.sync import sync_to_async
+from django.core.exceptions import FieldDoesNotExist
+from django.db import close_old_connections
+from django.db.models import Max
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
 from rest_framework.request import Request
+from .._cache_entry import CacheEntry
+from .._cache_lock import CacheLock
+from .._cdn import CdnPurger
+from .._prefetch import (
+    clone_request_with_query,
+    get_next_page_query,
+    submit_prefetch,
+)
+from .._rendered_response import RenderedPayload, RenderedResponse
+from .._tag_index import cache_tag_index
 from ._cache_action_mixin import CacheActionMixin
 
 
 class CacheListRetrieveMixin(CacheActionMixin):
     """Caches list() and retrieve() responses."""
 
+    # Cache the final rendered body instead of serializer data.
+    cache_rendered_response: bool = False
+    cache_rendered_formats: tuple[str, ...] = ("json",)
+
+    # Row-fragment mode: list keys only hold the ordered pks of a page and
+    # every row is cached once under its own `row` key, so updating an
+    # object refreshes one row instead of every cached page.
+    cache_list_fragments: bool = False
+
+    # Tag every cached page with the pks it contains, so updating an object
+    # only drops the pages that show it. Creates and deletes still drop
+    # every page. Leave it off when updates can move rows between pages,
+    # e.g. filters or ordering on fields that change.
+    cache_list_tags: bool = False
+
+    # Field used for Last-Modified on retrieve() when `cache_conditional`
+    # is enabled. Lists only carry an ETag: deleting a row does not move
+    # Max(updated_at), so it cannot prove a page is unchanged.
+    cache_last_modified_field: str | None = "updated_at"
+
+    # Replayed by the `cachewarm` management command: list query strings
+    # and how many detail objects (see `get_cache_warm_pks()`) to warm.
+    cache_warm_queries: tuple[str, ...] = ("",)
+    cache_warm_detail_limit: int = 0
+
+    # After serving page N of a list, fill page N+1 in the background
+    # (on `cache_refresh_executor`) unless it is cached already. At most
+    # `cache_prefetch_concurrency` prefetches run per process.
+    cache_prefetch_next_page: bool = False
+    cache_prefetch_concurrency: int = 2
+
+    # Emit Cache-Control, Surrogate-Control and Surrogate-Key headers so a
+    # CDN can cache the responses, and purge its keys through
+    # `cache_cdn_purger` whenever the Django cache is invalidated. Edges
+    # keep responses `cache_cdn_timeout` seconds (default
+    # `get_cache_timeout()`), browsers `cache_client_timeout` seconds.
+    cache_cdn: bool = False
+    cache_cdn_timeout: int | None = None
+    cache_client_timeout: int = 0
+    cache_cdn_purger: CdnPurger = CdnPurger()
+
     def list(
         self,
         request: Request,
@@ -18,15 +77,54 @@ class CacheListRetrieveMixin(CacheActionMixin):
         if not cache_key:
             return super().list(request, *args, **kwargs)  # type: ignore
 
-        data = self.get_or_set_cache(
-            cache_key,
-            lambda: self._get_list_data(request),  # type: ignore
-        )
-        return Response(data)
+        if self.cache_list_fragments:
+            response = self.get_fragment_list_response(request, cache_key)
+        elif self.cache_rendered_response and not self.can_cache_rendered(request):
+            return super().list(request, *args, **kwargs)  # type: ignore
+        else:
+            response = self.get_cached_response(
+                request,
+                cache_key,
+                lambda: self._get_list_data(request),  # type: ignore
+            )
+
+        self.prefetch_next_page(request, response.data)
+        return response
+
+    async def alist(
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Async `list()`: cache hits never leave the event loop."""
+        cache_key = await self.aget_cache_key("list")
+        if not cache_key or (
+            self.cache_rendered_response and not self.can_cache_rendered(request)
+        ):
+            list_fn = super().list  # type: ignore
+            return await sync_to_async(list_fn)(request, *args, **kwargs)
+
+        if self.cache_list_fragments:
+            response = await sync_to_async(self.get_fragment_list_response)(
+                request, cache_key
+            )
+        else:
+            response = await self.aget_cached_response(
+                request,
+                cache_key,
+                lambda: self._get_list_data(request),  # type: ignore
+            )
+
+        self.prefetch_next_page(request, response.data)
+        return response
 
     def _get_list_data(self, request: Response) -> Any:
         queryset = self.filter_queryset(self.get_queryset())  # type: ignore
         page = self.paginate_queryset(queryset)  # type: ignore
+        if self.cache_list_tags:
+            rows = page if page is not None else queryset
+            self._cache_page_pks = [obj.pk for obj in rows]
         if page is not None:
             serializer = self.get_serializer(page, many=True)  # type: ignore
             return self.get_paginated_response(serializer.data).data  # type: ignore
@@ -45,13 +143,457 @@ class CacheListRetrieveMixin(CacheActionMixin):
         if not cache_key:
             return super().retrieve(request, *args, **kwargs)  # type: ignore
 
-        data = self.get_or_set_cache(
+        if self.cache_rendered_response and not self.can_cache_rendered(request):
+            return super().retrieve(request, *args, **kwargs)  # type: ignore
+
+        if self.cache_conditional:
+            response = self._get_not_modified_on_miss(request, cache_key)
+            if response is not None:
+                return response
+
+        return self.get_cached_response(
+            request,
+            cache_key,
+            lambda: self._get_detail_data(),
+        )
+
+    def get_fragment_list_response(self, request: Request, cache_key: str) -> Response:
+        """
+        Serve a list page assembled from cached row fragments.
+
+        The page entry holds the ordered pks (and pagination data); the rows
+        are read with one `get_many` and only the missing ones are loaded
+        with `in_bulk()` and serialized.
+        """
+        skeleton = self.get_or_set_cache_entry(
+            cache_key, lambda: self._get_list_skeleton(request)
+        ).value
+        rows = self._get_list_rows(skeleton["pks"])
+        if skeleton["page"] is None:
+            data: Any = rows
+        else:
+            data = {**skeleton["page"], "results": rows}
+
+        etag = None
+        if self.cache_conditional:
+            etag, _ = self.get_cache_validators(data)
+        return self._make_cached_response(request, CacheEntry(data, etag=etag))
+
+    def _get_list_skeleton(self, request: Request) -> dict[str, Any]:
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        page = self.paginate_queryset(queryset)  # type: ignore
+        objects = list(queryset if page is None else page)
+
+        # The objects are loaded anyway: store their rows right away.
+        rows = self.get_serializer(objects, many=True).data  # type: ignore
+        self.set_many_cache_entries(
+            {
+                self.get_cache_key("row", pk=obj.pk): row  # type: ignore
+                for obj, row in zip(objects, rows)
+            }
+        )
+
+        skeleton: dict[str, Any] = {"pks": [obj.pk for obj in objects], "page": None}
+        if page is not None:
+            paginated = self.get_paginated_response([]).data  # type: ignore
+            skeleton["page"] = {**paginated, "results": None}
+        return skeleton
+
+    def _get_list_rows(self, pks: Sequence[Any]) -> Sequence[Any]:
+        keys = {pk: self.get_cache_key("row", pk=pk) for pk in pks}
+        entries = self.get_many_cache_entries(list(keys.values()))
+        rows = {pk: entries[key].value for pk, key in keys.items() if key in entries}
+
+        missing = [pk for pk in pks if pk not in rows]
+        if missing:
+            objects = self.get_queryset().in_bulk(missing)  # type: ignore
+            serialized = self.get_serializer(  # type: ignore
+                list(objects.values()), many=True
+            ).data
+            fresh = dict(zip(objects, serialized))
+            self.set_many_cache_entries({keys[pk]: row for pk, row in fresh.items()})
+            rows.update(fresh)
+
+        # Rows deleted since the page was cached are skipped.
+        return [rows[pk] for pk in pks if pk in rows]
+
+    async def aretrieve(
+        self,
+        request: Request,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Response:
+        """Async `retrieve()`: cache hits never leave the event loop."""
+        pk = self.kwargs.get("pk")  # type: ignore
+        cache_key = await self.aget_cache_key("retrieve", pk=pk)  # type: ignore
+        if not cache_key or (
+            self.cache_rendered_response and not self.can_cache_rendered(request)
+        ):
+            retrieve_fn = super().retrieve  # type: ignore
+            return await sync_to_async(retrieve_fn)(request, *args, **kwargs)
+
+        if self.cache_conditional:
+            response = await self._aget_not_modified_on_miss(request, cache_key)
+            if response is not None:
+                return response
+
+        return await self.aget_cached_response(
+            request,
             cache_key,
             lambda: self._get_detail_data(),
         )
-        return Response(data)
 
     def _get_detail_data(self) -> Any:
         instance = self.get_object()  # type: ignore
         serializer = self.get_serializer(instance)  # type: ignore
         return serializer.data  # type: ignore
+
+    def prefetch_next_page(self, request: Request, data: Any = None) -> None:
+        """
+        Schedule a background fill of the next page of a list. Does no
+        cache I/O itself, so it is also safe to call from `alist()`.
+        """
+        if not self.cache_prefetch_next_page:
+            return
+        paginator = self.paginator  # type: ignore
+        page_query_param = getattr(paginator, "page_query_param", None)
+        if page_query_param is None:
+            return
+        query = get_next_page_query(request, page_query_param, data)
+        if query is None:
+            return
+
+        view = copy.copy(self)
+        view.request = clone_request_with_query(request, query)  # type: ignore
+        # The paginator holds the page of the request it paginated.
+        view.__dict__.pop("_paginator", None)
+        submit_prefetch(
+            self.get_cache_refresh_executor(),
+            self.cache_prefetch_concurrency,
+            view._prefetch_list,
+        )
+
+    def _prefetch_list(self) -> None:
+        close_old_connections()
+        try:
+            request: Request = self.request  # type: ignore
+            cache_key = self.get_cache_key("list")
+            if not cache_key or self.get_cache_backend(cache_key).has_key(cache_key):
+                return
+
+            lock = CacheLock(f"{cache_key}:refresh", timeout=self.cache_lock_timeout)
+            if not lock.acquire():
+                return
+            try:
+                if self.cache_list_fragments:
+                    self._fill_cache(
+                        cache_key, lambda: self._get_list_skeleton(request)
+                    )
+                else:
+                    self._fill_cache(
+                        cache_key,
+                        self._get_cache_fill(
+                            request, lambda: self._get_list_data(request)
+                        ),
+                    )
+            finally:
+                lock.release()
+        except NotFound:
+            # Past the last page.
+            pass
+        finally:
+            close_old_connections()
+
+    def get_cache_tag(self, pk: Any) -> str:
+        return f"{self.basename}_tag_{pk}"  # type: ignore
+
+    def get_cache_tags(self, data: Any) -> Sequence[str] | None:
+        """Tag list pages with the pks captured by `_get_list_data()`."""
+        if not self.cache_list_tags or self.cache_list_fragments:
+            return None
+        if getattr(self, "action", None) != "list":
+            return None
+        pks = getattr(self, "_cache_page_pks", None)
+        if pks is None:
+            return None
+        return [self.get_cache_tag(pk) for pk in pks]
+
+    def invalidate_cache_rows(self, pks: Iterable[Any]) -> None:
+        """
+        Invalidate the cache after the given rows changed but none was
+        created or deleted: list pages that do not show them are kept.
+        """
+        pks = list(pks)
+        # Rendered pages carry no row keys, so the edge drops every page.
+        self.purge_cdn_cache(pks, lists=self.cache_rendered_response)
+        self.delete_detail_cache(pks)
+        if self.cache_list_fragments:
+            # Pages only hold pks: refreshing the rows is enough. Rows of
+            # other variants are versioned, so only a new generation
+            # drops them.
+            if self.cache_vary_on:
+                self.bump_cache_generation()
+            return
+        if not self.cache_list_tags or self.cache_vary_on:
+            # Detail keys of other variants are versioned as well.
+            self.bump_cache_generation()
+            return
+
+        self.record_cache_metric("invalidations", len(pks))
+        cache_tag_index.invalidate(
+            [self.get_cache_tag(pk) for pk in pks],
+            local_cache=self.local_cache,
+        )
+
+    def get_surrogate_key(self, pk: Any | None = None) -> str:
+        """CDN key of the object `pk`, or of every list page."""
+        suffix = "list" if pk is None else pk
+        return f"{self.basename}-{suffix}"  # type: ignore
+
+    def get_surrogate_keys(self, data: Any) -> Sequence[str]:
+        """
+        CDN keys of a response: the basename, the object on retrieve(), and
+        on list() the page plus every row it shows, so updating an object
+        purges exactly the edge pages that display it.
+        """
+        keys = [self.basename]  # type: ignore
+        action = getattr(self, "action", None)
+        if action == "retrieve":
+            return keys + [self.get_surrogate_key(self.kwargs.get("pk"))]  # type: ignore
+        if action != "list":
+            return keys
+
+        keys.append(self.get_surrogate_key())
+        rows = data.get("results") if isinstance(data, dict) else data
+        if isinstance(rows, Sequence) and not isinstance(rows, (str, bytes)):
+            for row in rows:
+                pk = row.get("id", row.get("pk")) if isinstance(row, dict) else None
+                if pk is not None:
+                    keys.append(self.get_surrogate_key(pk))
+        return keys
+
+    def get_cdn_headers(self, data: Any) -> dict[str, str]:
+        """Cache-Control and surrogate headers of a cached response."""
+        if self.is_cdn_private():
+            # Per-user responses must never be shared by an edge.
+            return {"Cache-Control": "private, no-store"}
+
+        timeout = self.cache_cdn_timeout
+        if timeout is None:
+            timeout = self.get_cache_timeout()
+        return {
+            "Cache-Control": (
+                f"public, max-age={self.cache_client_timeout}, s-maxage={timeout}"
+            ),
+            "Surrogate-Control": f"max-age={timeout}",
+            "Surrogate-Key": " ".join(self.get_surrogate_keys(data)),
+        }
+
+    def is_cdn_private(self) -> bool:
+        """
+        True when the response may depend on who sent the request: it
+        varies on "user" / "auth", or the request is authenticated.
+        """
+        if any(vary in ("user", "auth") for vary in self.cache_vary_on):
+            return True
+        request: Request | None = getattr(self, "request", None)
+        if request is None:
+            return False
+        user = getattr(request, "user", None)
+        return (
+            (user is not None and user.is_authenticated)
+            or getattr(request, "auth", None) is not None
+            or "Authorization" in request.headers
+        )
+
+    def purge_cdn_cache(self, pks: Iterable[Any] = (), lists: bool = True) -> None:
+        """Purge the CDN keys of `pks`, and of the list pages, on commit."""
+        if not self.cache_cdn:
+            return
+        keys = [self.get_surrogate_key(pk) for pk in pks if pk is not None]
+        if lists:
+            keys.append(self.get_surrogate_key())
+        self.cache_cdn_purger.purge_on_commit(keys)
+
+    def get_cache_warm_pks(self, limit: int) -> Sequence[Any]:
+        """Detail pks warmed by `cachewarm`: the first `limit` list rows."""
+        queryset = self.filter_queryset(self.get_queryset())  # type: ignore
+        return list(queryset.values_list("pk", flat=True)[:limit])
+
+    def can_cache_rendered(self, request: Request) -> bool:
+        """
+        Only cache the canonical representation of whitelisted formats.
+
+        Media types with parameters (e.g. `indent=4`) and renderers such as
+        the browsable API produce request-specific output and are served
+        uncached.
+        """
+        renderer = getattr(request, "accepted_renderer", None)
+        if renderer is None or renderer.format not in self.cache_rendered_formats:
+            return False
+        return request.accepted_media_type == renderer.media_type
+
+    def get_cached_response(
+        self,
+        request: Request,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+    ) -> Response:
+        """
+        Serve `cache_key` as a response, filling it from `data_fn` on a miss.
+
+        Stores rendered bytes when `cache_rendered_response` is enabled and
+        answers matching conditional requests with 304 Not Modified.
+        """
+        entry = self.get_or_set_cache_entry(
+            cache_key, self._get_cache_fill(request, data_fn)
+        )
+        return self._make_cached_response(request, entry)
+
+    async def aget_cached_response(
+        self,
+        request: Request,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+    ) -> Response:
+        """Async `get_cached_response()`; `data_fn` runs in a thread on a miss."""
+        entry = await self.aget_or_set_cache_entry(
+            cache_key, self._get_cache_fill(request, data_fn)
+        )
+        return self._make_cached_response(request, entry)
+
+    def _get_cache_fill(
+        self,
+        request: Request,
+        data_fn: Callable[[], Any],
+    ) -> Callable[[], Any]:
+        def fill() -> Any:
+            if self.cache_rendered_response:
+                return self._render_payload(request, data_fn())
+            return data_fn()
+
+        return fill
+
+    def _make_cached_response(self, request: Request, entry: CacheEntry) -> Response:
+        headers = self.get_validator_headers(entry)
+        if self.cache_cdn:
+            headers.update(self.get_cdn_headers(entry.value))
+        if self.cache_conditional:
+            # 304 Not Modified, or 412 Precondition Failed for If-Match.
+            conditional = get_conditional_response(
+                request,  # type: ignore
+                etag=entry.etag,
+                last_modified=entry.last_modified,
+            )
+            if conditional is not None:
+                return Response(status=conditional.status_code, headers=headers)
+
+        if isinstance(entry.value, RenderedPayload):
+            response = RenderedResponse(entry.value, headers=headers)
+        else:
+            response = Response(entry.value, headers=headers)
+        vary_headers = self.get_cache_vary_headers()
+        if vary_headers:
+            patch_vary_headers(response, vary_headers)
+        return response
+
+    def _render_payload(self, request: Request, data: Any) -> RenderedPayload:
+        renderer = request.accepted_renderer
+        context = self.get_renderer_context()  # type: ignore
+        content = renderer.render(data, request.accepted_media_type, context)
+        if isinstance(content, str):
+            content = content.encode(renderer.charset or "utf-8")
+
+        content_type = renderer.media_type
+        if renderer.charset:
+            content_type = f"{content_type}; charset={renderer.charset}"
+        return RenderedPayload.from_content(content, content_type)
+
+    def get_cache_validators(self, data: Any) -> tuple[str | None, int | None]:
+        etag, _ = super().get_cache_validators(data)
+        # Detail entries, also those written through by update().
+        if getattr(self, "action", None) not in (
+            "retrieve",
+            "update",
+            "partial_update",
+        ):
+            return etag, None
+        return etag, self.get_last_modified()
+
+    def get_last_modified(self) -> int | None:
+        """
+        Return the Max(`cache_last_modified_field`) timestamp of the object
+        being retrieved, or None when the model has no such field.
+        """
+        field = self.cache_last_modified_field
+        if not field:
+            return None
+
+        queryset = self.get_queryset()  # type: ignore
+        try:
+            queryset.model._meta.get_field(field)
+        except FieldDoesNotExist:
+            return None
+
+        lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field  # type: ignore
+        queryset = self.filter_queryset(queryset).filter(  # type: ignore
+            **{self.lookup_field: self.kwargs[lookup_url_kwarg]}  # type: ignore
+        )
+        last_modified = queryset.aggregate(last_modified=Max(field))["last_modified"]
+        return int(last_modified.timestamp()) if last_modified else None
+
+    def get_validator_headers(self, entry: CacheEntry) -> dict[str, str]:
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["ETag"] = entry.etag
+        if entry.last_modified:
+            headers["Last-Modified"] = http_date(entry.last_modified)
+        return headers
+
+    def _get_not_modified_on_miss(
+        self,
+        request: Request,
+        cache_key: str,
+    ) -> Response | None:
+        """
+        Answer If-Modified-Since on a cache miss with one aggregate query,
+        before anything is serialized.
+        """
+        meta = request.META
+        if "HTTP_IF_MODIFIED_SINCE" not in meta or "HTTP_IF_NONE_MATCH" in meta:
+            return None
+        if self.get_cache_entry(cache_key) is not None:
+            return None
+        return self._get_not_modified(request, self.get_last_modified())
+
+    async def _aget_not_modified_on_miss(
+        self,
+        request: Request,
+        cache_key: str,
+    ) -> Response | None:
+        meta = request.META
+        if "HTTP_IF_MODIFIED_SINCE" not in meta or "HTTP_IF_NONE_MATCH" in meta:
+            return None
+        if await self.aget_cache_entry(cache_key) is not None:
+            return None
+        return self._get_not_modified(
+            request, await sync_to_async(self.get_last_modified)()
+        )
+
+    def _get_not_modified(
+        self,
+        request: Request,
+        last_modified: int | None,
+    ) -> Response | None:
+        if not last_modified:
+            return None
+        conditional = get_conditional_response(
+            request,  # type: ignore
+            last_modified=last_modified,
+        )
+        if conditional is None:
+            return None
+        return Response(
+            status=conditional.status_code,
+            headers={"Last-Modified": http_date(last_modified)},
+        )
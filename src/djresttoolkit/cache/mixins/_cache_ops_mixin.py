@@ -1,24 +1,579 @@
-from typing import Any, Callable
+import asyncio
+import hashlib
+import inspect
+import json
+import logging
+import pickle
+import time
+from concurrent.futures import Executor
+from typing import Any, Callable, Iterable, Sequence
 
-from django.core.cache import cache
+from asgiref.sync import sync_to_async
+from django.core.cache.backends.base import BaseCache
+from django.db import close_old_connections
+from django.http import Http404
+from rest_framework.utils.encoders import JSONEncoder
 
+from .._cache_entry import CacheEntry
+from .._cache_lock import CacheLock
+from .._compression import decode_value, encode_value, get_compressor
+from .._executors import get_default_executor
+from .._invalidation import ainvalidate_keys, invalidate_keys
+from .._local_cache import LocalCache
+from .._metrics import CacheMetrics, cache_metrics
+from .._not_found import CachedNotFound
+from .._rendered_response import RenderedPayload
+from .._tag_index import cache_tag_index
 from ._cache_key_mixin import CacheKeyMixin
 
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+# Strong references to running async refreshes.
+_refresh_tasks: set[asyncio.Task[None]] = set()
+
 
 class CacheOpsMixin(CacheKeyMixin):
     """Handles getting, setting, and invalidating cache."""
 
+    # Single-flight: only one process recomputes a missing key.
+    cache_single_flight: bool = False
+    cache_lock_timeout: int = 10
+    cache_lock_wait: float = 5.0
+    cache_lock_poll_interval: float = 0.05
+
+    # Stale-while-revalidate: seconds a value is still served after
+    # `get_cache_timeout()` while one background refresh recomputes it.
+    cache_stale_timeout: int | None = None
+    cache_refresh_executor: Executor | None = None
+
+    # Optional in-process L1 tier in front of the Django cache.
+    local_cache: LocalCache | None = None
+
+    # Pickle plain (uncompressed, unrendered) entries to count their
+    # bytes against `local_cache.max_bytes`. Otherwise only `max_entries`
+    # bounds them, so L2 hits are not pickled again.
+    local_cache_exact_size: bool = False
+
+    # Store ETag / Last-Modified validators with every entry.
+    cache_conditional: bool = False
+
+    # Compress entries whose pickle is at least this many bytes
+    # (None disables) with a registered compressor: zlib, lz4 or zstd.
+    cache_compress_min_size: int | None = None
+    cache_compressor: str = "zlib"
+
+    # Seconds an `Http404` raised by `data_fn` is cached (None disables).
+    # The create path clears it by bumping the cache generation.
+    cache_not_found_timeout: int | None = None
+
+    # Hit / miss / fill counters per (basename, action), None disables.
+    cache_metrics: CacheMetrics | None = cache_metrics
+
+    # Pickle uncompressed entries to record `payload_bytes`. Compressed
+    # entries are always measured, since their bytes already exist.
+    cache_metrics_payload_size: bool = False
+
+    def get_cache_refresh_executor(self) -> Executor:
+        return self.cache_refresh_executor or get_default_executor()
+
+    def get_cache_metrics_family(self) -> tuple[str, str]:
+        return (
+            str(getattr(self, "basename", None) or ""),
+            str(getattr(self, "action", None) or ""),
+        )
+
+    def record_cache_metric(self, name: str, value: float = 1.0) -> None:
+        if self.cache_metrics is not None:
+            self.cache_metrics.record(self.get_cache_metrics_family(), name, value)
+
+    def get_cache_generation(self) -> int:
+        if self.local_cache is None:
+            return super().get_cache_generation()
+
+        key = self.get_cache_generation_key()
+        generation = self.local_cache.get(key)
+        if generation is None:
+            generation = super().get_cache_generation()
+            self.local_cache.set(key, generation, size=0)
+        return generation
+
+    async def aget_cache_generation(self) -> int:
+        if self.local_cache is None:
+            return await super().aget_cache_generation()
+
+        key = self.get_cache_generation_key()
+        generation = self.local_cache.get(key)
+        if generation is None:
+            generation = await super().aget_cache_generation()
+            self.local_cache.set(key, generation, size=0)
+        return generation
+
     def get_or_set_cache(
         self,
         cache_key: str,
         data_fn: Callable[[], Any],
         timeout: int | None = None,
     ) -> Any:
-        data = cache.get(cache_key)
-        if data is None:
+        return self.get_or_set_cache_entry(cache_key, data_fn, timeout).value
+
+    def get_or_set_cache_entry(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """Same as `get_or_set_cache`, but return the whole `CacheEntry`."""
+        entry = self._get_live_cache_entry(cache_key)
+        if entry is not None:
+            self.record_cache_metric("hits")
+            if entry.is_stale():
+                self.record_cache_metric("stale_hits")
+                self._schedule_cache_refresh(cache_key, data_fn, timeout)
+            return entry
+
+        self.record_cache_metric("misses")
+        if self.cache_single_flight and self.is_cache_available(cache_key):
+            return self._fill_cache_single_flight(cache_key, data_fn, timeout)
+        return self._fill_cache(cache_key, data_fn, timeout)
+
+    async def aget_or_set_cache(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> Any:
+        """
+        Async `get_or_set_cache()`. `data_fn` may be a sync function, run
+        in a thread, or an `async def` function.
+        """
+        entry = await self.aget_or_set_cache_entry(cache_key, data_fn, timeout)
+        return entry.value
+
+    async def aget_or_set_cache_entry(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """Async `get_or_set_cache_entry()`."""
+        entry = await self._aget_live_cache_entry(cache_key)
+        if entry is not None:
+            self.record_cache_metric("hits")
+            if entry.is_stale():
+                self.record_cache_metric("stale_hits")
+                await self._aschedule_cache_refresh(cache_key, data_fn, timeout)
+            return entry
+
+        self.record_cache_metric("misses")
+        if self.cache_single_flight and self.is_cache_available(cache_key):
+            return await self._afill_cache_single_flight(cache_key, data_fn, timeout)
+        return await self._afill_cache(cache_key, data_fn, timeout)
+
+    def _get_live_cache_entry(self, cache_key: str) -> CacheEntry | None:
+        """`get_cache_entry()` that raises `Http404` for cached misses."""
+        entry = self.get_cache_entry(cache_key)
+        if entry is not None and not cache_tag_index.is_current(entry.tags):
+            return None
+        if entry is None or not isinstance(entry.value, CachedNotFound):
+            return entry
+        if entry.value.generation != self.get_cache_generation():
+            return None
+        self.record_cache_metric("hits")
+        raise Http404(*entry.value.args)
+
+    async def _aget_live_cache_entry(self, cache_key: str) -> CacheEntry | None:
+        entry = await self.aget_cache_entry(cache_key)
+        if entry is not None and not await cache_tag_index.ais_current(entry.tags):
+            return None
+        if entry is None or not isinstance(entry.value, CachedNotFound):
+            return entry
+        if entry.value.generation != await self.aget_cache_generation():
+            return None
+        self.record_cache_metric("hits")
+        raise Http404(*entry.value.args)
+
+    def get_cache_entry(self, cache_key: str) -> CacheEntry | None:
+        """Read a key and wrap values stored without an envelope."""
+        if self.local_cache is not None:
+            entry = self.local_cache.get(cache_key)
+            if entry is not None:
+                return entry
+        backend = self.get_cache_backend(cache_key)
+        return self._load_cache_entry(cache_key, backend.get(cache_key))
+
+    async def aget_cache_entry(self, cache_key: str) -> CacheEntry | None:
+        """Async `get_cache_entry()`."""
+        if self.local_cache is not None:
+            entry = self.local_cache.get(cache_key)
+            if entry is not None:
+                return entry
+        backend = self.get_cache_backend(cache_key)
+        return self._load_cache_entry(cache_key, await backend.aget(cache_key))
+
+    def get_many_cache_entries(self, cache_keys: list[str]) -> dict[str, CacheEntry]:
+        """Read several keys with one `get_many` round-trip per cache alias."""
+        entries: dict[str, CacheEntry] = {}
+        if self.local_cache is not None:
+            for cache_key in cache_keys:
+                entry = self.local_cache.get(cache_key)
+                if entry is not None:
+                    entries[cache_key] = entry
+
+        missing: dict[BaseCache, list[str]] = {}
+        for cache_key in cache_keys:
+            if cache_key not in entries:
+                backend = self.get_cache_backend(cache_key)
+                missing.setdefault(backend, []).append(cache_key)
+
+        for backend, keys in missing.items():
+            for cache_key, value in backend.get_many(keys).items():
+                entry = self._load_cache_entry(cache_key, value)
+                if entry is not None:
+                    entries[cache_key] = entry
+        return entries
+
+    def _load_cache_entry(self, cache_key: str, raw: Any) -> CacheEntry | None:
+        value = decode_value(raw)
+        if value is None:
+            return None
+
+        entry = value if isinstance(value, CacheEntry) else CacheEntry(value)
+        if self.local_cache is not None:
+            self.local_cache.set(
+                cache_key, entry, size=self._get_local_cache_size(raw, entry)
+            )
+        return entry
+
+    def _get_local_cache_size(self, raw: Any, entry: CacheEntry) -> int | None:
+        """
+        Bytes `local_cache` counts for `entry`, from what is already at
+        hand: the encoded backend payload, or the body of a rendered
+        response. None makes `LocalCache` pickle the entry.
+        """
+        if isinstance(raw, bytes):
+            return len(raw)
+        if isinstance(entry.value, RenderedPayload):
+            return len(entry.value.content)
+        return None if self.local_cache_exact_size else 0
+
+    def set_cache_entry(
+        self,
+        cache_key: str,
+        data: Any,
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """Store `data` with its soft expiry and the hard backend timeout."""
+        entry, value, timeout = self._make_cache_entry(data, timeout)
+        for alias in self.get_cache_aliases(cache_key):
+            self.get_alias_backend(alias).set(cache_key, value, timeout)
+        self._cache_entry_stored(cache_key, entry, value, timeout)
+        return entry
+
+    async def aset_cache_entry(
+        self,
+        cache_key: str,
+        data: Any,
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """Async `set_cache_entry()`."""
+        tags = self.get_cache_tags(data)
+        if self.cache_conditional or tags:
+            # Validators may query the database, tag stamps read the cache.
+            made = await sync_to_async(self._make_cache_entry)(data, timeout)
+        else:
+            made = self._make_cache_entry(data, timeout)
+        entry, value, timeout = made
+        for alias in self.get_cache_aliases(cache_key):
+            await self.get_alias_backend(alias).aset(cache_key, value, timeout)
+        if tags:
+            # Tagging writes the tag index with the sync client.
+            await sync_to_async(self._cache_entry_stored)(
+                cache_key, entry, value, timeout
+            )
+        else:
+            self._cache_entry_stored(cache_key, entry, value, timeout)
+        return entry
+
+    def set_many_cache_entries(
+        self,
+        data: dict[str, Any],
+        timeout: int | None = None,
+    ) -> dict[str, CacheEntry]:
+        """Store several values with one `set_many` round-trip per cache alias."""
+        made = {
+            cache_key: self._make_cache_entry(value, timeout)
+            for cache_key, value in data.items()
+        }
+        if not made:
+            return {}
+
+        backend_timeout = next(iter(made.values()))[2]
+        values: dict[str, dict[str, Any]] = {}
+        for cache_key, (_, value, _) in made.items():
+            for alias in self.get_cache_aliases(cache_key):
+                values.setdefault(alias, {})[cache_key] = value
+        for alias, alias_values in values.items():
+            self.get_alias_backend(alias).set_many(alias_values, backend_timeout)
+        for cache_key, (entry, value, _) in made.items():
+            self._cache_entry_stored(cache_key, entry, value, backend_timeout)
+        return {cache_key: entry for cache_key, (entry, _, _) in made.items()}
+
+    def _make_cache_entry(
+        self,
+        data: Any,
+        timeout: int | None,
+    ) -> tuple[CacheEntry, Any, int]:
+        """Return the entry, its encoded value and the backend timeout."""
+        timeout = timeout or self.get_cache_timeout()
+        stale_at = None
+        if self.cache_stale_timeout:
+            stale_at = time.time() + timeout
+            timeout += self.cache_stale_timeout
+
+        etag, last_modified = None, None
+        if self.cache_conditional:
+            etag, last_modified = self.get_cache_validators(data)
+
+        tags = self.get_cache_tags(data)
+        stamp = cache_tag_index.stamp(tags) if tags else None
+
+        entry = CacheEntry(data, stale_at, etag, last_modified, stamp)
+        return entry, self._encode_cache_entry(entry), timeout
+
+    def _cache_entry_stored(
+        self,
+        cache_key: str,
+        entry: CacheEntry,
+        value: Any,
+        timeout: int,
+    ) -> None:
+        tags = self.get_cache_tags(entry.value)
+        if tags:
+            cache_tag_index.add(
+                cache_key, tags, timeout, self.get_cache_aliases(cache_key)
+            )
+
+        # Compressed entries are already bytes. Other values are only
+        # pickled when `cache_metrics_payload_size` needs their size.
+        size = len(value) if isinstance(value, bytes) else None
+        if (
+            size is None
+            and self.cache_metrics is not None
+            and self.cache_metrics_payload_size
+        ):
+            size = len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+        if self.cache_metrics is not None and size is not None:
+            self.record_cache_metric("stores")
+            self.record_cache_metric("payload_bytes", size)
+        if self.local_cache is not None:
+            if size is None:
+                size = self._get_local_cache_size(value, entry)
+            self.local_cache.set(cache_key, entry, timeout, size=size)
+
+    def _encode_cache_entry(self, entry: CacheEntry) -> Any:
+        if self.cache_compress_min_size is None:
+            return entry
+        return encode_value(
+            entry,
+            get_compressor(self.cache_compressor),
+            self.cache_compress_min_size,
+        )
+
+    def get_cache_tags(self, data: Any) -> Sequence[str] | None:
+        """Tags (see `CacheTagIndex`) of a value about to be stored."""
+        return None
+
+    def get_cache_validators(self, data: Any) -> tuple[str | None, int | None]:
+        """
+        Return the (ETag, Last-Modified timestamp) stored with an entry.
+
+        The ETag is a strong validator hashed from the JSON encoding of
+        `data`, or taken from the payload when the body was pre-rendered.
+        """
+        if isinstance(data, RenderedPayload):
+            return data.etag, None
+        try:
+            content = json.dumps(data, cls=JSONEncoder, separators=(",", ":"))
+        except TypeError:
+            return None, None
+        return f'"{hashlib.md5(content.encode()).hexdigest()}"', None
+
+    def _fill_cache(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        start = time.perf_counter()
+        try:
             data = data_fn()
-            cache.set(cache_key, data, timeout or self.get_cache_timeout())
-        return data
+        except Http404 as error:
+            if self.cache_not_found_timeout:
+                self._set_not_found(cache_key, error, self.get_cache_generation())
+            raise
+        self.record_cache_metric("fills")
+        self.record_cache_metric("fill_seconds", time.perf_counter() - start)
+        return self.set_cache_entry(cache_key, data, timeout)
+
+    def _set_not_found(self, cache_key: str, error: Http404, generation: int) -> None:
+        entry = CacheEntry(CachedNotFound(generation, error.args))
+        timeout = self.cache_not_found_timeout
+        value = self._encode_cache_entry(entry)
+        for alias in self.get_cache_aliases(cache_key):
+            self.get_alias_backend(alias).set(cache_key, value, timeout)
+        if self.local_cache is not None:
+            self.local_cache.set(cache_key, entry, timeout)
+
+    async def _afill_cache(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        start = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(data_fn):
+                data = await data_fn()
+            else:
+                data = await sync_to_async(data_fn)()
+        except Http404 as error:
+            if self.cache_not_found_timeout:
+                generation = await self.aget_cache_generation()
+                await sync_to_async(self._set_not_found)(cache_key, error, generation)
+            raise
+        self.record_cache_metric("fills")
+        self.record_cache_metric("fill_seconds", time.perf_counter() - start)
+        return await self.aset_cache_entry(cache_key, data, timeout)
+
+    def _fill_cache_single_flight(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """
+        Recompute a missing key under a short-lived lock.
+
+        Callers that lose the race poll the cache until the lock holder
+        has stored the value, and compute it themselves once
+        `cache_lock_wait` seconds have passed.
+        """
+        lock = CacheLock(f"{cache_key}:lock", timeout=self.cache_lock_timeout)
+        deadline = time.monotonic() + self.cache_lock_wait
+
+        while not lock.acquire():
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for cache fill of '{cache_key}'.")
+                return self._fill_cache(cache_key, data_fn, timeout)
+
+            time.sleep(self.cache_lock_poll_interval)
+            entry = self._get_live_cache_entry(cache_key)
+            if entry is not None:
+                return entry
+
+        try:
+            # The previous lock holder may have filled the key already.
+            entry = self._get_live_cache_entry(cache_key)
+            if entry is not None:
+                return entry
+            return self._fill_cache(cache_key, data_fn, timeout)
+        finally:
+            lock.release()
+
+    async def _afill_cache_single_flight(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> CacheEntry:
+        """Async `_fill_cache_single_flight()`, polling without blocking."""
+        lock = CacheLock(f"{cache_key}:lock", timeout=self.cache_lock_timeout)
+        deadline = time.monotonic() + self.cache_lock_wait
+
+        while not await lock.aacquire():
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for cache fill of '{cache_key}'.")
+                return await self._afill_cache(cache_key, data_fn, timeout)
+
+            await asyncio.sleep(self.cache_lock_poll_interval)
+            entry = await self._aget_live_cache_entry(cache_key)
+            if entry is not None:
+                return entry
+
+        try:
+            entry = await self._aget_live_cache_entry(cache_key)
+            if entry is not None:
+                return entry
+            return await self._afill_cache(cache_key, data_fn, timeout)
+        finally:
+            await lock.arelease()
+
+    def _schedule_cache_refresh(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> None:
+        """Submit one background refresh per stale key across processes."""
+        lock = CacheLock(f"{cache_key}:refresh", timeout=self.cache_lock_timeout)
+        if not lock.acquire():
+            return
+
+        try:
+            self.get_cache_refresh_executor().submit(
+                self._refresh_cache, cache_key, data_fn, timeout, lock
+            )
+        except RuntimeError:
+            # Executor is shutting down, the next caller will retry.
+            lock.release()
+
+    def _refresh_cache(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None,
+        lock: CacheLock,
+    ) -> None:
+        close_old_connections()
+        try:
+            self._fill_cache(cache_key, data_fn, timeout)
+        except Exception:
+            logger.exception(f"Background refresh of '{cache_key}' failed.")
+        finally:
+            lock.release()
+            close_old_connections()
+
+    async def _aschedule_cache_refresh(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None = None,
+    ) -> None:
+        """Start one background refresh task per stale key across processes."""
+        lock = CacheLock(f"{cache_key}:refresh", timeout=self.cache_lock_timeout)
+        if not await lock.aacquire():
+            return
+
+        task = asyncio.create_task(
+            self._arefresh_cache(cache_key, data_fn, timeout, lock)
+        )
+        _refresh_tasks.add(task)
+        task.add_done_callback(_refresh_tasks.discard)
+
+    async def _arefresh_cache(
+        self,
+        cache_key: str,
+        data_fn: Callable[[], Any],
+        timeout: int | None,
+        lock: CacheLock,
+    ) -> None:
+        try:
+            await self._afill_cache(cache_key, data_fn, timeout)
+        except Exception:
+            logger.exception(f"Background refresh of '{cache_key}' failed.")
+        finally:
+            await lock.arelease()
 
     def invalidate_cache(
         self,
@@ -26,22 +581,99 @@ class CacheOpsMixin(CacheKeyMixin):
         custom_actions: list[str] | None = None,
     ) -> None:
         if pk:
-            key = self.get_cache_key("retrieve", pk=pk)
-            if key:
-                cache.delete(key)
+            self.delete_detail_cache([pk], custom_actions)
+        self.bump_cache_generation()
 
-            if custom_actions:
-                for action in custom_actions:
-                    key = self.get_cache_key(
+    async def ainvalidate_cache(
+        self,
+        pk: Any | None = None,
+        custom_actions: list[str] | None = None,
+    ) -> None:
+        """Async `invalidate_cache()`."""
+        if pk:
+            await self.adelete_detail_cache([pk], custom_actions)
+        await self.abump_cache_generation()
+
+    def delete_detail_cache(
+        self,
+        pks: Iterable[Any],
+        custom_actions: list[str] | None = None,
+    ) -> None:
+        """Delete the retrieve (and custom-detail) entries of the given pks."""
+        delete_keys = self._get_detail_cache_keys(pks, custom_actions)
+        self.record_cache_metric("invalidations", len(delete_keys))
+        for alias, keys in self._group_cache_keys(delete_keys).items():
+            invalidate_keys(
+                delete_keys=keys,
+                local_cache=self.local_cache,
+                cache_alias=alias,
+            )
+
+    async def adelete_detail_cache(
+        self,
+        pks: Iterable[Any],
+        custom_actions: list[str] | None = None,
+    ) -> None:
+        """Async `delete_detail_cache()`."""
+        generation = None
+        if self.cache_vary_on:
+            generation = await self.aget_cache_generation()
+        delete_keys = self._get_detail_cache_keys(pks, custom_actions, generation)
+        self.record_cache_metric("invalidations", len(delete_keys))
+        for alias, keys in self._group_cache_keys(delete_keys).items():
+            await ainvalidate_keys(
+                delete_keys=keys,
+                local_cache=self.local_cache,
+                cache_alias=alias,
+            )
+
+    def _group_cache_keys(self, cache_keys: Iterable[str]) -> dict[str, list[str]]:
+        """Group keys by every cache alias they must be deleted from."""
+        grouped: dict[str, list[str]] = {}
+        for cache_key in cache_keys:
+            for alias in self.get_invalidation_aliases(cache_key):
+                grouped.setdefault(alias, []).append(cache_key)
+        return grouped
+
+    def _get_detail_cache_keys(
+        self,
+        pks: Iterable[Any],
+        custom_actions: list[str] | None = None,
+        generation: int | None = None,
+    ) -> list[str]:
+        keys: list[str | None] = []
+        for pk in pks:
+            keys.append(self.get_cache_key("retrieve", pk=pk, generation=generation))
+            keys.append(self.get_cache_key("row", pk=pk, generation=generation))
+            for action in custom_actions or []:
+                keys.append(
+                    self.get_cache_key(
                         "custom-detail",
                         pk=pk,
                         action_name=action,
+                        generation=generation,
                     )
-                    if key:
-                        cache.delete(key)
-
-        if hasattr(cache, "delete_pattern"):
-            cache.delete_pattern(f"{self.basename}_list_*")  # type: ignore
-            if custom_actions:
-                for action in custom_actions:
-                    cache.delete_pattern(f"{self.basename}_{action}_list_*")  # type: ignore
+                )
+        return [key for key in keys if key]
+
+    def bump_cache_generation(self) -> None:
+        """Invalidate every cached list page of this basename in O(1)."""
+        self.record_cache_metric("invalidations")
+        key = self.get_cache_generation_key()
+        for alias in self.get_invalidation_aliases(key):
+            invalidate_keys(
+                generation_keys=[key],
+                local_cache=self.local_cache,
+                cache_alias=alias,
+            )
+
+    async def abump_cache_generation(self) -> None:
+        """Async `bump_cache_generation()`."""
+        self.record_cache_metric("invalidations")
+        key = self.get_cache_generation_key()
+        for alias in self.get_invalidation_aliases(key):
+            await ainvalidate_keys(
+                generation_keys=[key],
+                local_cache=self.local_cache,
+                cache_alias=alias,
+            )
@@ -0,0 +1,236 @@
+import hashlib
+import json
+import logging
+import time
+from typing import Any
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.db import transaction
+from django.http import HttpResponseBase
+from rest_framework import status
+from rest_framework.exceptions import APIException
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from .._cache_lock import CacheLock
+from .._circuit_breaker import CacheCircuitBreaker
+
+# Get logger from logging.
+logger = logging.getLogger(__name__)
+
+# Response headers that are recomputed when a stored response is replayed.
+_SKIPPED_HEADERS = {"content-type", "content-length", "vary", "allow"}
+
+
+class IdempotencyConflict(APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this idempotency key is still in progress."
+    default_code = "idempotency_conflict"
+
+
+class IdempotencyKeyReused(APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This idempotency key was used with a different request."
+    default_code = "idempotency_key_reused"
+
+
+class _IdempotentReplay(Exception):
+    """Carries a stored response out of `initial()`."""
+
+    def __init__(self, response: Response) -> None:
+        self.response = response
+
+
+class IdempotencyMixin:
+    """
+    Replays the stored response of a request sent again with the same
+    `Idempotency-Key` header, instead of running the handler twice.
+
+    The status, headers and data of the first response are stored once
+    the transaction commits. When it rolls back, nothing is stored and
+    the key is released for retries. A duplicate that arrives while the first
+    request is still running waits for its response, and gets a 409 after
+    `idempotency_wait` seconds. Reusing a key with a different body is a
+    422. Keys are scoped to the view, method, path and user. 5xx
+    responses are not stored, so the client can retry them.
+
+    Example:
+    ```
+        class TodoListView(IdempotencyMixin, APIView):
+            def post(self, request):
+                ...
+    ```
+    """
+
+    idempotency_header: str = "Idempotency-Key"
+    idempotency_methods: tuple[str, ...] = ("POST",)
+    idempotency_timeout: int = 24 * 60 * 60
+    idempotency_cache_alias: str = DEFAULT_CACHE_ALIAS
+
+    # The lock covers the first request: keep it above its longest run.
+    idempotency_lock_timeout: int = 60
+    idempotency_wait: float = 10.0
+    idempotency_poll_interval: float = 0.05
+
+    # Reads and writes of stored responses skip a failing backend. Opt-in.
+    cache_circuit_breaker: CacheCircuitBreaker | None = None
+
+    def get_idempotency_key(self, request: Request) -> str | None:
+        """Client key of the request, or None when it is not idempotent."""
+        if request.method not in self.idempotency_methods:
+            return None
+        return request.headers.get(self.idempotency_header) or None
+
+    def get_idempotency_cache_key(self, request: Request, key: str) -> str:
+        user = getattr(request, "user", None)
+        user_id = user.pk if user is not None and user.is_authenticated else "anon"
+        scope = "|".join(
+            [
+                f"{type(self).__module__}.{type(self).__qualname__}",
+                str(request.method),
+                request.path,
+                str(user_id),
+                key,
+            ]
+        )
+        digest = hashlib.blake2b(scope.encode(), digest_size=16).hexdigest()
+        return f"idempotency_{digest}"
+
+    def get_idempotency_fingerprint(self, request: Request) -> str:
+        """Hash of the request body, to detect a key reused for other data."""
+        body = json.dumps(request.data, sort_keys=True, default=str)
+        return hashlib.blake2b(body.encode(), digest_size=16).hexdigest()
+
+    def get_idempotency_backend(self) -> Any:
+        if self.cache_circuit_breaker is None:
+            return caches[self.idempotency_cache_alias]
+        return self.cache_circuit_breaker.guard(self.idempotency_cache_alias)
+
+    def initial(self, request: Request, *args: Any, **kwargs: Any) -> None:
+        # Authentication runs first: keys are scoped to the user.
+        super().initial(request, *args, **kwargs)  # type: ignore
+        self._idempotency: tuple[str, str, CacheLock] | None = None
+        key = self.get_idempotency_key(request)
+        if key is None:
+            return
+
+        cache_key = self.get_idempotency_cache_key(request, key)
+        fingerprint = self.get_idempotency_fingerprint(request)
+        record = self._wait_idempotency_record(cache_key, fingerprint)
+        if record is None:
+            return
+        if record["fingerprint"] != fingerprint:
+            raise IdempotencyKeyReused()
+
+        headers = {**record["headers"], "Idempotent-Replayed": "true"}
+        raise _IdempotentReplay(
+            Response(record["data"], status=record["status"], headers=headers)
+        )
+
+    def _wait_idempotency_record(
+        self, cache_key: str, fingerprint: str
+    ) -> dict[str, Any] | None:
+        """
+        Return the stored record of `cache_key`, or take the lock and
+        return None so this request runs the handler.
+        """
+        backend = self.get_idempotency_backend()
+        lock = CacheLock(
+            f"{cache_key}:lock",
+            timeout=self.idempotency_lock_timeout,
+            backend=caches[self.idempotency_cache_alias],
+        )
+        deadline = time.monotonic() + self.idempotency_wait
+        while True:
+            record = backend.get(cache_key)
+            if record is not None:
+                return record
+            if lock.acquire():
+                # The previous lock holder may have stored it already.
+                record = backend.get(cache_key)
+                if record is not None:
+                    lock.release()
+                    return record
+                self._idempotency = (cache_key, fingerprint, lock)
+                return None
+            if time.monotonic() >= deadline:
+                logger.warning(f"Timed out waiting for idempotent '{cache_key}'.")
+                raise IdempotencyConflict()
+            time.sleep(self.idempotency_poll_interval)
+
+    def handle_exception(self, exc: Exception) -> Response:
+        if isinstance(exc, _IdempotentReplay):
+            return exc.response
+        try:
+            return super().handle_exception(exc)  # type: ignore
+        except Exception:
+            # Unhandled errors skip `finalize_response()`.
+            self._release_idempotency()
+            raise
+
+    def finalize_response(
+        self,
+        request: Request,
+        response: HttpResponseBase,
+        *args: Any,
+        **kwargs: Any,
+    ) -> HttpResponseBase:
+        response = super().finalize_response(request, response, *args, **kwargs)  # type: ignore
+        pending = getattr(self, "_idempotency", None)
+        if pending is None:
+            return response
+        if (
+            response.status_code >= 500
+            or not isinstance(response, Response)
+            or self._is_rolled_back()
+        ):
+            # Nothing will be stored: let retries run the handler now.
+            self._release_idempotency()
+            return response
+
+        self._idempotency = None
+        cache_key, fingerprint, lock = pending
+        record = {
+            "fingerprint": fingerprint,
+            "status": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.items()
+                if name.lower() not in _SKIPPED_HEADERS
+            },
+            "data": response.data,
+        }
+        stored = False
+
+        def store() -> None:
+            nonlocal stored
+            stored = True
+            try:
+                self.get_idempotency_backend().set(
+                    cache_key, record, self.idempotency_timeout
+                )
+            finally:
+                lock.release()
+
+        def release_unstored() -> None:
+            # The transaction rolled back after this point (on_commit
+            # callbacks are dropped): release the lock once it has ended.
+            if not stored:
+                lock.release()
+
+        transaction.on_commit(store)
+        # Django calls the response closers after the request's
+        # transaction (ATOMIC_REQUESTS) has committed or rolled back.
+        response._resource_closers.append(release_unstored)
+        return response
+
+    def _is_rolled_back(self) -> bool:
+        """True when the current transaction is marked for rollback."""
+        connection = transaction.get_connection()
+        return connection.in_atomic_block and connection.get_rollback()
+
+    def _release_idempotency(self) -> None:
+        pending = getattr(self, "_idempotency", None)
+        if pending is not None:
+            self._idempotency = None
+            pending[2].release()
@@ -0,0 +1,100 @@
+from typing import Any
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+
+from djresttoolkit.cache import PURGE_FAMILIES, can_scan_cache, purge_cache
+
+
+class Command(BaseCommand):
+    help = "Purge the cached keys of a basename without blocking the cache server"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "basename",
+            type=str,
+            help="Basename whose keys are purged",
+        )
+        parser.add_argument(
+            "--family",
+            action="append",
+            choices=PURGE_FAMILIES,
+            default=None,
+            help="Only purge this key family (repeatable, default: all)",
+        )
+        parser.add_argument(
+            "--pk",
+            action="append",
+            default=None,
+            help="Only purge the keys of this object (repeatable)",
+        )
+        parser.add_argument(
+            "--custom-action",
+            action="append",
+            default=[],
+            help="Custom detail action whose keys are purged by --pk on backends "
+            "without key scanning (repeatable)",
+        )
+        parser.add_argument(
+            "--alias",
+            action="append",
+            default=None,
+            help="Cache alias to purge (repeatable, default: every alias)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Keys per SCAN / delete batch",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=0.0,
+            help="Seconds to pause between batches",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only count the keys that would be purged",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Purge every selected cache alias in turn."""
+
+        aliases = options["alias"] or list(settings.CACHES)
+        unknown = set(aliases) - set(settings.CACHES)
+        if unknown:
+            raise CommandError(f"Unknown cache alias: {', '.join(sorted(unknown))}")
+        if options["batch_size"] < 1:
+            raise CommandError("--batch-size must be at least 1.")
+
+        verb = "Found" if options["dry_run"] else "Purged"
+        total = 0
+        for alias in aliases:
+            if not can_scan_cache(alias) and options["pk"] is None:
+                self.stdout.write(
+                    self.style.WARNING(
+                        f"[{alias}] cannot enumerate keys: bumping the "
+                        "generation instead, detail keys expire on their own."
+                    )
+                )
+
+            def progress(count: int, alias: str = alias) -> None:
+                self.stdout.write(f"[{alias}] {count} keys...")
+
+            count = purge_cache(
+                options["basename"],
+                families=options["family"],
+                pks=options["pk"],
+                custom_actions=options["custom_action"],
+                cache_alias=alias,
+                batch_size=options["batch_size"],
+                pause=options["sleep"],
+                dry_run=options["dry_run"],
+                progress=progress if options["verbosity"] >= 1 else None,
+            )
+            self.stdout.write(f"[{alias}] {verb} {count} keys.")
+            total += count
+
+        self.stdout.write(self.style.SUCCESS(f"{verb} {total} keys."))
@@ -0,0 +1,69 @@
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandParser
+
+from djresttoolkit.cache import cache_metrics
+
+
+class Command(BaseCommand):
+    help = "Show cache hit/miss/fill metrics published by running processes"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--format",
+            choices=["table", "prometheus"],
+            default="table",
+            help="Output format (default: table)",
+        )
+        parser.add_argument(
+            "--basename",
+            type=str,
+            default=None,
+            help="Only show metrics of this basename",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Print the metrics summed over every live process."""
+
+        snapshot = {
+            family: values
+            for family, values in cache_metrics.collect().items()
+            if not options["basename"] or family[0] == options["basename"]
+        }
+
+        if options["format"] == "prometheus":
+            self.stdout.write(cache_metrics.to_prometheus(snapshot), ending="")
+            return None
+
+        if not snapshot:
+            self.stdout.write(self.style.WARNING("No cache metrics published yet."))
+            return None
+
+        header = (
+            f"{'basename':<24} {'action':<16} {'hits':>8} {'misses':>8} "
+            f"{'ratio':>6} {'stale':>7} {'fills':>7} {'avg fill':>9} "
+            f"{'avg size':>9} {'invalid.':>8}"
+        )
+        self.stdout.write(header)
+        self.stdout.write("-" * len(header))
+
+        for (basename, action), values in sorted(snapshot.items()):
+            hits = values.get("hits", 0)
+            misses = values.get("misses", 0)
+            fills = values.get("fills", 0)
+            stores = values.get("stores", 0)
+            lookups = hits + misses
+            ratio = f"{hits / lookups:.0%}" if lookups else "-"
+            avg_fill = (
+                f"{values.get('fill_seconds', 0) / fills * 1000:.1f}ms"
+                if fills
+                else "-"
+            )
+            avg_size = (
+                f"{values.get('payload_bytes', 0) / stores:.0f}B" if stores else "-"
+            )
+            self.stdout.write(
+                f"{basename:<24} {action or '-':<16} {hits:>8.0f} {misses:>8.0f} "
+                f"{ratio:>6} {values.get('stale_hits', 0):>7.0f} {fills:>7.0f} "
+                f"{avg_fill:>9} {avg_size:>9} {values.get('invalidations', 0):>8.0f}"
+            )
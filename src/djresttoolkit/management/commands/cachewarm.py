@@ -0,0 +1,269 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, NamedTuple
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from django.db import close_old_connections
+from django.test import RequestFactory
+from django.urls import URLPattern, URLResolver, get_resolver, reverse
+
+from djresttoolkit.cache.mixins import CacheListRetrieveMixin
+
+
+class WarmTarget(NamedTuple):
+    """A routed viewset action backed by `CacheListRetrieveMixin`."""
+
+    view_class: type[CacheListRetrieveMixin]
+    initkwargs: dict[str, Any]
+    actions: dict[str, str]
+    url_name: str
+    action: str
+
+
+class RateLimiter:
+    """Spread calls evenly: at most `rate` per second across all threads."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self.next_slot = time.monotonic()
+        self.lock = threading.Lock()
+
+    def wait(self) -> None:
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            slot = max(self.next_slot, now)
+            self.next_slot = slot + self.interval
+        time.sleep(max(0.0, slot - now))
+
+
+class Command(BaseCommand):
+    help = "Warm list and detail caches of viewsets using CacheListRetrieveMixin"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--basename",
+            action="append",
+            default=None,
+            help="Only warm this basename (repeatable, default: all)",
+        )
+        parser.add_argument(
+            "--query",
+            action="append",
+            default=None,
+            help="List query string to warm, e.g. 'page=2&ordering=-id' "
+            "(repeatable, default: the view's cache_warm_queries)",
+        )
+        parser.add_argument(
+            "--top",
+            type=int,
+            default=None,
+            help="Number of detail objects to warm "
+            "(default: the view's cache_warm_detail_limit)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of parallel workers",
+        )
+        parser.add_argument(
+            "--rate",
+            type=float,
+            default=10.0,
+            help="Maximum requests per second across all workers (0 = unlimited)",
+        )
+        parser.add_argument(
+            "--host",
+            type=str,
+            default=None,
+            help="Host used for absolute URLs in cached data "
+            "(default: first concrete ALLOWED_HOSTS entry)",
+        )
+        parser.add_argument(
+            "--secure",
+            action="store_true",
+            help="Build https URLs",
+        )
+
+    def handle(self, *args: Any, **options: Any) -> None:
+        """Replay list queries and top-N detail lookups through the cache."""
+
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1.")
+
+        basenames = options["basename"]
+        targets: dict[tuple[Any, ...], WarmTarget] = {}
+        for target in self.iter_targets(get_resolver().url_patterns):
+            basename = target.initkwargs.get("basename")
+            if basenames and basename not in basenames:
+                continue
+            # Format suffix patterns route the same action again.
+            targets.setdefault((target.view_class, basename, target.action), target)
+        if not targets:
+            self.stdout.write(self.style.WARNING("No cached viewsets found."))
+            return None
+
+        self.factory = RequestFactory(HTTP_HOST=options["host"] or self.get_host())
+        self.secure = options["secure"]
+
+        jobs: list[tuple[str, Callable[[], int]]] = []
+        for target in targets.values():
+            if target.action == "list":
+                queries = options["query"] or target.view_class.cache_warm_queries
+                for query in queries:
+                    jobs.append(self.make_job(target, query=query))
+            else:
+                limit = options["top"]
+                if limit is None:
+                    limit = target.view_class.cache_warm_detail_limit
+                if limit > 0:
+                    for pk in self.get_pks(target, list(targets.values()), limit):
+                        jobs.append(self.make_job(target, pk=pk))
+
+        limiter = RateLimiter(options["rate"])
+        warmed = failed = 0
+
+        def run(job: Callable[[], int]) -> int:
+            limiter.wait()
+            try:
+                return job()
+            finally:
+                close_old_connections()
+
+        with ThreadPoolExecutor(max_workers=options["workers"]) as executor:
+            futures = {executor.submit(run, job): label for label, job in jobs}
+            for future in as_completed(futures):
+                try:
+                    status_code = future.result()
+                except Exception as error:
+                    failed += 1
+                    self.stderr.write(f"Error warming {futures[future]}: {error}")
+                    continue
+                if status_code >= 400:
+                    failed += 1
+                    self.stderr.write(f"{futures[future]} returned {status_code}")
+                else:
+                    warmed += 1
+
+        style = self.style.SUCCESS if not failed else self.style.WARNING
+        self.stdout.write(style(f"Warmed {warmed} cache entries, {failed} failed."))
+
+    def iter_targets(
+        self, patterns: list[Any], namespace: str = ""
+    ) -> Iterator[WarmTarget]:
+        """Find routed list/retrieve actions of cached viewsets."""
+        for pattern in patterns:
+            if isinstance(pattern, URLResolver):
+                prefix = (
+                    f"{namespace}{pattern.namespace}:"
+                    if pattern.namespace
+                    else namespace
+                )
+                yield from self.iter_targets(pattern.url_patterns, prefix)
+                continue
+
+            if not isinstance(pattern, URLPattern) or not pattern.name:
+                continue
+            view_class = getattr(pattern.callback, "cls", None)
+            actions = getattr(pattern.callback, "actions", None)
+            if (
+                not actions
+                or not isinstance(view_class, type)
+                or not issubclass(view_class, CacheListRetrieveMixin)
+            ):
+                continue
+
+            for action in ("list", "retrieve"):
+                if action in actions.values():
+                    yield WarmTarget(
+                        view_class,
+                        pattern.callback.initkwargs,  # type: ignore
+                        actions,
+                        f"{namespace}{pattern.name}",
+                        action,
+                    )
+
+    def get_host(self) -> str:
+        for host in settings.ALLOWED_HOSTS:
+            if host and "*" not in host and not host.startswith("."):
+                return host
+        return "localhost"
+
+    def get_view(
+        self,
+        target: WarmTarget,
+        query: str = "",
+        **kwargs: Any,
+    ) -> CacheListRetrieveMixin:
+        """Build the viewset the way `as_view()` would, minus dispatch."""
+        path = reverse(target.url_name, kwargs=kwargs)
+        request = self.factory.get(
+            f"{path}?{query}" if query else path, secure=self.secure
+        )
+
+        view = target.view_class(**target.initkwargs)
+        view.action_map = target.actions  # type: ignore[attr-defined]
+        view.setup(request, **kwargs)  # type: ignore[attr-defined]
+        view.request = view.initialize_request(request, **kwargs)  # type: ignore
+        view.format_kwarg = view.get_format_suffix(**kwargs)  # type: ignore
+        view.headers = view.default_response_headers  # type: ignore
+        renderer, media_type = view.perform_content_negotiation(view.request)  # type: ignore
+        view.request.accepted_renderer = renderer  # type: ignore
+        view.request.accepted_media_type = media_type  # type: ignore
+        return view
+
+    def get_pks(
+        self,
+        target: WarmTarget,
+        targets: list[WarmTarget],
+        limit: int,
+    ) -> list[Any]:
+        # The detail route has no list URL, use the list target of the
+        # same viewset when there is one.
+        list_target = next(
+            (
+                other
+                for other in targets
+                if other.action == "list"
+                and other.view_class is target.view_class
+                and other.initkwargs.get("basename")
+                == target.initkwargs.get("basename")
+            ),
+            None,
+        )
+        if list_target is None:
+            return []
+        try:
+            return self.get_view(list_target).get_cache_warm_pks(limit)
+        finally:
+            close_old_connections()
+
+    def make_job(
+        self,
+        target: WarmTarget,
+        query: str = "",
+        pk: Any = None,
+    ) -> tuple[str, Callable[[], int]]:
+        basename = target.initkwargs.get("basename")
+        if pk is None:
+            label = f"{basename} list ?{query}"
+        else:
+            label = f"{basename} detail {pk}"
+
+        def job() -> int:
+            if pk is None:
+                view = self.get_view(target, query=query)
+                response = view.list(view.request)  # type: ignore
+            else:
+                lookup = (
+                    target.view_class.lookup_url_kwarg or target.view_class.lookup_field
+                )  # type: ignore
+                view = self.get_view(target, **{lookup: pk})
+                response = view.retrieve(view.request, **{lookup: pk})  # type: ignore
+            return response.status_code
+
+        return label, job
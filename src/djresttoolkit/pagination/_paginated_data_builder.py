@@ -1,11 +1,26 @@
+import hashlib
 import logging
 from typing import Any
+from urllib.parse import urlencode
 
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import close_old_connections
 from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save
 from rest_framework.exceptions import NotFound
 from rest_framework.request import Request
 from rest_framework.serializers import BaseSerializer
 
+from djresttoolkit.cache import (
+    CacheLock,
+    clone_request_with_query,
+    get_default_executor,
+    get_next_page_query,
+    invalidate_keys,
+    new_cache_generation,
+    submit_prefetch,
+)
 from djresttoolkit.serializers import EnhancedModelSerializer
 
 from ._page_number_pagination import PageNumberPagination
@@ -13,22 +28,131 @@ from ._page_number_pagination import PageNumberPagination
 # Get logger from logging.
 logger = logging.getLogger(__name__)
 
+# (model, cache prefix) pairs whose writes bump the page generation.
+_connected: set[tuple[type[Model], str]] = set()
+
 
 class PaginatedDataBuilder[T: Model]:
-    """Builder class to handle pagination and serialization."""
+    """
+    Builder class to handle pagination and serialization.
+
+    With `cache_prefix` set, pages are cached for `cache_timeout` seconds
+    under `<cache_prefix>_v<generation>_<hash>`, where the hash covers the
+    query string, the queryset SQL and the user. Saving or deleting a row
+    of the queryset's model bumps the generation. `prefetch_next_page`
+    then fills the next page in the background after a page is served, at
+    most `prefetch_concurrency` at a time per process.
+    """
 
     def __init__(
         self,
         request: Request,
         serializer_class: type[BaseSerializer[T] | EnhancedModelSerializer[T]],
         queryset: QuerySet[T],
+        cache_prefix: str | None = None,
+        cache_timeout: int = 300,
+        prefetch_next_page: bool = False,
+        prefetch_concurrency: int = 2,
     ) -> None:
         """Initilize the PaginatedDataBuilder class."""
         self.request = request
         self.serializer_class = serializer_class
         self.queryset = queryset
+        self.cache_prefix = cache_prefix
+        self.cache_timeout = cache_timeout
+        self.prefetch_next_page = prefetch_next_page
+        self.prefetch_concurrency = prefetch_concurrency
+        if cache_prefix is not None:
+            connect_paginated_data_signals(queryset.model, cache_prefix)
+
+    def get_cache_generation_key(self) -> str:
+        return f"{self.cache_prefix}_generation"
+
+    def get_cache_generation(self) -> int:
+        key = self.get_cache_generation_key()
+        generation = cache.get(key)
+        if generation is None:
+            generation = new_cache_generation()
+            if not cache.add(key, generation, None):
+                generation = cache.get(key, generation)
+        return generation
+
+    def get_cache_key(self) -> str:
+        query = urlencode(sorted(self.request.query_params.lists()), doseq=True)
+        try:
+            # Tells apart querysets filtered per user, tenant or scope.
+            sql = str(self.queryset.query)
+        except EmptyResultSet:
+            sql = ""
+        user = getattr(self.request, "user", None)
+        user_id = user.pk if user is not None and user.is_authenticated else "anon"
+        scope = "\x1e".join([query, sql, str(user_id)])
+        digest = hashlib.blake2b(scope.encode(), digest_size=16).hexdigest()
+        return f"{self.cache_prefix}_v{self.get_cache_generation()}_{digest}"
+
+    def invalidate_cache(self) -> None:
+        """Drop every cached page of `cache_prefix` once the transaction commits."""
+        invalidate_keys(generation_keys=[self.get_cache_generation_key()])
 
     def get_paginated_data(self) -> dict[str, Any]:
+        """Paginate and serialize the queryset, through the cache if enabled."""
+        if self.cache_prefix is None:
+            return self.build_paginated_data()
+
+        cache_key = self.get_cache_key()
+        paginated_data = cache.get(cache_key)
+        if paginated_data is None:
+            paginated_data = self.build_paginated_data()
+            cache.set(cache_key, paginated_data, self.cache_timeout)
+
+        if self.prefetch_next_page:
+            self.schedule_next_page(paginated_data)
+        return paginated_data
+
+    def schedule_next_page(self, paginated_data: dict[str, Any]) -> None:
+        """Fill the page after `paginated_data` in the background."""
+        query = get_next_page_query(
+            self.request,
+            PageNumberPagination.page_query_param,
+            paginated_data,
+        )
+        if query is None:
+            return
+
+        builder = PaginatedDataBuilder(
+            clone_request_with_query(self.request, query),
+            self.serializer_class,
+            self.queryset,
+            cache_prefix=self.cache_prefix,
+            cache_timeout=self.cache_timeout,
+        )
+        submit_prefetch(
+            get_default_executor(),
+            self.prefetch_concurrency,
+            builder._prefetch,
+        )
+
+    def _prefetch(self) -> None:
+        close_old_connections()
+        try:
+            cache_key = self.get_cache_key()
+            if cache.has_key(cache_key):
+                return
+
+            lock = CacheLock(f"{cache_key}:refresh")
+            if not lock.acquire():
+                return
+            try:
+                cache.set(cache_key, self.build_paginated_data(), self.cache_timeout)
+            finally:
+                lock.release()
+        except NotFound:
+            # Past the last page.
+            pass
+        finally:
+            close_old_connections()
+
+    def build_paginated_data(self) -> dict[str, Any]:
         """Paginate and serialize the queryset."""
 
         logger.debug("Starting pagination with custom PageNumberPagination.")
@@ -69,3 +193,17 @@ class PaginatedDataBuilder[T: Model]:
     @property
     def paginated_data(self) -> dict[str, Any]:
         return self.get_paginated_data()
+
+
+def connect_paginated_data_signals(model: type[Model], cache_prefix: str) -> None:
+    """Bump the page generation of `cache_prefix` whenever `model` is written."""
+    if (model, cache_prefix) in _connected:
+        return
+    _connected.add((model, cache_prefix))
+
+    def bump(sender: type[Model], **kwargs: Any) -> None:
+        invalidate_keys(generation_keys=[f"{cache_prefix}_generation"])
+
+    dispatch_uid = f"djresttoolkit_paginated_{cache_prefix}_{model._meta.label_lower}"
+    post_save.connect(bump, sender=model, weak=False, dispatch_uid=dispatch_uid)
+    post_delete.connect(bump, sender=model, weak=False, dispatch_uid=dispatch_uid)
@@ -15,19 +15,23 @@ class ThrottleInfoJSONRenderer(JSONRenderer):
     ) -> Any:
         """Handle throttle info to headers."""
         if renderer_context:
-            response: Response | None = renderer_context.get("response")
-            view = renderer_context.get("view")
-            if response and view:
-                # Attach throttle info to headers
-                inspector = ThrottleInspector(view)
-                throttle_info = inspector.get_details()
-                inspector.attach_headers(
-                    response=response,
-                    throttle_info=throttle_info,
-                )
+            self.attach_response_headers(renderer_context)
         # Retuen Final rendered payload
         return super().render(
             data,
             accepted_media_type,
             renderer_context,
         )
+
+    def attach_response_headers(self, renderer_context: Mapping[str, Any]) -> None:
+        """Attach throttle info headers, also used for pre-rendered responses."""
+        response: Response | None = renderer_context.get("response")
+        view = renderer_context.get("view")
+        if response and view:
+            # Attach throttle info to headers
+            inspector = ThrottleInspector(view)
+            throttle_info = inspector.get_details()
+            inspector.attach_headers(
+                response=response,
+                throttle_info=throttle_info,
+            )
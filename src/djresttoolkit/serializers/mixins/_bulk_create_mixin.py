@@ -6,6 +6,8 @@ from django.db.models import Model
 from rest_framework.serializers import Field as SerializerField
 from django.db.models import Field as ModelField
 
+from djresttoolkit.cache import cache_invalidation_registry
+
 
 logger = logging.getLogger(__name__)
 
@@ -40,7 +42,12 @@ class BulkCreateMixin:
                     "Bulk creating instances",
                     extra={"count": len(instances), "model": model.__name__},
                 )
-                return model.objects.bulk_create(instances)
+                created = model.objects.bulk_create(instances)
+                # bulk_create() sends no post_save signals.
+                cache_invalidation_registry.invalidate_model(
+                    model, [instance.pk for instance in created if instance.pk]
+                )
+                return created
             logger.info("No instances to create.")
             return []
 
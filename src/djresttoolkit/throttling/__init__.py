@@ -1,3 +1,18 @@
-from ._throttle_inspector import ThrottleInspector
+from ._sliding_window_throttle import (
+    AnonSlidingWindowThrottle,
+    ScopedSlidingWindowThrottle,
+    SlidingWindowRateThrottle,
+    UserSlidingWindowThrottle,
+)
+from ._throttle_info_mixin import ThrottleInfoMixin
+from ._throttle_inspector import ThrottleInspector, ThrottlePlan
 
-__all__ = ["ThrottleInspector"]
+__all__ = [
+    "AnonSlidingWindowThrottle",
+    "ScopedSlidingWindowThrottle",
+    "SlidingWindowRateThrottle",
+    "ThrottleInfoMixin",
+    "ThrottleInspector",
+    "ThrottlePlan",
+    "UserSlidingWindowThrottle",
+]
@@ -0,0 +1,154 @@
+import threading
+import uuid
+from typing import Any
+
+from rest_framework.request import Request
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    ScopedRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle,
+)
+
+from djresttoolkit.cache import get_redis_client
+
+# Trim the window, then add the request only while it has room. Returns
+# the allowed flag, the count including this request and the oldest score.
+_HIT_SCRIPT = """
+redis.call("zremrangebyscore", KEYS[1], "-inf", ARGV[1] - ARGV[2])
+local count = redis.call("zcard", KEYS[1])
+local allowed = 0
+if count < tonumber(ARGV[3]) then
+    redis.call("zadd", KEYS[1], ARGV[1], ARGV[4])
+    count = count + 1
+    allowed = 1
+end
+redis.call("pexpire", KEYS[1], math.ceil(ARGV[2] * 1000))
+local oldest = redis.call("zrange", KEYS[1], 0, 0, "withscores")
+return {allowed, count, oldest[2] or false}
+"""
+
+# Registered on first use, then reused for every client: the SHA only
+# depends on the script source.
+_hit_script: Any = None
+
+# Striped locks serializing the read-modify-write of the fallback
+# backends per key, so unrelated clients and scopes do not wait on the
+# cache I/O of each other.
+_fallback_locks = tuple(threading.Lock() for _ in range(64))
+
+
+def _get_hit_script(client: Any) -> Any:
+    global _hit_script
+    if _hit_script is None:
+        _hit_script = client.register_script(_HIT_SCRIPT)
+    return _hit_script
+
+
+def _get_fallback_lock(key: str) -> threading.Lock:
+    return _fallback_locks[hash(key) % len(_fallback_locks)]
+
+
+class SlidingWindowRateThrottle(SimpleRateThrottle):
+    """
+    `SimpleRateThrottle` with an atomic, server-side sliding window.
+
+    On `django_redis` every check is one script call on a sorted set of
+    request times (O(log n)), and the timestamps never leave Redis. Other
+    backends (e.g. locmem in tests) keep DRF's list of timestamps behind
+    a per-key lock, which is only atomic within one process.
+
+    Example:
+    ```
+        REST_FRAMEWORK = {
+            "DEFAULT_THROTTLE_CLASSES": [
+                "djresttoolkit.throttling.AnonSlidingWindowThrottle",
+                "djresttoolkit.throttling.UserSlidingWindowThrottle",
+            ],
+        }
+    ```
+    """
+
+    # Sorted sets must not collide with the lists of DRF's throttles.
+    cache_format = "throttle_window_%(scope)s_%(ident)s"
+
+    count: int = 0
+    oldest: float | None = None
+
+    def allow_request(self, request: Request, view: Any) -> bool:
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        allowed, self.count, self.oldest = self.hit(self.key, self.now)
+        return allowed
+
+    def hit(self, key: str, now: float) -> tuple[bool, int, float | None]:
+        """
+        Record a request at `now` if the window has room. Returns whether
+        it was allowed, the requests in the window and the oldest time.
+        """
+        client = get_redis_client(self.cache)
+        if client is not None:
+            # EVALSHA, the script is only sent again after a Redis restart.
+            allowed, count, oldest = _get_hit_script(client)(
+                keys=[self.cache.make_key(key)],
+                args=[
+                    repr(now),
+                    self.duration,
+                    self.num_requests,
+                    f"{now!r}:{uuid.uuid4().hex[:8]}",
+                ],
+                client=client,
+            )
+            return bool(allowed), int(count), float(oldest) if oldest else None
+
+        with _get_fallback_lock(key):
+            history = [ts for ts in self.cache.get(key, []) if ts > now - self.duration]
+            allowed = len(history) < self.num_requests  # type: ignore[operator]
+            if allowed:
+                history.insert(0, now)
+                self.cache.set(key, history, self.duration)
+        return allowed, len(history), history[-1] if history else None
+
+    def peek(self, key: str, now: float) -> tuple[int, float | None]:
+        """Requests in the window and the oldest time, without recording one."""
+        start = now - self.duration  # type: ignore[operator]
+        client = get_redis_client(self.cache)
+        if client is not None:
+            pipeline = client.pipeline(transaction=False)
+            raw_key = self.cache.make_key(key)
+            pipeline.zcount(raw_key, f"({start!r}", "+inf")
+            pipeline.zrangebyscore(
+                raw_key, f"({start!r}", "+inf", start=0, num=1, withscores=True
+            )
+            count, oldest = pipeline.execute()
+            return int(count), oldest[0][1] if oldest else None
+
+        history = [ts for ts in self.cache.get(key, []) if ts > start]
+        return len(history), history[-1] if history else None
+
+    def get_window(self) -> tuple[int, float | None]:
+        """Window seen by the last `allow_request()`."""
+        return self.count, self.oldest
+
+    def wait(self) -> float | None:
+        if self.oldest is None:
+            return self.duration
+        return max(0.0, self.oldest + self.duration - self.now)  # type: ignore[operator]
+
+
+class AnonSlidingWindowThrottle(AnonRateThrottle, SlidingWindowRateThrottle):
+    """`AnonRateThrottle` on a sliding window."""
+
+
+class UserSlidingWindowThrottle(UserRateThrottle, SlidingWindowRateThrottle):
+    """`UserRateThrottle` on a sliding window."""
+
+
+class ScopedSlidingWindowThrottle(ScopedRateThrottle, SlidingWindowRateThrottle):
+    """`ScopedRateThrottle` on a sliding window."""
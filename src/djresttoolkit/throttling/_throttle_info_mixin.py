@@ -0,0 +1,24 @@
+from typing import Any
+
+from ._throttle_inspector import ThrottleInspector
+
+
+class ThrottleInfoMixin:
+    """
+    Keeps the throttle instances checked in DRF's `check_throttles()` on
+    the request, so `ThrottleInfoJSONRenderer` builds its headers from the
+    histories read by `allow_request()` instead of reading the cache again.
+
+    Example:
+    ```
+        class TodoListView(ThrottleInfoMixin, APIView):
+            throttle_classes = [UserRateThrottle]
+    ```
+    """
+
+    def get_throttles(self) -> list[Any]:
+        throttles = super().get_throttles()  # type: ignore
+        request = getattr(self, "request", None)
+        if request is not None:
+            ThrottleInspector.capture_throttles(request, throttles)
+        return throttles
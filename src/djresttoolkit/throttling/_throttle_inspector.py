@@ -1,15 +1,20 @@
+import functools
 import logging
 import re
-from datetime import timedelta
+from datetime import datetime
 from datetime import timezone as dt_timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Iterable, NamedTuple
 
 from django.conf import settings
+from django.core.cache import cache as default_cache
+from django.core.signals import setting_changed
 from django.utils import timezone
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.throttling import BaseThrottle, UserRateThrottle
 
+from djresttoolkit.cache import CacheCircuitBreaker
+
 if TYPE_CHECKING:
     from rest_framework.views import APIView
 
@@ -20,13 +25,44 @@ else:
 # Get logger from logging.
 logger = logging.getLogger(__name__)
 
+# Request attribute holding the throttle instances checked by DRF.
+THROTTLES_ATTR = "_djresttoolkit_throttles"
+
+
+class ThrottlePlan(NamedTuple):
+    """Parsed rate and header names of one throttle class."""
+
+    throttle_class: type[BaseThrottle]
+    scope: str
+    limit: int
+    duration: int
+    headers: tuple[str, str, str, str]
+
+
+# Plans per tuple of throttle classes, cleared when REST_FRAMEWORK changes.
+_plans: dict[tuple[type[BaseThrottle], ...], tuple[ThrottlePlan, ...]] = {}
+
+
+def _clear_plans(setting: str, **kwargs: Any) -> None:
+    if setting == "REST_FRAMEWORK":
+        _plans.clear()
+
+
+setting_changed.connect(_clear_plans)
+
 
 class ThrottleInspector:
     """
     Inspects and retrieves DRF throttle details for both class-based
     and function-based views.
+
+    With `circuit_breaker` set (e.g. to `cache_circuit_breaker`), reads of
+    the default cache go through it, so a failing or slow backend reports
+    full remaining quotas instead of blocking.
     """
 
+    circuit_breaker: CacheCircuitBreaker | None = None
+
     def __init__(
         self,
         view: ViewType,
@@ -36,7 +72,7 @@ class ThrottleInspector:
         self.view = view
         self.request: Request | None = getattr(view, "request", request)
         self.throttle_classes: list[type[BaseThrottle]] = (
-            getattr(view, "throttle_classes", throttle_classes) or []
+            getattr(view, "throttle_classes", None) or throttle_classes or []
         )
 
         if not self.request:
@@ -82,6 +118,46 @@ class ThrottleInspector:
 
         return self.parse_rate(rate)
 
+    @staticmethod
+    @functools.cache
+    def get_header_names(scope: str) -> tuple[str, str, str, str]:
+        """Limit, Remaining, Reset and Retry-After header names of a scope."""
+        prefix = f"X-Throttle-{scope}"
+        return (
+            f"{prefix}-Limit",
+            f"{prefix}-Remaining",
+            f"{prefix}-Reset",
+            f"{prefix}-Retry-After",
+        )
+
+    @staticmethod
+    def capture_throttles(request: Request, throttles: Iterable[BaseThrottle]) -> None:
+        """
+        Keep the throttle instances DRF checks on the request. Their
+        `history` is then read by `get_details()` without cache I/O.
+        """
+        setattr(request, THROTTLES_ATTR, {type(t): t for t in throttles})
+
+    def get_throttle_plans(self) -> tuple[ThrottlePlan, ...]:
+        """Parsed rates of the view's throttles, computed once per classes."""
+        key = tuple(self.throttle_classes)
+        plans = _plans.get(key)
+        if plans is None:
+            plans = _plans[key] = tuple(self._build_plans())
+        return plans
+
+    def _build_plans(self) -> Iterable[ThrottlePlan]:
+        for throttle_class in self.throttle_classes:
+            parsed_rate = self.get_throttle_rate(throttle_class)
+            if not parsed_rate:
+                continue
+            scope = getattr(
+                throttle_class, "scope", self.to_snake_case(throttle_class.__name__)
+            )
+            yield ThrottlePlan(
+                throttle_class, scope, *parsed_rate, self.get_header_names(scope)
+            )
+
     def get_throttle_usage(
         self,
         throttle: UserRateThrottle,
@@ -89,6 +165,45 @@ class ThrottleInspector:
         duration: int,
     ) -> dict[str, Any]:
         """Return current usage info for a given throttle instance."""
+        if not self.request:
+            return self._build_usage(0, None, limit, duration)
+        cache_key = throttle.get_cache_key(
+            self.request,
+            getattr(self.view, "view", self.view),  # type: ignore
+        )  # type: ignore
+        now = timezone.now().timestamp()
+        if not cache_key:
+            count, oldest = 0, None
+        elif hasattr(throttle, "peek"):
+            count, oldest = throttle.peek(cache_key, now)
+        else:
+            history = self._get_backend(throttle).get(cache_key, [])
+            count, oldest = self.get_window(history, duration, now)
+        return self._build_usage(count, oldest, limit, duration, now)
+
+    def _get_backend(self, throttle: BaseThrottle) -> Any:
+        backend = getattr(throttle, "cache", default_cache)
+        if self.circuit_breaker is not None and backend is default_cache:
+            backend = self.circuit_breaker.guard()
+        return backend
+
+    @staticmethod
+    def get_window(
+        history: list[float], duration: int, now: float
+    ) -> tuple[int, float | None]:
+        """Requests in the window and the oldest time of a DRF history."""
+        # Newest first, as stored by `SimpleRateThrottle`.
+        history = [ts for ts in history if ts > now - duration]
+        return len(history), history[-1] if history else None
+
+    def _build_usage(
+        self,
+        count: int,
+        oldest: float | None,
+        limit: int,
+        duration: int,
+        now: float | None = None,
+    ) -> dict[str, Any]:
         if not self.request:
             return {
                 "limit": limit,
@@ -97,54 +212,91 @@ class ThrottleInspector:
                 "retry_after": {"time": None, "unit": "seconds"},
             }
 
-        cache_key = throttle.get_cache_key(
-            self.request,
-            getattr(self.view, "view", self.view),  # type: ignore
-        )  # type: ignore
-        history: list[Any] = throttle.cache.get(cache_key, []) if cache_key else []
-
-        remaining = max(0, limit - len(history))
-        first_request_time = (  # type: ignore
-            timezone.datetime.fromtimestamp(history[0], tz=dt_timezone.utc)  # type: ignore[attr-defined]
-            if history
-            else timezone.now()
-        )
-        reset_time = first_request_time + timedelta(seconds=duration)  # type: ignore
-        retry_after = max(0, int((reset_time - timezone.now()).total_seconds()))  # type: ignore
+        now = timezone.now().timestamp() if now is None else now
+        remaining = max(0, limit - count)
+        # A slot frees up once the oldest request leaves the window.
+        reset_at = (oldest if oldest is not None else now) + duration
+        retry_after = max(0, int(reset_at - now))
 
         return {
             "limit": limit,
             "remaining": remaining,
-            "reset_time": reset_time.isoformat(),  # type: ignore
+            "reset_time": datetime.fromtimestamp(
+                reset_at, tz=dt_timezone.utc
+            ).isoformat(),
             "retry_after": {"time": retry_after, "unit": "seconds"},
         }
 
+    def _get_windows(
+        self, plans: tuple[ThrottlePlan, ...], now: float
+    ) -> dict[type, tuple[int, float | None]]:
+        """Windows of the throttles, captured or read with one `get_many`."""
+        captured: dict[type, BaseThrottle] | None = getattr(
+            self.request, THROTTLES_ATTR, None
+        )
+        if captured is not None:
+            windows: dict[type, tuple[int, float | None]] = {}
+            for plan in plans:
+                throttle = captured.get(plan.throttle_class)
+                if hasattr(throttle, "get_window"):
+                    windows[plan.throttle_class] = throttle.get_window()  # type: ignore[union-attr]
+                else:
+                    # Skipped requests (no cache key) have no history.
+                    history = getattr(throttle, "history", [])
+                    windows[plan.throttle_class] = self.get_window(
+                        history, plan.duration, now
+                    )
+            return windows
+
+        view = getattr(self.view, "view", self.view)
+        windows = {}
+        # Keyed by id(): the default cache proxy is not hashable.
+        keys: dict[int, tuple[Any, dict[str, ThrottlePlan]]] = {}
+        for plan in plans:
+            throttle = plan.throttle_class()
+            cache_key = throttle.get_cache_key(self.request, view)  # type: ignore
+            if not cache_key:
+                continue
+            if hasattr(throttle, "peek"):
+                # Sliding windows are not stored as plain values.
+                windows[plan.throttle_class] = throttle.peek(cache_key, now)
+                continue
+            backend = self._get_backend(throttle)
+            group = keys.setdefault(id(backend), (backend, {}))
+            group[1][cache_key] = plan
+
+        for backend, key_plans in keys.values():
+            for cache_key, history in backend.get_many(list(key_plans)).items():
+                plan = key_plans[cache_key]
+                windows[plan.throttle_class] = self.get_window(
+                    history, plan.duration, now
+                )
+        return windows
+
     def get_details(self) -> dict[str, Any]:
         """
         Return detailed throttle info for all configured throttles.
         If throttling is not configured, returns an empty dict.
+
+        Windows captured on the request by `ThrottleInfoMixin` cost no
+        cache I/O; otherwise they are read with one `get_many`.
         """
         if not self.throttle_classes:
             return {}
 
         details: dict[str, Any] = {"throttled_by": None, "throttles": {}}
+        plans = self.get_throttle_plans()
+        now = timezone.now().timestamp()
+        windows = self._get_windows(plans, now) if self.request and plans else {}
 
-        for throttle_class in self.throttle_classes:
-            throttle = throttle_class()
-            parsed_rate = self.get_throttle_rate(throttle_class)
-            if not parsed_rate:
-                continue
-
-            limit, duration = parsed_rate
-            scope = getattr(
-                throttle_class, "scope", self.to_snake_case(throttle_class.__name__)
-            )
-            usage = self.get_throttle_usage(throttle, limit, duration)  # type: ignore[arg-type]
-            details["throttles"][scope] = usage
+        for plan in plans:
+            count, oldest = windows.get(plan.throttle_class, (0, None))
+            usage = self._build_usage(count, oldest, plan.limit, plan.duration, now)
+            details["throttles"][plan.scope] = usage
 
             if usage["remaining"] == 0 and not details["throttled_by"]:
-                details["throttled_by"] = scope
-                logger.info(f"Request throttled by {scope}")
+                details["throttled_by"] = plan.scope
+                logger.info(f"Request throttled by {plan.scope}")
 
         return details
 
@@ -166,14 +318,11 @@ class ThrottleInspector:
             return
 
         for throttle_type, data in throttle_info.get("throttles", {}).items():
-            response[f"X-Throttle-{throttle_type}-Limit"] = str(data.get("limit", ""))
-            response[f"X-Throttle-{throttle_type}-Remaining"] = str(
-                data.get("remaining", "")
-            )
-            response[f"X-Throttle-{throttle_type}-Reset"] = data.get("reset_time") or ""
+            limit, remaining, reset, retry = self.get_header_names(throttle_type)
+            response[limit] = str(data.get("limit", ""))
+            response[remaining] = str(data.get("remaining", ""))
+            response[reset] = data.get("reset_time") or ""
             retry_after = data.get("retry_after", {}).get("time")
-            response[f"X-Throttle-{throttle_type}-Retry-After"] = (
-                str(retry_after) if retry_after is not None else "0"
-            )
+            response[retry] = str(retry_after) if retry_after is not None else "0"
 
         logger.info(f"Throttle headers attached to response for {self._view_name()}.")
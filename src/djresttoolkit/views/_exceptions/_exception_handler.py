@@ -1,19 +1,23 @@
-from typing import Any, cast
+from typing import Any
 
 from django.conf import settings
-from django.core.cache import cache
-from django.utils import timezone
 from django.utils.module_loading import import_string
 from rest_framework import status, views
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.throttling import AnonRateThrottle
 
+from djresttoolkit.throttling import ThrottleInspector
+
 
 def exception_handler(exc: Exception, context: dict[str, Any]) -> Response | None:
     """
     Custom exception handler that preserves DRF's default functionality
     while adding custom throttling behavior.
+
+    Throttle windows are only read, through `ThrottleInspector`: from the
+    request when `ThrottleInfoMixin` captured them, otherwise from the
+    cache (through `ThrottleInspector.circuit_breaker` when set).
     """
 
     # Call DRF's default exception handler first
@@ -36,40 +40,22 @@ def exception_handler(exc: Exception, context: dict[str, Any]) -> Response | Non
                 for path in default:
                     throttle_classes.append(import_string(path))
 
-        # Handle all throttles by looping it
-        for throttle_class in throttle_classes:
-            throttle = throttle_class()
-            cache_key = throttle.get_cache_key(request, view)
-            if not cache_key:
-                continue
-
-            history: list[float] = cache.get(cache_key, [])
-            now = timezone.now().timestamp()
-            duration: float = cast(float, throttle.duration)  # type: ignore[attr-defined]
-
-            # Keep only non-expired timestamps
-            history = [float(ts) for ts in history if now - float(ts) < duration]
-
-            # If throttle limit exceeded
-            if len(history) >= throttle.num_requests:  # type: ignore[attr-defined]
-                retry_after: float = (
-                    duration - (now - history[0]) if history else duration
-                )
-
-                return Response(
-                    data={
-                        "detail": "Too many requests. Please try again later.",
-                        "retry_after": {
-                            "time": round(retry_after, 2),
-                            "unit": "seconds",
-                        },
+        # Only read the windows: the throttles already counted this request.
+        inspector = ThrottleInspector(view, request, throttle_classes)
+        details = inspector.get_details()
+        throttled_by = details.get("throttled_by")
+        if throttled_by:
+            retry_after = details["throttles"][throttled_by]["retry_after"]["time"]
+            return Response(
+                data={
+                    "detail": "Too many requests. Please try again later.",
+                    "retry_after": {
+                        "time": retry_after,
+                        "unit": "seconds",
                     },
-                    status=status.HTTP_429_TOO_MANY_REQUESTS,
-                )
-
-            # Otherwise add current timestamp
-            history.append(now)
-            cache.set(key=cache_key, value=history, timeout=duration)
+                },
+                status=status.HTTP_429_TOO_MANY_REQUESTS,
+            )
 
     # If DRF handled the exception, return that response
     return response
@@ -1,8 +1,17 @@
+import hashlib
 from typing import Any
 
-from django.core.exceptions import ImproperlyConfigured
+from django.core.exceptions import FieldDoesNotExist, ImproperlyConfigured
 from django.db.models import Model, QuerySet
-from django.http import Http404
+from django.http import Http404, HttpRequest, HttpResponse, HttpResponseBase
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+
+from djresttoolkit.cache import (
+    cache_not_found,
+    connect_not_found_signals,
+    is_cached_not_found,
+)
 
 
 class RetrieveObjectMixin[T: Model]:
@@ -13,6 +22,14 @@ class RetrieveObjectMixin[T: Model]:
 
     Raises `Http404` when the object is missing.
 
+    With `not_found_cache_timeout` set, lookups that raised `Http404` are
+    remembered for that many seconds, so repeated misses cost cache reads
+    instead of queries. Saving any row of the model forgets them.
+
+    When the model has a `last_modified_field` (default `updated_at`),
+    conditional GETs can be answered with 304 Not Modified from a single
+    aggregate query, before the object is loaded or serialized.
+
     This works in both Django views and DRF views.
 
     Example:
@@ -21,12 +38,25 @@ class RetrieveObjectMixin[T: Model]:
             queryset = Book.objects.all()
 
             def get(self, request, *args, **kwargs):
+                not_modified = self.get_not_modified_response(request, id=1)
+                if not_modified is not None:
+                    return not_modified
+
                 obj = self.get_object(id=1)
-                return JsonResponse(obj.to_dict())
+                response = JsonResponse(obj.to_dict())
+                return self.set_validator_headers(response, obj)
     ```
     """
 
     queryset: QuerySet[T] | None = None
+    last_modified_field: str | None = "updated_at"
+    not_found_cache_timeout: int | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Connect at import time, so every process forgets cached misses.
+        if cls.not_found_cache_timeout and cls.queryset is not None:
+            connect_not_found_signals(cls.queryset.model)
 
     def get_object(self, **filters: Any) -> T:
         """Retrieve a model object based on provided filters."""
@@ -36,9 +66,17 @@ class RetrieveObjectMixin[T: Model]:
                 "Queryset attribute is not set in the class.",
             )
 
+        model = self.queryset.model
+        scope = f"{type(self).__module__}.{type(self).__qualname__}"
+        timeout = self.not_found_cache_timeout
+        if timeout and is_cached_not_found(model, scope, **filters):
+            raise Http404(self.not_found_detail())
+
         try:
             return self.queryset.get(**filters)
-        except self.queryset.model.DoesNotExist:
+        except model.DoesNotExist:
+            if timeout:
+                cache_not_found(model, scope, timeout, **filters)
             raise Http404(self.not_found_detail())
 
     def not_found_detail(self) -> dict[str, str] | str:
@@ -57,3 +95,85 @@ class RetrieveObjectMixin[T: Model]:
             verbose_name.title() if verbose_name else self.queryset.model.__name__
         )
         return f"The requested {model_name} was not found."
+
+    def get_last_modified_field(self) -> str | None:
+        """Return `last_modified_field` if the model actually has it."""
+        if self.queryset is None:
+            raise ImproperlyConfigured(
+                "Queryset attribute is not set in the class.",
+            )
+
+        if not self.last_modified_field:
+            return None
+        try:
+            self.queryset.model._meta.get_field(self.last_modified_field)
+        except FieldDoesNotExist:
+            return None
+        return self.last_modified_field
+
+    def get_validators(self, obj: T) -> tuple[str | None, int | None]:
+        """Return the (strong ETag, Last-Modified timestamp) of an object."""
+        field = self.get_last_modified_field()
+        if field is None:
+            return None, None
+
+        last_modified = getattr(obj, field)
+        if last_modified is None:
+            return None, None
+        return (
+            self._make_etag(obj.pk, last_modified.isoformat()),
+            int(last_modified.timestamp()),
+        )
+
+    def get_not_modified_response(
+        self,
+        request: HttpRequest,
+        **filters: Any,
+    ) -> HttpResponse | None:
+        """
+        Return 304 Not Modified when the client's copy is still current.
+
+        Only the primary key and `last_modified_field` are fetched, so the
+        check is cheap compared to loading and serializing the object.
+        """
+        field = self.get_last_modified_field()
+        meta = request.META
+        if field is None or not (
+            "HTTP_IF_NONE_MATCH" in meta or "HTTP_IF_MODIFIED_SINCE" in meta
+        ):
+            return None
+
+        row = (
+            self.queryset.filter(**filters)  # type: ignore[union-attr]
+            .values_list("pk", field)
+            .first()
+        )
+        if row is None or row[1] is None:
+            return None
+
+        pk, last_modified = row
+        etag = self._make_etag(pk, last_modified.isoformat())
+        timestamp = int(last_modified.timestamp())
+        response = get_conditional_response(
+            request,
+            etag=etag,
+            last_modified=timestamp,
+        )
+        if response is not None:
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(timestamp)
+        return response
+
+    def set_validator_headers[R: HttpResponseBase](self, response: R, obj: T) -> R:
+        """Add ETag and Last-Modified headers for `obj` to the response."""
+        etag, last_modified = self.get_validators(obj)
+        if etag is not None:
+            response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified)
+        return response
+
+    def _make_etag(self, pk: Any, version: str) -> str:
+        label = self.queryset.model._meta.label_lower  # type: ignore[union-attr]
+        digest = hashlib.md5(f"{label}:{pk}:{version}".encode()).hexdigest()
+        return f'"{digest}"'
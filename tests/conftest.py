@@ -0,0 +1,99 @@
+import sys
+import tempfile
+from pathlib import Path
+
+import django
+import pytest
+from django.conf import settings
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+_LOCMEM = "django.core.cache.backends.locmem.LocMemCache"
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    settings.configure(
+        SECRET_KEY="tests",
+        USE_TZ=True,
+        ALLOWED_HOSTS=["testserver"],
+        ROOT_URLCONF="testapp.urls",
+        INSTALLED_APPS=[
+            "django.contrib.auth",
+            "django.contrib.contenttypes",
+            "rest_framework",
+            "djresttoolkit",
+            "testapp",
+        ],
+        DATABASES={
+            "default": {
+                "ENGINE": "django.db.backends.sqlite3",
+                # A file, so threads share the data.
+                "NAME": str(Path(tempfile.mkdtemp()) / "tests.sqlite3"),
+            }
+        },
+        CACHES={
+            alias: {"BACKEND": _LOCMEM, "LOCATION": alias}
+            for alias in ("default", "fallback", "a", "b")
+        },
+        REST_FRAMEWORK={
+            "DEFAULT_AUTHENTICATION_CLASSES": [],
+            "DEFAULT_PERMISSION_CLASSES": [],
+            "UNAUTHENTICATED_USER": None,
+            "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+            "PAGE_SIZE": 2,
+            "EXCEPTION_HANDLER": "djresttoolkit.views.exception_handler",
+            "DEFAULT_THROTTLE_RATES": {"anon": "100/day", "user": "1000/day"},
+        },
+    )
+    django.setup()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database() -> None:
+    from django.core.management import call_command
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+
+
+@pytest.fixture(autouse=True)
+def clean_state() -> None:
+    from django.contrib.auth.models import User
+    from django.core.cache import caches
+    from testapp.models import Comment, Note, Todo
+
+    from djresttoolkit.cache import cache_circuit_breaker, cache_metrics
+
+    for alias in settings.CACHES:
+        caches[alias].clear()
+    cache_circuit_breaker._states.clear()
+    cache_metrics.reset()
+    Comment.objects.all().delete()
+    Note.objects.all().delete()
+    Todo.objects.all().delete()
+    User.objects.all().delete()
+
+
+@pytest.fixture
+def rf():
+    from rest_framework.test import APIRequestFactory
+
+    return APIRequestFactory()
+
+
+@pytest.fixture
+def call(rf):
+    """Dispatch one request to a viewset action and render the response."""
+
+    def call(view_class, method, path, action, data=None, **kwargs):
+        factory = getattr(rf, method)
+        headers = {
+            f"HTTP_{name.upper().replace('-', '_')}": value
+            for name, value in kwargs.pop("headers", {}).items()
+        }
+        request = factory(path, data, format="json", **headers)
+        view = view_class.as_view({method: action}, basename="todo")
+        response = view(request, **kwargs)
+        response.render()
+        return response
+
+    return call
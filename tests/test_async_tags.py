@@ -0,0 +1,40 @@
+import asyncio
+from unittest import mock
+
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import cache_tag_index
+
+
+class TaggedViewSet(TodoViewSet):
+    def get_cache_tags(self, data):
+        return ["todo_row_1"]
+
+
+def in_event_loop():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def test_tag_index_is_not_called_from_the_event_loop():
+    view = TaggedViewSet()
+    view.basename = "todo"
+    calls = []
+
+    def stamp(tags):
+        calls.append(("stamp", in_event_loop()))
+        return {}
+
+    def add(*args, **kwargs):
+        calls.append(("add", in_event_loop()))
+
+    with (
+        mock.patch.object(cache_tag_index, "stamp", stamp),
+        mock.patch.object(cache_tag_index, "add", add),
+    ):
+        asyncio.run(view.aset_cache_entry("todo_list_v1_abc", [{"id": 1}]))
+
+    assert calls == [("stamp", False), ("add", False)]
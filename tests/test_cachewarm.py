@@ -0,0 +1,39 @@
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+def make_view(query=None):
+    view = TodoViewSet()
+    view.basename = "todo"
+    view.request = Request(APIRequestFactory().get("/todos/", query or {}))
+    return view
+
+
+def warm(**options):
+    stdout = StringIO()
+    call_command("cachewarm", workers=1, rate=0, stdout=stdout, **options)
+    return stdout.getvalue()
+
+
+def test_warms_list_queries_and_top_details():
+    todos = [Todo.objects.create(title=str(index)) for index in range(3)]
+
+    output = warm(query=["page=2"], top=2)
+
+    assert "Warmed 3 cache entries, 0 failed." in output
+    assert cache.get(make_view({"page": 2}).get_cache_key("list")) is not None
+    warmed = [
+        cache.get(make_view().get_cache_key("retrieve", pk=todo.pk)) is not None
+        for todo in todos
+    ]
+    assert warmed == [True, True, False]
+
+
+def test_unknown_basename_warms_nothing():
+    assert "No cached viewsets found." in warm(basename=["missing"])
@@ -0,0 +1,38 @@
+from django.contrib.auth.models import User
+from rest_framework.authentication import BaseAuthentication
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+class HeaderAuthentication(BaseAuthentication):
+    def authenticate(self, request):
+        username = request.headers.get("X-User")
+        if username is None:
+            return None
+        return User.objects.get(username=username), None
+
+
+class CdnViewSet(TodoViewSet):
+    cache_cdn = True
+    authentication_classes = [HeaderAuthentication]
+
+
+def test_anonymous_responses_are_public(call):
+    todo = Todo.objects.create(title="a")
+    for _ in range(2):
+        response = call(CdnViewSet, "get", "/", "retrieve", pk=todo.pk)
+        assert response["Cache-Control"].startswith("public")
+        assert response["Surrogate-Key"]
+
+
+def test_authenticated_responses_are_private(call):
+    User.objects.create(username="alice")
+    todo = Todo.objects.create(title="a")
+    # Filled by an anonymous request first, then served from the cache.
+    call(CdnViewSet, "get", "/", "retrieve", pk=todo.pk)
+    for action, kwargs in (("retrieve", {"pk": todo.pk}), ("list", {})):
+        response = call(
+            CdnViewSet, "get", "/", action, headers={"X-User": "alice"}, **kwargs
+        )
+        assert response["Cache-Control"] == "private, no-store"
+        assert not response.has_header("Surrogate-Key")
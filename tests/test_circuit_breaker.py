@@ -0,0 +1,61 @@
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheCircuitBreaker, CacheRouter
+from djresttoolkit.cache.mixins import IdempotencyMixin
+from djresttoolkit.throttling import ThrottleInspector
+
+breaker = CacheCircuitBreaker(failure_threshold=1, fallback_alias="fallback")
+
+
+class FallbackViewSet(TodoViewSet):
+    cache_circuit_breaker = breaker
+
+
+def test_invalidation_reaches_the_fallback_alias(call):
+    breaker._states.clear()
+    breaker.record_failure("default")
+    assert breaker.get_state() == "open"
+
+    todo = Todo.objects.create(title="a")
+    assert (
+        call(FallbackViewSet, "get", "/", "retrieve", pk=todo.pk).data["title"] == "a"
+    )
+    assert [
+        row["title"]
+        for row in call(FallbackViewSet, "get", "/", "list").data["results"]
+    ] == ["a"]
+
+    call(FallbackViewSet, "patch", "/", "partial_update", {"title": "b"}, pk=todo.pk)
+    Todo.objects.create(title="c")
+    call(FallbackViewSet, "post", "/", "create", {"title": "d"})
+
+    assert (
+        call(FallbackViewSet, "get", "/", "retrieve", pk=todo.pk).data["title"] == "b"
+    )
+    assert [
+        row["title"]
+        for row in call(FallbackViewSet, "get", "/", "list").data["results"]
+    ] == ["b", "c"]
+
+
+class RoutedViewSet(TodoViewSet):
+    cache_circuit_breaker = breaker
+    cache_router = CacheRouter({"todo": "a"})
+
+
+def test_breaker_is_opt_in():
+    assert TodoViewSet.cache_circuit_breaker is None
+    assert IdempotencyMixin.cache_circuit_breaker is None
+    assert ThrottleInspector.circuit_breaker is None
+
+
+def test_routed_alias_circuit_makes_cache_unavailable():
+    breaker._states.clear()
+    view = RoutedViewSet()
+    view.basename = "todo"
+    assert view.is_cache_available("todo_detail_1")
+
+    breaker.record_failure("a")
+    assert view.is_cache_available()
+    assert not view.is_cache_available("todo_detail_1")
@@ -0,0 +1,50 @@
+import pytest
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheEntry
+from djresttoolkit.cache._compression import (
+    MAGIC,
+    decode_value,
+    encode_value,
+    get_compressor,
+)
+
+
+class CompressedViewSet(TodoViewSet):
+    cache_compress_min_size = 64
+
+
+def test_large_values_are_compressed():
+    value = {"text": "x" * 10_000}
+    encoded = encode_value(value, get_compressor("zlib"), 64)
+    assert encoded.startswith(MAGIC + b"z")
+    assert len(encoded) < 1_000
+    assert decode_value(encoded) == value
+
+
+def test_small_and_legacy_values():
+    encoded = encode_value("small", get_compressor("zlib"), 64)
+    assert encoded.startswith(MAGIC + b"r")
+    assert decode_value(encoded) == "small"
+    # Values stored before compression was enabled still decode.
+    assert decode_value(CacheEntry("old")) == CacheEntry("old")
+
+
+def test_unknown_compressor():
+    with pytest.raises(ImproperlyConfigured):
+        get_compressor("missing")
+
+
+def test_viewset_round_trips_compressed_entries(call):
+    for index in range(2):
+        Todo.objects.create(title=f"todo {index} " * 20)
+    first = call(CompressedViewSet, "get", "/", "list")
+    view = CompressedViewSet()
+    view.basename = "todo"
+    view.request = first.renderer_context["request"]
+    stored = cache.get(view.get_cache_key("list"))
+    assert isinstance(stored, bytes) and stored.startswith(MAGIC + b"z")
+    assert call(CompressedViewSet, "get", "/", "list").data == first.data
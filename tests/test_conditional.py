@@ -0,0 +1,60 @@
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+class ConditionalViewSet(TodoViewSet):
+    cache_conditional = True
+
+
+def test_if_none_match_returns_304(call):
+    todo = Todo.objects.create(title="a")
+    first = call(ConditionalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert first.status_code == 200
+    etag = first["ETag"]
+
+    response = call(
+        ConditionalViewSet,
+        "get",
+        "/",
+        "retrieve",
+        pk=todo.pk,
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+
+
+def test_failed_if_match_returns_412(call):
+    todo = Todo.objects.create(title="a")
+    etag = call(ConditionalViewSet, "get", "/", "retrieve", pk=todo.pk)["ETag"]
+
+    response = call(
+        ConditionalViewSet,
+        "get",
+        "/",
+        "retrieve",
+        pk=todo.pk,
+        headers={"If-Match": '"other"'},
+    )
+    assert response.status_code == 412
+
+    response = call(
+        ConditionalViewSet,
+        "get",
+        "/",
+        "retrieve",
+        pk=todo.pk,
+        headers={"If-Match": etag},
+    )
+    assert response.status_code == 200
+
+
+def test_list_etag_changes_after_create(call):
+    Todo.objects.create(title="a")
+    etag = call(ConditionalViewSet, "get", "/", "list")["ETag"]
+    call(ConditionalViewSet, "post", "/", "create", {"title": "b"})
+    response = call(
+        ConditionalViewSet, "get", "/", "list", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response["ETag"] != etag
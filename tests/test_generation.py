@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from rest_framework.request import Request
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+def make_view():
+    view = TodoViewSet()
+    view.basename = "todo"
+    return view
+
+
+def titles(call):
+    return [
+        row["title"] for row in call(TodoViewSet, "get", "/", "list").data["results"]
+    ]
+
+
+def test_writes_bump_the_generation_of_list_keys(call):
+    Todo.objects.create(title="a")
+    assert titles(call) == ["a"]
+    generation = make_view().get_cache_generation()
+
+    response = call(TodoViewSet, "post", "/", "create", {"title": "b"})
+    assert make_view().get_cache_generation() == generation + 1
+    assert titles(call) == ["a", "b"]
+
+    call(TodoViewSet, "delete", "/", "destroy", pk=response.data["id"])
+    assert titles(call) == ["a"]
+
+
+def test_evicted_generation_never_restarts_lower():
+    view = make_view()
+    view.bump_cache_generation()
+    generation = view.get_cache_generation()
+    cache.delete(view.get_cache_generation_key())
+    assert view.get_cache_generation() >= generation
+
+
+def test_list_keys_embed_the_generation(rf):
+
+    view = make_view()
+    view.request = Request(rf.get("/", {"page": 2}))
+    key = view.get_cache_key("list")
+    view.bump_cache_generation()
+    assert view.get_cache_key("list") != key
+    assert key.startswith("todo_list_v")
@@ -0,0 +1,57 @@
+from django.db import connection, transaction
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from testapp.models import Todo
+
+from djresttoolkit.cache.mixins import IdempotencyMixin
+
+HEADERS = {"HTTP_IDEMPOTENCY_KEY": "k1"}
+
+
+class TodoCreateView(IdempotencyMixin, APIView):
+    idempotency_wait = 0.2
+
+    def post(self, request):
+        if not request.data.get("title"):
+            raise ValidationError({"title": "required"})
+        todo = Todo.objects.create(title=request.data["title"])
+        return Response({"id": todo.pk}, status=201)
+
+
+def post(rf, data):
+    response = TodoCreateView.as_view()(rf.post("/", data, format="json", **HEADERS))
+    response.render()
+    return response
+
+
+def test_replays_the_stored_response(rf):
+    first = post(rf, {"title": "a"})
+    second = post(rf, {"title": "a"})
+    assert second.status_code == 201
+    assert second.data == first.data
+    assert second["Idempotent-Replayed"] == "true"
+    assert Todo.objects.count() == 1
+
+
+def test_rolled_back_4xx_releases_the_key(rf, monkeypatch):
+    monkeypatch.setitem(connection.settings_dict, "ATOMIC_REQUESTS", True)
+    for _ in range(2):
+        with transaction.atomic():
+            response = post(rf, {})
+        response.close()
+        # Retried at once instead of a 409 while the lock is held.
+        assert response.status_code == 400
+
+
+def test_rollback_after_the_view_releases_the_key(rf):
+    with transaction.atomic():
+        response = post(rf, {"title": "a"})
+        transaction.set_rollback(True)
+    response.close()
+    assert response.status_code == 201
+
+    response = post(rf, {"title": "a"})
+    assert response.status_code == 201
+    assert not response.has_header("Idempotent-Replayed")
+    assert Todo.objects.count() == 1
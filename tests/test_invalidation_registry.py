@@ -0,0 +1,98 @@
+from django.contrib.auth.models import User
+from rest_framework import serializers
+from testapp.models import Comment, Note, Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheInvalidationRegistry, cache_invalidation_registry
+from djresttoolkit.serializers.mixins import BulkCreateMixin
+
+
+class RegisteredViewSet(TodoViewSet):
+    pass
+
+
+cache_invalidation_registry.register(RegisteredViewSet, basename="registered")
+
+
+class NestedSerializer(serializers.ModelSerializer):
+    comments = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Todo
+        fields = ["id", "title", "comments"]
+
+    def get_comments(self, todo):
+        return [comment.text for comment in todo.comment_set.order_by("pk")]
+
+
+class NestedViewSet(TodoViewSet):
+    serializer_class = NestedSerializer
+
+
+cache_invalidation_registry.register(NestedViewSet, basename="nested")
+
+
+class CommentSerializer(BulkCreateMixin, serializers.ModelSerializer):
+    class Meta:
+        model = Comment
+        fields = ["todo", "text"]
+
+
+def make_view():
+    view = RegisteredViewSet()
+    view.basename = "registered"
+    return view
+
+
+def test_walk_follows_children_and_forward_relations():
+    models = {
+        model for model, _, _ in CacheInvalidationRegistry()._walk_relations(Todo, 2)
+    }
+    assert {Todo, User, Comment} <= models
+
+
+def test_walk_skips_siblings_behind_a_forward_hop():
+    models = {
+        model for model, _, _ in CacheInvalidationRegistry()._walk_relations(Todo, 2)
+    }
+    # Note only shares the foreign key to User with Todo.
+    assert Note not in models
+
+
+def test_sibling_writes_do_not_invalidate():
+    user = User.objects.create(username="u")
+    view = make_view()
+    generation = view.get_cache_generation()
+    Note.objects.create(author=user, text="n")
+    assert view.get_cache_generation() == generation
+
+
+def test_child_and_own_writes_invalidate():
+    todo = Todo.objects.create(title="a")
+    view = make_view()
+    view.set_cache_entry(view.get_cache_key("retrieve", pk=todo.pk), {"title": "a"})
+
+    todo.title = "b"
+    todo.save()
+    assert view.get_cache_entry(view.get_cache_key("retrieve", pk=todo.pk)) is None
+
+    generation = view.get_cache_generation()
+    Comment.objects.create(todo=todo, text="c")
+    assert view.get_cache_generation() != generation
+
+
+def retrieve_nested(rf, pk):
+    view = NestedViewSet.as_view({"get": "retrieve"}, basename="nested")
+    response = view(rf.get("/"), pk=pk)
+    response.render()
+    return response
+
+
+def test_bulk_created_children_refresh_the_parent_detail(rf):
+    todo = Todo.objects.create(title="a")
+    Comment.objects.create(todo=todo, text="first")
+    assert retrieve_nested(rf, todo.pk).data["comments"] == ["first"]
+
+    CommentSerializer().create([{"todo": todo, "text": "second"}])
+
+    assert retrieve_nested(rf, todo.pk).data["comments"] == ["first", "second"]
@@ -0,0 +1,91 @@
+import pickle
+
+from django.core.cache import cache
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import LocalCache, _local_cache
+
+
+class LocalViewSet(TodoViewSet):
+    local_cache = LocalCache(max_entries=8)
+
+
+def test_lru_evicts_by_entries_and_bytes():
+    local = LocalCache(max_entries=2, max_bytes=1000)
+    local.set("a", 1)
+    local.set("b", 2)
+    local.get("a")
+    local.set("c", 3)
+    assert local.get("b") is None
+    assert local.get("a") == 1
+
+    local.set("big", "x" * 2000)
+    assert local.get("big") is None
+
+
+def test_hits_are_served_from_the_process(call):
+    LocalViewSet.local_cache.clear()
+    todo = Todo.objects.create(title="a")
+    call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    cache.clear()
+    # The Django cache is empty, the L1 copy still answers.
+    Todo.objects.filter(pk=todo.pk).update(title="b")
+    response = call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert response.data["title"] == "a"
+
+
+def test_invalidation_drops_local_copies(call):
+    LocalViewSet.local_cache.clear()
+    todo = Todo.objects.create(title="a")
+    call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    call(LocalViewSet, "get", "/", "list")
+
+    call(LocalViewSet, "patch", "/", "partial_update", {"title": "b"}, pk=todo.pk)
+
+    response = call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert response.data["title"] == "b"
+    response = call(LocalViewSet, "get", "/", "list")
+    assert response.data["results"][0]["title"] == "b"
+
+
+class CountingPickle:
+    HIGHEST_PROTOCOL = pickle.HIGHEST_PROTOCOL
+
+    def __init__(self):
+        self.dumps_calls = 0
+
+    def dumps(self, value, protocol=None):
+        self.dumps_calls += 1
+        return pickle.dumps(value, protocol)
+
+
+def test_backend_hits_are_not_pickled_again(call, monkeypatch):
+    LocalViewSet.local_cache.clear()
+    todo = Todo.objects.create(title="a")
+    call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    LocalViewSet.local_cache.clear()
+
+    counter = CountingPickle()
+    monkeypatch.setattr(_local_cache, "pickle", counter)
+    call(LocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert len(LocalViewSet.local_cache) == 1
+    assert counter.dumps_calls == 0
+
+
+class CompressedLocalViewSet(TodoViewSet):
+    local_cache = LocalCache(max_entries=8)
+    cache_compress_min_size = 0
+
+
+def test_backend_hits_are_sized_by_their_payload(call):
+    CompressedLocalViewSet.local_cache.clear()
+    todo = Todo.objects.create(title="a")
+    call(CompressedLocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    CompressedLocalViewSet.local_cache.clear()
+
+    call(CompressedLocalViewSet, "get", "/", "retrieve", pk=todo.pk)
+    view = CompressedLocalViewSet()
+    view.basename = "todo"
+    raw = cache.get(view.get_cache_key("retrieve", pk=todo.pk))
+    assert CompressedLocalViewSet.local_cache.size == len(raw)
@@ -0,0 +1,79 @@
+import threading
+from unittest import mock
+
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheMetrics, cache_metrics
+
+
+class MetricsViewSet(TodoViewSet):
+    pass
+
+
+class PayloadSizeViewSet(TodoViewSet):
+    cache_metrics_payload_size = True
+
+
+class CompressedViewSet(TodoViewSet):
+    cache_compress_min_size = 0
+
+
+def stored(view_class, call):
+    Todo.objects.create(title="a")
+    call(view_class, "get", "/todos/", "list")
+    return cache_metrics.snapshot()[("todo", "list")]
+
+
+def test_uncompressed_entries_are_not_pickled_to_size_them(call):
+    values = stored(MetricsViewSet, call)
+    assert values["fills"] == 1
+    assert "payload_bytes" not in values
+
+
+def test_payload_size_is_opt_in(call):
+    assert stored(PayloadSizeViewSet, call)["payload_bytes"] > 0
+
+
+def test_compressed_entries_are_sized_from_their_bytes(call):
+    values = stored(CompressedViewSet, call)
+    assert values["stores"] == 1
+    assert values["payload_bytes"] > 0
+
+
+def test_record_publishes_off_the_calling_thread():
+    metrics = CacheMetrics(publish_interval=0)
+    published = threading.Event()
+    threads = []
+
+    def publish():
+        threads.append(threading.current_thread())
+        published.set()
+
+    with mock.patch.object(metrics, "publish", publish):
+        metrics.record(("todo", "list"), "hits")
+        assert published.wait(5)
+    assert threads[0] is not threading.current_thread()
+
+
+def test_concurrent_publishes_keep_every_process():
+    processes = [CacheMetrics(publish_interval=None) for _ in range(8)]
+    for index, metrics in enumerate(processes):
+        metrics.get_process_key = lambda index=index: f"process_{index}"
+        metrics.record(("todo", "list"), "hits")
+
+    barrier = threading.Barrier(len(processes))
+
+    def publish(metrics):
+        barrier.wait()
+        # A publish that finds the index locked is retried the next time.
+        for _ in range(50):
+            metrics.publish()
+
+    threads = [threading.Thread(target=publish, args=(m,)) for m in processes]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert processes[0].collect()[("todo", "list")]["hits"] == len(processes)
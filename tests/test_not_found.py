@@ -0,0 +1,44 @@
+import pytest
+from django.db import connection
+from django.http import Http404
+from django.test.utils import CaptureQueriesContext
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.views.mixins import RetrieveObjectMixin
+
+
+class NotFoundViewSet(TodoViewSet):
+    cache_not_found_timeout = 60
+
+
+class TodoLookup(RetrieveObjectMixin[Todo]):
+    queryset = Todo.objects.all()
+    not_found_cache_timeout = 60
+
+
+def test_missing_detail_is_cached_until_a_create(call):
+    missing = Todo.objects.create(title="a").pk + 1
+    assert call(NotFoundViewSet, "get", "/", "retrieve", pk=missing).status_code == 404
+    with CaptureQueriesContext(connection) as queries:
+        response = call(NotFoundViewSet, "get", "/", "retrieve", pk=missing)
+    assert response.status_code == 404
+    assert len(queries) == 0
+
+    created = call(NotFoundViewSet, "post", "/", "create", {"title": "b"})
+    assert created.data["id"] == missing
+    response = call(NotFoundViewSet, "get", "/", "retrieve", pk=missing)
+    assert response.status_code == 200
+
+
+def test_retrieve_object_mixin_remembers_misses():
+    lookup = TodoLookup()
+    with pytest.raises(Http404):
+        lookup.get_object(title="b")
+    with CaptureQueriesContext(connection) as queries, pytest.raises(Http404):
+        lookup.get_object(title="b")
+    assert len(queries) == 0
+
+    # Saving any row forgets the remembered misses.
+    Todo.objects.create(title="b")
+    assert lookup.get_object(title="b").title == "b"
@@ -0,0 +1,70 @@
+from django.contrib.auth.models import AnonymousUser, User
+from rest_framework.request import Request
+from testapp.models import Todo
+from testapp.views import TodoSerializer
+
+from djresttoolkit.pagination import PaginatedDataBuilder
+
+
+def build(rf, queryset, user=None, page=None):
+    request = Request(rf.get("/", {"page": page} if page else {}))
+    request.user = user or AnonymousUser()
+    return PaginatedDataBuilder(
+        request, TodoSerializer, queryset, cache_prefix="todos"
+    ).get_paginated_data()
+
+
+def titles(data):
+    return [row["title"] for row in data["results"]]
+
+
+def test_querysets_are_cached_separately(rf):
+    alice = User.objects.create(username="alice")
+    bob = User.objects.create(username="bob")
+    Todo.objects.create(title="a", owner=alice)
+    Todo.objects.create(title="b", owner=bob)
+
+    assert titles(build(rf, Todo.objects.filter(owner=alice), alice)) == ["a"]
+    assert titles(build(rf, Todo.objects.filter(owner=bob), bob)) == ["b"]
+
+
+def test_users_are_cached_separately(rf):
+    alice = User.objects.create(username="alice")
+    bob = User.objects.create(username="bob")
+    builder = PaginatedDataBuilder(
+        Request(rf.get("/")), TodoSerializer, Todo.objects.all(), cache_prefix="todos"
+    )
+    keys = set()
+    for user in (alice, bob, AnonymousUser()):
+        builder.request.user = user
+        keys.add(builder.get_cache_key())
+    assert len(keys) == 3
+
+
+def test_writes_invalidate_cached_pages(rf):
+    todo = Todo.objects.create(title="a")
+    assert titles(build(rf, Todo.objects.all())) == ["a"]
+
+    todo.title = "b"
+    todo.save()
+    assert titles(build(rf, Todo.objects.all())) == ["b"]
+
+    Todo.objects.create(title="c")
+    assert titles(build(rf, Todo.objects.all())) == ["b", "c"]
+
+    todo.delete()
+    assert titles(build(rf, Todo.objects.all())) == ["c"]
+
+
+def test_invalidate_cache_after_bulk_writes(rf):
+    Todo.objects.create(title="a")
+    assert titles(build(rf, Todo.objects.all())) == ["a"]
+
+    Todo.objects.update(title="b")
+    assert titles(build(rf, Todo.objects.all())) == ["a"]
+
+    request = Request(rf.get("/"))
+    PaginatedDataBuilder(
+        request, TodoSerializer, Todo.objects.all(), cache_prefix="todos"
+    ).invalidate_cache()
+    assert titles(build(rf, Todo.objects.all())) == ["b"]
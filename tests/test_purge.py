@@ -0,0 +1,61 @@
+from fnmatch import fnmatchcase
+
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import get_purge_patterns, purge_cache
+
+KEYS = [
+    "todo_list_v1_abc",
+    "todo_detail_1",
+    "todo_detail_1_v1_abc",
+    "todo_row_1",
+    "todo_archive_list_v1_abc",
+    "todo_archive_detail_1",
+    "todo_generation",
+    "todo_tag_1",
+    "todo_item_list_v1_abc",
+    "todo_item_detail_1",
+    "todo_item_generation",
+]
+
+
+def purged(*args, **kwargs):
+    patterns = get_purge_patterns(*args, **kwargs)
+    return {key for key in KEYS if any(fnmatchcase(key, p) for p in patterns)}
+
+
+def test_purge_keeps_generation_tags_and_other_basenames():
+    assert purged("todo", custom_actions=["archive"]) == {
+        "todo_list_v1_abc",
+        "todo_detail_1",
+        "todo_detail_1_v1_abc",
+        "todo_row_1",
+        "todo_archive_list_v1_abc",
+        "todo_archive_detail_1",
+    }
+
+
+def test_purge_families():
+    assert purged("todo", ["list"]) == {"todo_list_v1_abc"}
+    assert purged("todo", ["detail"]) == {
+        "todo_detail_1",
+        "todo_detail_1_v1_abc",
+        "todo_row_1",
+    }
+
+
+def test_purge_pks():
+    assert purged("todo", pks=[1], custom_actions=["archive"]) == {
+        "todo_detail_1",
+        "todo_detail_1_v1_abc",
+        "todo_row_1",
+        "todo_archive_detail_1",
+    }
+
+
+def test_purging_another_alias_bumps_the_generation_the_mixins_read():
+    view = TodoViewSet()
+    view.basename = "todo"
+    generation = view.get_cache_generation()
+    assert purge_cache("todo", cache_alias="a") == 0
+    assert view.get_cache_generation() != generation
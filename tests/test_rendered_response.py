@@ -0,0 +1,46 @@
+import json
+
+from django.core.cache import cache
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheEntry
+from djresttoolkit.cache._rendered_response import RenderedPayload
+
+
+class RenderedViewSet(TodoViewSet):
+    cache_rendered_response = True
+
+
+def make_view():
+    view = RenderedViewSet()
+    view.basename = "todo"
+    return view
+
+
+def test_rendered_bytes_are_cached_and_served(call):
+    todo = Todo.objects.create(title="a")
+    first = call(RenderedViewSet, "get", "/", "retrieve", pk=todo.pk)
+    entry = cache.get(make_view().get_cache_key("retrieve", pk=todo.pk))
+    assert isinstance(entry, CacheEntry)
+    assert isinstance(entry.value, RenderedPayload)
+
+    second = call(RenderedViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert second.content == first.content == entry.value.content
+    assert json.loads(second.content)["title"] == "a"
+    assert second["ETag"] == entry.value.etag
+    assert second["Content-Type"] == first["Content-Type"]
+
+
+def test_request_specific_output_is_not_cached(call):
+    todo = Todo.objects.create(title="a")
+    response = call(
+        RenderedViewSet,
+        "get",
+        "/",
+        "retrieve",
+        headers={"Accept": "application/json; indent=4"},
+        pk=todo.pk,
+    )
+    assert b"\n    " in response.content
+    assert cache.get(make_view().get_cache_key("retrieve", pk=todo.pk)) is None
@@ -0,0 +1,30 @@
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheRouter
+
+
+class RoutedViewSet(TodoViewSet):
+    cache_router = CacheRouter({"todo": ["a", "b"]}, replicated=["todo_*"], replicas=2)
+
+
+def make_view():
+    view = RoutedViewSet()
+    view.basename = "todo"
+    return view
+
+
+def test_generation_stays_on_the_default_alias():
+    view = make_view()
+    key = view.get_cache_generation_key()
+    assert view.get_cache_aliases(key) == ["default"]
+    assert view.get_cache_aliases("todo_list_v1_abc") != ["default"]
+
+
+def test_replicas_agree_on_the_generation():
+    Todo.objects.create(title="a")
+    view = make_view()
+    generation = view.get_cache_generation()
+    view.bump_cache_generation()
+    # Every read, whichever replica it picks, sees the new generation.
+    assert {make_view().get_cache_generation() for _ in range(20)} == {generation + 1}
@@ -0,0 +1,63 @@
+import threading
+import time
+
+from testapp.views import TodoViewSet
+
+
+class SingleFlightViewSet(TodoViewSet):
+    cache_single_flight = True
+    cache_lock_poll_interval = 0.01
+
+
+def make_view(view_class=SingleFlightViewSet):
+    view = view_class()
+    view.basename = "todo"
+    view.action = "list"
+    return view
+
+
+def test_concurrent_misses_compute_once():
+    calls = []
+
+    def data_fn():
+        calls.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(make_view().get_or_set_cache("k", data_fn))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ["value"] * 5
+
+
+def test_waiters_compute_after_lock_wait():
+    class ShortWait(SingleFlightViewSet):
+        cache_lock_wait = 0.05
+
+    view = make_view(ShortWait)
+    from djresttoolkit.cache import CacheLock
+
+    lock = CacheLock("k:lock")
+    assert lock.acquire()
+    try:
+        assert view.get_or_set_cache("k", lambda: "computed") == "computed"
+    finally:
+        lock.release()
+
+
+def test_filled_value_is_served_from_cache():
+    calls = []
+    view = make_view(TodoViewSet)
+    view.get_or_set_cache("k", lambda: calls.append(1) or "v")
+    assert view.get_or_set_cache("k", lambda: calls.append(1) or "v") == "v"
+    assert len(calls) == 1
@@ -0,0 +1,102 @@
+import threading
+
+from django.conf import settings
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from djresttoolkit.throttling import AnonSlidingWindowThrottle
+from djresttoolkit.throttling import _sliding_window_throttle as window
+
+
+class BurstThrottle(AnonSlidingWindowThrottle):
+    scope = "burst"
+    rate = "3/minute"
+
+
+class BurstView(APIView):
+    throttle_classes = [BurstThrottle]
+
+    def get(self, request):
+        return Response({"ok": True})
+
+
+def get(rf):
+    response = BurstView.as_view()(rf.get("/"))
+    response.render()
+    return response
+
+
+def test_rejected_requests_are_not_counted(rf, monkeypatch):
+    # Read by the exception handler's ThrottleInspector.
+    rates = settings.REST_FRAMEWORK["DEFAULT_THROTTLE_RATES"]
+    monkeypatch.setitem(rates, "burst", "3/minute")
+    assert [get(rf).status_code for _ in range(3)] == [200, 200, 200]
+
+    for _ in range(2):
+        response = get(rf)
+        assert response.status_code == 429
+        assert 0 < response.data["retry_after"]["time"] <= 60
+
+    throttle = BurstThrottle()
+    request = BurstView().initialize_request(rf.get("/"))
+    key = throttle.get_cache_key(request, None)
+    count, oldest = throttle.peek(key, throttle.timer())
+    assert count == 3 and oldest is not None
+
+
+def test_concurrent_hits_respect_the_limit():
+    throttle = BurstThrottle()
+    now = throttle.timer()
+    allowed = []
+    barrier = threading.Barrier(10)
+
+    def hit():
+        barrier.wait()
+        allowed.append(BurstThrottle().hit("throttle_window_burst_x", now)[0])
+
+    threads = [threading.Thread(target=hit) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert allowed.count(True) == 3
+
+
+def test_fallback_keys_do_not_share_one_lock():
+    lock = window._get_fallback_lock("throttle_window_burst_x")
+    other = next(
+        key
+        for key in (f"throttle_window_burst_{n}" for n in range(100))
+        if window._get_fallback_lock(key) is not lock
+    )
+    with lock:
+        result = []
+        thread = threading.Thread(
+            target=lambda: result.append(BurstThrottle().hit(other, 0.0))
+        )
+        thread.start()
+        thread.join(timeout=5)
+    assert result and result[0][0] is True
+
+
+class FakeScript:
+    def __call__(self, keys, args, client=None):
+        return [1, 1, args[0]]
+
+
+class FakeRedis:
+    registered = 0
+
+    def register_script(self, script):
+        self.registered += 1
+        return FakeScript()
+
+
+def test_hit_script_is_registered_once(monkeypatch):
+    client = FakeRedis()
+    monkeypatch.setattr(window, "_hit_script", None)
+    monkeypatch.setattr(window, "get_redis_client", lambda backend: client)
+    throttle = BurstThrottle()
+    for _ in range(3):
+        assert throttle.hit("throttle_window_burst_x", 1.0)[0] is True
+    assert client.registered == 1
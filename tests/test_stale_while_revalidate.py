@@ -0,0 +1,54 @@
+import time
+from concurrent.futures import Executor, Future
+
+from django.core.cache import cache
+from testapp.views import TodoViewSet
+
+from djresttoolkit.cache import CacheEntry
+
+
+class DeferredExecutor(Executor):
+    """Keeps submitted work until `run()`, like a busy thread pool."""
+
+    def __init__(self):
+        self.pending = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.pending.append((fn, args, kwargs))
+        return Future()
+
+    def run(self):
+        while self.pending:
+            fn, args, kwargs = self.pending.pop(0)
+            fn(*args, **kwargs)
+
+
+executor = DeferredExecutor()
+
+
+class StaleViewSet(TodoViewSet):
+    cache_stale_timeout = 60
+    cache_refresh_executor = executor
+
+
+def make_view():
+    view = StaleViewSet()
+    view.basename = "todo"
+    return view
+
+
+def test_fresh_entry_carries_a_soft_expiry():
+    entry = make_view().get_or_set_cache_entry("k", lambda: "v")
+    assert entry.stale_at is not None and entry.stale_at > time.time()
+
+
+def test_stale_value_is_served_while_one_refresh_runs():
+    executor.pending.clear()
+    cache.set("k", CacheEntry("old", stale_at=time.time() - 1), 60)
+
+    for _ in range(3):
+        assert make_view().get_or_set_cache("k", lambda: "new") == "old"
+    assert len(executor.pending) == 1
+
+    executor.run()
+    assert make_view().get_or_set_cache("k", lambda: "newer") == "new"
@@ -0,0 +1,42 @@
+from unittest import mock
+
+from django.core.cache import caches
+from rest_framework.response import Response
+from rest_framework.throttling import AnonRateThrottle
+from rest_framework.views import APIView
+
+from djresttoolkit.renderers import ThrottleInfoJSONRenderer
+from djresttoolkit.throttling import ThrottleInfoMixin
+
+
+class HeadersView(APIView):
+    throttle_classes = [AnonRateThrottle]
+    renderer_classes = [ThrottleInfoJSONRenderer]
+
+    def get(self, request):
+        return Response({"ok": True})
+
+
+class CapturedHeadersView(ThrottleInfoMixin, HeadersView):
+    pass
+
+
+def get(rf, view_class):
+    backend = type(caches["default"])
+    with mock.patch.object(backend, "get", autospec=True, wraps=backend.get) as read:
+        response = view_class.as_view()(rf.get("/"))
+        response.render()
+    return response, read.call_count
+
+
+def test_headers_report_the_window(rf):
+    for remaining in (99, 98):
+        response, _ = get(rf, CapturedHeadersView)
+        assert response["X-Throttle-anon-Limit"] == "100"
+        assert response["X-Throttle-anon-Remaining"] == str(remaining)
+
+
+def test_captured_throttles_skip_the_extra_cache_read(rf):
+    _, reads = get(rf, HeadersView)
+    _, captured_reads = get(rf, CapturedHeadersView)
+    assert captured_reads == reads - 1
@@ -0,0 +1,45 @@
+from unittest import mock
+
+from django.core.cache import cache, caches
+from django.db import transaction
+
+from djresttoolkit.cache import batch_cache_invalidation, invalidate_keys
+
+
+def test_invalidation_waits_for_commit():
+    cache.set("k", "v")
+    with transaction.atomic():
+        invalidate_keys(delete_keys=["k"])
+        assert cache.get("k") == "v"
+    assert cache.get("k") is None
+
+
+def test_rollback_drops_the_invalidation():
+    cache.set("k", "v")
+    with transaction.atomic():
+        invalidate_keys(delete_keys=["k"])
+        transaction.set_rollback(True)
+    assert cache.get("k") == "v"
+
+    # A later transaction does not reuse the dropped batch.
+    with transaction.atomic():
+        invalidate_keys(delete_keys=["k"])
+    assert cache.get("k") is None
+
+
+def test_batch_deduplicates_work():
+    cache.set("g", 1)
+    with (
+        mock.patch.object(
+            type(caches["default"]),
+            "delete_many",
+            autospec=True,
+            side_effect=lambda self, keys, version=None: None,
+        ) as delete_many,
+        batch_cache_invalidation(),
+    ):
+        for _ in range(10):
+            invalidate_keys(delete_keys=["a", "b"], generation_keys=["g"])
+    assert delete_many.call_count == 1
+    assert sorted(delete_many.call_args.args[1]) == ["a", "b"]
+    assert cache.get("g") == 2
@@ -0,0 +1,87 @@
+import pytest
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+class FragmentViewSet(TodoViewSet):
+    cache_vary_on = ("Accept-Language",)
+    cache_list_fragments = True
+
+
+class TaggedViewSet(TodoViewSet):
+    cache_vary_on = ("Accept-Language",)
+    cache_list_tags = True
+
+
+def titles(call, view_class, language):
+    response = call(
+        view_class, "get", "/", "list", headers={"Accept-Language": language}
+    )
+    return [row["title"] for row in response.data["results"]]
+
+
+@pytest.mark.parametrize("view_class", [FragmentViewSet, TaggedViewSet])
+def test_update_refreshes_every_variant(call, view_class):
+    todo = Todo.objects.create(title="a")
+    assert titles(call, view_class, "en") == ["a"]
+    assert titles(call, view_class, "fr") == ["a"]
+
+    call(
+        view_class,
+        "patch",
+        "/",
+        "partial_update",
+        {"title": "b"},
+        headers={"Accept-Language": "en"},
+        pk=todo.pk,
+    )
+
+    assert titles(call, view_class, "en") == ["b"]
+    assert titles(call, view_class, "fr") == ["b"]
+
+
+@pytest.mark.parametrize("view_class", [FragmentViewSet, TaggedViewSet])
+def test_registry_update_refreshes_every_variant(call, view_class):
+    todo = Todo.objects.create(title="a")
+    assert titles(call, view_class, "fr") == ["a"]
+
+    Todo.objects.filter(pk=todo.pk).update(title="b")
+    view = view_class()
+    view.basename = "todo"
+    # Like the invalidation registry: no request, so no variant.
+    view.invalidate_cache_rows([todo.pk])
+
+    assert titles(call, view_class, "fr") == ["b"]
+
+
+def test_tagged_update_refreshes_detail_of_every_variant(call):
+    todo = Todo.objects.create(title="a")
+    for language in ("en", "fr"):
+        call(
+            TaggedViewSet,
+            "get",
+            "/",
+            "retrieve",
+            headers={"Accept-Language": language},
+            pk=todo.pk,
+        )
+
+    call(
+        TaggedViewSet,
+        "patch",
+        "/",
+        "partial_update",
+        {"title": "b"},
+        headers={"Accept-Language": "en"},
+        pk=todo.pk,
+    )
+
+    response = call(
+        TaggedViewSet,
+        "get",
+        "/",
+        "retrieve",
+        headers={"Accept-Language": "fr"},
+        pk=todo.pk,
+    )
+    assert response.data["title"] == "b"
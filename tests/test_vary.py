@@ -0,0 +1,53 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.viewsets import ModelViewSet
+from testapp.models import Todo
+from testapp.views import TodoSerializer, TodoViewSet
+
+
+class LanguageViewSet(TodoViewSet):
+    cache_vary_on = ("Accept-Language",)
+
+
+class PlainViewSet(ModelViewSet):
+    queryset = Todo.objects.all()
+    serializer_class = TodoSerializer
+
+
+def test_vary_header_unchanged_without_cache_vary_on(call):
+    todo = Todo.objects.create(title="a")
+    expected = call(PlainViewSet, "get", "/", "retrieve", pk=todo.pk)["Vary"]
+    for _ in range(2):
+        response = call(TodoViewSet, "get", "/", "retrieve", pk=todo.pk)
+        assert response["Vary"] == expected
+
+
+def test_vary_header_lists_varied_headers(call):
+    todo = Todo.objects.create(title="a")
+    response = call(LanguageViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert "Accept-Language" in response["Vary"]
+
+
+class JSONViewSet(TodoViewSet):
+    renderer_classes = [JSONRenderer]
+
+
+def test_no_empty_vary_header(call):
+    todo = Todo.objects.create(title="a")
+    for _ in range(2):
+        response = call(JSONViewSet, "get", "/", "retrieve", pk=todo.pk)
+        assert not response.has_header("Vary")
+
+
+def test_variants_are_cached_separately():
+    view = LanguageViewSet()
+    view.basename = "todo"
+    keys = set()
+    for language in ("en", "fr"):
+        from rest_framework.request import Request
+        from rest_framework.test import APIRequestFactory
+
+        view.request = Request(
+            APIRequestFactory().get("/", HTTP_ACCEPT_LANGUAGE=language)
+        )
+        keys.add(view.get_cache_key("retrieve", pk=1))
+    assert len(keys) == 2
@@ -0,0 +1,35 @@
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from testapp.models import Todo
+from testapp.views import TodoViewSet
+
+
+class WriteThroughViewSet(TodoViewSet):
+    cache_write_through = True
+
+
+def update(call, pk, title):
+    return call(
+        WriteThroughViewSet, "patch", "/", "partial_update", {"title": title}, pk=pk
+    )
+
+
+def test_update_stores_the_new_detail(call):
+    todo = Todo.objects.create(title="a")
+    call(WriteThroughViewSet, "get", "/", "retrieve", pk=todo.pk)
+    update(call, todo.pk, "b")
+
+    with CaptureQueriesContext(connection) as queries:
+        response = call(WriteThroughViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert response.data["title"] == "b"
+    assert len(queries) == 0
+
+
+def test_rolled_back_update_stores_nothing(call):
+    todo = Todo.objects.create(title="a")
+    with transaction.atomic():
+        update(call, todo.pk, "b")
+        transaction.set_rollback(True)
+
+    response = call(WriteThroughViewSet, "get", "/", "retrieve", pk=todo.pk)
+    assert response.data["title"] == "a"
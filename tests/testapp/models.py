@@ -0,0 +1,37 @@
+from django.conf import settings
+from django.db import models
+
+
+class Todo(models.Model):
+    title = models.CharField(max_length=100)
+    owner = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, on_delete=models.CASCADE
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = "testapp"
+        ordering = ["id"]
+
+
+class Comment(models.Model):
+    todo = models.ForeignKey(Todo, null=True, on_delete=models.CASCADE)
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, on_delete=models.CASCADE
+    )
+    text = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "testapp"
+
+
+class Note(models.Model):
+    """Unrelated to Todo, but shares its foreign key to User."""
+
+    author = models.ForeignKey(
+        settings.AUTH_USER_MODEL, null=True, on_delete=models.CASCADE
+    )
+    text = models.CharField(max_length=100)
+
+    class Meta:
+        app_label = "testapp"
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from rest_framework.viewsets import ModelViewSet
+
+from djresttoolkit.cache.mixins import CacheInvalidateMixin
+
+from .models import Todo
+
+
+class TodoSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Todo
+        fields = ["id", "title"]
+
+
+class TodoViewSet(CacheInvalidateMixin, ModelViewSet):
+    queryset = Todo.objects.all()
+    serializer_class = TodoSerializer